@@ -0,0 +1,179 @@
+"""
+API routes for multiplexed progress streaming.
+"""
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from typing import Dict, Any, List
+from uuid import UUID
+import asyncio
+import json
+import os
+
+try:
+    from backend.services.progress_broadcaster import ProgressBroadcaster, ProgressSubscription
+    from backend.services.redis_client import RENDER_JOB_CHANNEL_PREFIX, SEGMENT_CHANNEL_PREFIX
+except ModuleNotFoundError:
+    from services.progress_broadcaster import ProgressBroadcaster, ProgressSubscription
+    from services.redis_client import RENDER_JOB_CHANNEL_PREFIX, SEGMENT_CHANNEL_PREFIX
+from .render import progress_broadcaster, async_redis_client
+
+router = APIRouter(prefix="/api/progress", tags=["progress"])
+
+# Minimum seconds between frames on one connection; updates in between are coalesced
+FRAME_INTERVAL = float(os.getenv("PROGRESS_FRAME_INTERVAL", "0.25"))
+
+# Maximum render jobs plus segments one connection may watch
+MAX_SUBSCRIPTIONS = int(os.getenv("PROGRESS_MAX_SUBSCRIPTIONS", "1000"))
+
+
+def _parse_ids(values: Any) -> List[UUID]:
+    """Parse a list of UUID strings, raising ValueError on bad input."""
+    if not isinstance(values, list):
+        raise ValueError("expected a list of ids")
+    return [UUID(str(value)) for value in values]
+
+
+async def _subscribe(
+    subscription: ProgressSubscription,
+    render_job_ids: List[UUID],
+    segment_ids: List[UUID]
+):
+    """Watch render jobs and segments and queue their current state."""
+    new_jobs = [
+        job_id for job_id in render_job_ids
+        if ProgressBroadcaster.render_job_channel(job_id) not in subscription.channels
+    ]
+    new_segments = [
+        segment_id for segment_id in segment_ids
+        if ProgressBroadcaster.segment_channel(segment_id) not in subscription.channels
+    ]
+    if len(subscription.channels) + len(new_jobs) + len(new_segments) > MAX_SUBSCRIPTIONS:
+        raise ValueError(f"at most {MAX_SUBSCRIPTIONS} subscriptions per connection")
+
+    for job_id in new_jobs:
+        subscription.add(ProgressBroadcaster.render_job_channel(job_id))
+    for segment_id in new_segments:
+        subscription.add(ProgressBroadcaster.segment_channel(segment_id))
+
+    # Initial state, read in one round-trip per kind
+    if new_jobs:
+        progress = await async_redis_client.get_many_render_job_progress(new_jobs)
+        for job_id, data in progress.items():
+            if data is not None:
+                subscription.deliver(
+                    ProgressBroadcaster.render_job_channel(job_id),
+                    {"render_job_id": job_id, **data}
+                )
+    if new_segments:
+        statuses = await async_redis_client.get_many_segment_statuses(new_segments)
+        for segment_id, status in statuses.items():
+            if status is not None:
+                subscription.deliver(
+                    ProgressBroadcaster.segment_channel(segment_id),
+                    {"segment_id": segment_id, "status": status}
+                )
+
+
+def _unsubscribe(
+    subscription: ProgressSubscription,
+    render_job_ids: List[UUID],
+    segment_ids: List[UUID]
+):
+    """Stop watching render jobs and segments."""
+    for job_id in render_job_ids:
+        subscription.remove(ProgressBroadcaster.render_job_channel(job_id))
+    for segment_id in segment_ids:
+        subscription.remove(ProgressBroadcaster.segment_channel(segment_id))
+
+
+def _build_frame(updates: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """Group channel updates into one frame keyed by render job and segment ID."""
+    frame = {"type": "update", "render_jobs": {}, "segments": {}}
+    for channel, payload in updates.items():
+        if channel.startswith(RENDER_JOB_CHANNEL_PREFIX):
+            frame["render_jobs"][channel[len(RENDER_JOB_CHANNEL_PREFIX):]] = payload
+        elif channel.startswith(SEGMENT_CHANNEL_PREFIX):
+            frame["segments"][channel[len(SEGMENT_CHANNEL_PREFIX):]] = payload
+    return frame
+
+
+async def _send_frames(
+    websocket: WebSocket,
+    subscription: ProgressSubscription,
+    send_lock: asyncio.Lock
+):
+    """Send coalesced update frames at most once per FRAME_INTERVAL."""
+    while True:
+        updates = await subscription.get()
+        if updates:
+            async with send_lock:
+                await websocket.send_json(_build_frame(updates))
+        await asyncio.sleep(FRAME_INTERVAL)
+
+
+async def _receive_messages(
+    websocket: WebSocket,
+    subscription: ProgressSubscription,
+    send_lock: asyncio.Lock
+):
+    """Apply subscribe/unsubscribe messages until the client disconnects."""
+    while True:
+        raw = await websocket.receive_text()
+        try:
+            message = json.loads(raw)
+            action = message.get("action")
+            render_job_ids = _parse_ids(message.get("render_jobs", []))
+            segment_ids = _parse_ids(message.get("segments", []))
+
+            if action == "subscribe":
+                await _subscribe(subscription, render_job_ids, segment_ids)
+            elif action == "unsubscribe":
+                _unsubscribe(subscription, render_job_ids, segment_ids)
+            else:
+                raise ValueError(f"unknown action: {action}")
+        except (ValueError, AttributeError) as e:
+            # json.JSONDecodeError is a ValueError
+            async with send_lock:
+                await websocket.send_json({"type": "error", "detail": str(e)})
+
+
+@router.websocket("/ws")
+async def progress_websocket(websocket: WebSocket):
+    """
+    WebSocket streaming progress for any number of render jobs and segments.
+
+    Client messages:
+        {"action": "subscribe", "render_jobs": [...], "segments": [...]}
+        {"action": "unsubscribe", "render_jobs": [...], "segments": [...]}
+
+    Server frames carry the latest state of everything that changed since
+    the previous frame:
+        {"type": "update", "render_jobs": {id: progress}, "segments": {id: status}}
+        {"type": "error", "detail": "..."}
+    """
+    await websocket.accept()
+
+    subscription = progress_broadcaster.subscribe()
+    send_lock = asyncio.Lock()
+    sender = asyncio.create_task(_send_frames(websocket, subscription, send_lock))
+    receiver = asyncio.create_task(_receive_messages(websocket, subscription, send_lock))
+
+    try:
+        # Neither task ends on its own, so whichever fails first (a send
+        # error or the client going away) ends the connection
+        done, _ = await asyncio.wait({sender, receiver}, return_when=asyncio.FIRST_EXCEPTION)
+        for task in done:
+            task.result()
+
+    except WebSocketDisconnect:
+        pass
+    except Exception as e:
+        try:
+            await websocket.close(code=1011, reason=str(e))
+        except Exception:
+            # The socket may already be broken (e.g. the failed send)
+            pass
+    finally:
+        for task in (sender, receiver):
+            task.cancel()
+        await asyncio.gather(sender, receiver, return_exceptions=True)
+        subscription.close()
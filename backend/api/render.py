@@ -1,41 +1,57 @@
 """
 API routes for Render Job management.
 """
-from fastapi import APIRouter, Depends, HTTPException, status, WebSocket, WebSocketDisconnect
+from fastapi import APIRouter, Depends, HTTPException, status, WebSocket, WebSocketDisconnect, Request, Header
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Dict, Any, Optional
 from uuid import UUID
-import asyncio
 import json
 
-from config import get_db
+from config import get_db, get_db_context
 try:
     from backend.models import RenderJob
-    from backend.services import RabbitMQClient, RedisClient, RenderOrchestrator
+    from backend.services import RabbitMQClient, RedisClient, RenderCache, RenderOrchestrator
+    from backend.services.async_rabbitmq_client import AsyncRabbitMQClient
+    from backend.services.async_redis_client import AsyncRedisClient
+    from backend.services.progress_broadcaster import ProgressBroadcaster
+    from backend.services.redis_client import RenderJobEvent
 except ModuleNotFoundError:
     from models import RenderJob
-    from services import RabbitMQClient, RedisClient, RenderOrchestrator
+    from services import RabbitMQClient, RedisClient, RenderCache, RenderOrchestrator
+    from services.async_rabbitmq_client import AsyncRabbitMQClient
+    from services.async_redis_client import AsyncRedisClient
+    from services.progress_broadcaster import ProgressBroadcaster
+    from services.redis_client import RenderJobEvent
 from schemas import RenderJobCreate, RenderJobResponse
 
 router = APIRouter(prefix="/api", tags=["render"])
 
 # Initialize services
+# Request handlers publish through the asyncio client (connected on startup);
+# the blocking client is only a fallback for synchronous orchestrator paths.
 rabbitmq_client = RabbitMQClient()
+async_rabbitmq_client = AsyncRabbitMQClient()
 redis_client = RedisClient()
-orchestrator = RenderOrchestrator(rabbitmq_client, redis_client)
+# Event-loop code (WebSockets) reads progress through the asyncio client
+async_redis_client = AsyncRedisClient()
+progress_broadcaster = ProgressBroadcaster()
+render_cache = RenderCache(redis_client)
+orchestrator = RenderOrchestrator(
+    rabbitmq_client,
+    redis_client,
+    render_cache,
+    async_rabbitmq_client=async_rabbitmq_client
+)
 
 
 @router.post("/projects/{project_id}/render", response_model=RenderJobResponse, status_code=status.HTTP_201_CREATED)
-def start_render(
-    project_id: UUID,
-    db: Session = Depends(get_db)
-):
+async def start_render(project_id: UUID):
     """
     Start a new render job for a project.
     """
     try:
-        render_job = orchestrator.create_render_job(db, project_id)
-        return render_job
+        return await orchestrator.create_render_job_async(get_db_context, project_id)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -89,6 +105,27 @@ def list_render_jobs(
     return render_jobs
 
 
+@router.get("/render-cache/stats", response_model=Dict[str, Any])
+def get_render_cache_stats(db: Session = Depends(get_db)):
+    """
+    Get segment render cache hit/miss metrics.
+    """
+    return render_cache.get_stats(db)
+
+
+@router.get("/messaging/stats", response_model=Dict[str, Any])
+def get_messaging_stats():
+    """
+    Get task publish latency and throughput for this API process.
+    """
+    return async_rabbitmq_client.get_publish_stats()
+
+
+# Re-read the snapshot if no event arrives for this long, in case one was
+# missed while the broadcaster was reconnecting
+PROGRESS_RESYNC_INTERVAL = 30.0
+
+
 @router.websocket("/render-jobs/{render_job_id}/progress")
 async def render_job_progress_websocket(
     websocket: WebSocket,
@@ -96,15 +133,21 @@ async def render_job_progress_websocket(
 ):
     """
     WebSocket endpoint for real-time render job progress updates.
+
+    Updates are pushed as they are written to Redis; the connection closes
+    once the render job completes or fails.
     """
     await websocket.accept()
 
+    subscription = progress_broadcaster.subscribe()
+    subscription.add(ProgressBroadcaster.render_job_channel(render_job_id))
+
     try:
-        while True:
-            # Get progress from Redis
-            progress = redis_client.get_render_job_progress(render_job_id)
+        progress = await async_redis_client.get_render_job_progress(render_job_id)
+        last_sent = None
 
-            if progress:
+        while True:
+            if progress and progress != last_sent:
                 await websocket.send_json({
                     "render_job_id": str(render_job_id),
                     "status": progress["status"],
@@ -112,15 +155,86 @@ async def render_job_progress_websocket(
                     "segments_completed": progress["segments_completed"],
                     "progress_percentage": progress["progress_percentage"]
                 })
+                last_sent = progress
 
                 # If completed or failed, close the connection
                 if progress["status"] in ["completed", "failed"]:
                     break
 
-            # Wait before next update
-            await asyncio.sleep(1)
+            # Wait for the next pushed update
+            updates = await subscription.get(timeout=PROGRESS_RESYNC_INTERVAL)
+            if updates:
+                progress = next(iter(updates.values()))
+            else:
+                progress = await async_redis_client.get_render_job_progress(render_job_id)
 
     except WebSocketDisconnect:
         pass
     except Exception as e:
         await websocket.close(code=1011, reason=str(e))
+    finally:
+        subscription.close()
+
+
+# Seconds an event stream waits for new events before sending a keep-alive
+EVENT_STREAM_KEEPALIVE = 15.0
+
+# Milliseconds a disconnected EventSource waits before reconnecting
+EVENT_STREAM_RETRY_MS = 3000
+
+
+def _format_sse(event: Dict[str, Any]) -> str:
+    """Format a render job event as a server-sent event."""
+    data = {name: value for name, value in event.items() if name != "id"}
+    return f"id: {event['id']}\nevent: {event['event']}\ndata: {json.dumps(data)}\n\n"
+
+
+@router.get("/render-jobs/{render_job_id}/events")
+async def stream_render_job_events(
+    render_job_id: UUID,
+    request: Request,
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID")
+):
+    """
+    Server-sent event stream of a render job's event log.
+
+    Replays the log from the start, or from after Last-Event-ID when a client
+    reconnects, then follows new events. The stream ends after the render job
+    is done or fails.
+    """
+    if await async_redis_client.get_render_job_progress(render_job_id) is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No events for render job {render_job_id}"
+        )
+
+    async def event_stream():
+        cursor = last_event_id or "0"
+        yield f"retry: {EVENT_STREAM_RETRY_MS}\n\n"
+
+        while not await request.is_disconnected():
+            events = await async_redis_client.read_render_job_events(
+                render_job_id,
+                last_event_id=cursor,
+                count=100,
+                block_ms=int(EVENT_STREAM_KEEPALIVE * 1000)
+            )
+            if not events:
+                yield ": keep-alive\n\n"
+                continue
+
+            for event in events:
+                cursor = event["id"]
+                yield _format_sse(event)
+
+                # Job-level terminal events carry no segment ID
+                if event["event"] == RenderJobEvent.DONE.value or (
+                    event["event"] == RenderJobEvent.FAILED.value and "segment_id" not in event
+                ):
+                    return
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
@@ -10,9 +10,11 @@ from config import get_db
 try:
     from backend.models import Segment, Project
     from backend.models.segment import SegmentStatus
+    from backend.services.fingerprint import segment_fingerprint
 except ModuleNotFoundError:
     from models import Segment, Project
     from models.segment import SegmentStatus
+    from services.fingerprint import segment_fingerprint
 from schemas import SegmentCreate, SegmentUpdate, SegmentResponse
 
 router = APIRouter(prefix="/api", tags=["segments"])
@@ -94,6 +96,9 @@ def update_segment(
 ):
     """
     Update a segment.
+
+    The rendered asset is kept; the segment only goes back to pending if its
+    prompt or model parameters no longer match what the asset was rendered from.
     """
     segment = db.query(Segment).filter(Segment.id == segment_id).first()
 
@@ -108,14 +113,16 @@ def update_segment(
         segment.order_index = segment_data.order_index
     if segment_data.prompt is not None:
         segment.prompt = segment_data.prompt
-        # Reset status when prompt changes
-        segment.status = SegmentStatus.PENDING
-        segment.s3_asset_url = None
     if segment_data.model_params is not None:
         segment.model_params = segment_data.model_params
-        # Reset status when params change
-        segment.status = SegmentStatus.PENDING
-        segment.s3_asset_url = None
+
+    if segment_data.prompt is not None or segment_data.model_params is not None:
+        fingerprint = segment_fingerprint(segment.prompt, segment.model_params)
+        if segment.s3_asset_url and segment.rendered_fingerprint == fingerprint:
+            # Unchanged, or an edit was reverted: the asset is current again
+            segment.status = SegmentStatus.COMPLETED
+        elif segment.status != SegmentStatus.GENERATING:
+            segment.status = SegmentStatus.PENDING
 
     db.commit()
     db.refresh(segment)
@@ -13,7 +13,7 @@ from fastapi.responses import JSONResponse
 import logging
 
 from config import init_db, get_settings
-from api import projects, segments, render, health, workflows
+from api import projects, segments, render, progress, health, workflows
 
 # Configure logging
 logging.basicConfig(
@@ -50,6 +50,20 @@ async def startup_event():
     init_db()
     logger.info("Database initialized successfully")
 
+    try:
+        await render.async_rabbitmq_client.connect()
+    except Exception as e:
+        # Connection is retried on first publish
+        logger.warning(f"Could not connect to RabbitMQ on startup: {e}")
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Close message queue and progress connections on shutdown."""
+    await render.async_rabbitmq_client.close()
+    await render.progress_broadcaster.close()
+    await render.async_redis_client.close()
+
 
 @app.get("/")
 async def root():
@@ -71,6 +85,7 @@ async def health_check():
 app.include_router(projects.router)
 app.include_router(segments.router)
 app.include_router(render.router)
+app.include_router(progress.router)
 app.include_router(health.router)
 app.include_router(workflows.router)
 
@@ -0,0 +1,20 @@
+-- Migration: Add content-addressed segment render cache
+-- Date: 2026-10-16
+-- Description: Indexes rendered segment videos by render fingerprint so identical
+-- segments in any project reuse the stored asset instead of regenerating it
+
+CREATE TABLE IF NOT EXISTS render_cache_entries (
+    fingerprint VARCHAR(64) PRIMARY KEY,
+    storage_url VARCHAR(512) NOT NULL,
+    model VARCHAR(100) NOT NULL,
+    hit_count INTEGER NOT NULL DEFAULT 0,
+    last_hit_at TIMESTAMP,
+    created_at TIMESTAMP NOT NULL DEFAULT NOW(),
+    updated_at TIMESTAMP NOT NULL DEFAULT NOW()
+);
+
+-- Add index for per-model cache queries
+CREATE INDEX IF NOT EXISTS idx_render_cache_entries_model ON render_cache_entries(model);
+
+-- Comment the table
+COMMENT ON TABLE render_cache_entries IS 'Maps segment render fingerprints to content-addressed stored videos';
@@ -0,0 +1,10 @@
+-- Migration: Add rendered_fingerprint field to segments table
+-- Date: 2026-10-16
+-- Description: Stores the fingerprint of the inputs a segment's asset was rendered from,
+-- so re-renders only dispatch segments whose prompt or model parameters changed
+
+-- Add rendered_fingerprint column
+ALTER TABLE segments ADD COLUMN IF NOT EXISTS rendered_fingerprint VARCHAR(64);
+
+-- Comment the column
+COMMENT ON COLUMN segments.rendered_fingerprint IS 'Render fingerprint of the inputs s3_asset_url was produced from';
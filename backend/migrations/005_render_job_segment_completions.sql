@@ -0,0 +1,14 @@
+-- Migration: Track segment completions per render job
+-- Date: 2026-10-16
+-- Description: Records which segments each render job has counted, so a redelivered
+-- completion is ignored while a segment re-dispatched by a newer render job still counts
+
+CREATE TABLE IF NOT EXISTS render_job_segment_completions (
+    render_job_id UUID NOT NULL REFERENCES render_jobs(id) ON DELETE CASCADE,
+    segment_id UUID NOT NULL REFERENCES segments(id) ON DELETE CASCADE,
+    completed_at TIMESTAMP NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (render_job_id, segment_id)
+);
+
+-- Comment the table
+COMMENT ON TABLE render_job_segment_completions IS 'Segment completions counted towards each render job';
@@ -7,5 +7,7 @@ from .segment import Segment
 from .render_job import RenderJob
 from .user import User
 from .workflow import Workflow
+from .render_cache import RenderCacheEntry
+from .render_job_completion import RenderJobSegmentCompletion
 
-__all__ = ["Base", "Project", "Segment", "RenderJob", "User", "Workflow"]
+__all__ = ["Base", "Project", "Segment", "RenderJob", "User", "Workflow", "RenderCacheEntry", "RenderJobSegmentCompletion"]
@@ -0,0 +1,30 @@
+"""
+RenderCacheEntry model indexing rendered segment videos by fingerprint.
+"""
+from sqlalchemy import Column, String, Integer, DateTime
+
+from .base import Base, TimestampMixin
+
+
+class RenderCacheEntry(Base, TimestampMixin):
+    """
+    RenderCacheEntry maps a segment render fingerprint to the stored video.
+    Entries are shared across projects and render jobs, so any segment with a
+    matching fingerprint can link the existing asset instead of regenerating it.
+    """
+
+    __tablename__ = "render_cache_entries"
+
+    # SHA-256 hex digest from services.fingerprint.segment_fingerprint
+    fingerprint = Column(String(64), primary_key=True)
+
+    # Content-addressed asset; never overwritten once written
+    storage_url = Column(String(512), nullable=False)
+    model = Column(String(100), nullable=False, index=True)
+
+    # Usage tracking
+    hit_count = Column(Integer, nullable=False, default=0)
+    last_hit_at = Column(DateTime, nullable=True)
+
+    def __repr__(self):
+        return f"<RenderCacheEntry(fingerprint={self.fingerprint[:12]}, model={self.model}, hits={self.hit_count})>"
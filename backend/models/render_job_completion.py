@@ -0,0 +1,27 @@
+"""
+RenderJobSegmentCompletion model recording which segments a render job has counted.
+"""
+from sqlalchemy import Column, ForeignKey, DateTime
+from sqlalchemy.dialects.postgresql import UUID
+from datetime import datetime
+
+from .base import Base
+
+
+class RenderJobSegmentCompletion(Base):
+    """
+    One segment completion counted towards one render job.
+
+    The composite primary key makes counting idempotent per render job: a
+    redelivered task for the same job finds its row already present, while a
+    segment dispatched again by a newer render job is counted for that job too.
+    """
+
+    __tablename__ = "render_job_segment_completions"
+
+    render_job_id = Column(UUID(as_uuid=True), ForeignKey("render_jobs.id", ondelete="CASCADE"), primary_key=True)
+    segment_id = Column(UUID(as_uuid=True), ForeignKey("segments.id", ondelete="CASCADE"), primary_key=True)
+    completed_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<RenderJobSegmentCompletion(render_job_id={self.render_job_id}, segment_id={self.segment_id})>"
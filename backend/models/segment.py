@@ -43,6 +43,9 @@ class Segment(Base, TimestampMixin):
     error_message = Column(Text, nullable=True)
     error_code = Column(String(100), nullable=True)  # Machine-readable error code for frontend
 
+    # Fingerprint of the inputs s3_asset_url was rendered from (see services.fingerprint)
+    rendered_fingerprint = Column(String(64), nullable=True)
+
     # External AI model tracking
     external_job_id = Column(String(255), nullable=True)  # Track job ID from external AI service
 
@@ -34,6 +34,7 @@ class SegmentResponse(SegmentBase):
     s3_asset_url: Optional[str] = None
     error_message: Optional[str] = None
     error_code: Optional[str] = None
+    rendered_fingerprint: Optional[str] = None
     external_job_id: Optional[str] = None
     created_at: datetime
     updated_at: datetime
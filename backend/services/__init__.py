@@ -5,6 +5,7 @@ from .redis_client import RedisClient
 from .s3_client import S3Client
 from .local_storage_client import LocalStorageClient
 from .rabbitmq_client import RabbitMQClient
+from .render_cache import RenderCache
 from .orchestrator import RenderOrchestrator
 
-__all__ = ["RedisClient", "S3Client", "LocalStorageClient", "RabbitMQClient", "RenderOrchestrator"]
+__all__ = ["RedisClient", "S3Client", "LocalStorageClient", "RabbitMQClient", "RenderCache", "RenderOrchestrator"]
@@ -0,0 +1,353 @@
+"""
+Asyncio Redis client for real-time state management.
+"""
+import redis.asyncio as aioredis
+import json
+import os
+from typing import Optional, Dict, Any, Iterable, List
+from uuid import UUID
+
+try:
+    from backend.services.redis_client import (
+        RedisClient,
+        RenderJobEvent,
+        INCREMENT_PROGRESS_SCRIPT,
+        RENDER_JOB_CHANNEL_PREFIX,
+        SEGMENT_CHANNEL_PREFIX,
+        RENDER_JOB_EVENTS_PREFIX,
+        RENDER_JOB_EVENTS_MAXLEN,
+    )
+except ModuleNotFoundError:
+    from services.redis_client import (
+        RedisClient,
+        RenderJobEvent,
+        INCREMENT_PROGRESS_SCRIPT,
+        RENDER_JOB_CHANNEL_PREFIX,
+        SEGMENT_CHANNEL_PREFIX,
+        RENDER_JOB_EVENTS_PREFIX,
+        RENDER_JOB_EVENTS_MAXLEN,
+    )
+
+
+class AsyncRedisClient:
+    """
+    Asyncio variant of RedisClient for event-loop code paths.
+
+    Same keys, channels and method names as RedisClient, with every method a
+    coroutine. Bulk reads and writes are pipelined into one round-trip. An
+    instance must only be used from one event loop.
+    """
+
+    def __init__(self, redis_url: Optional[str] = None):
+        """
+        Initialize async Redis client.
+
+        Args:
+            redis_url: Redis connection URL (default from environment)
+        """
+        self.redis_url = redis_url or os.getenv("REDIS_URL", "redis://localhost:6379/0")
+        self.client = aioredis.from_url(self.redis_url, decode_responses=True)
+        self._increment_progress = self.client.register_script(INCREMENT_PROGRESS_SCRIPT)
+
+    async def close(self):
+        """Close the connection pool."""
+        await self.client.aclose()
+
+    async def set_render_job_progress(
+        self,
+        render_job_id: UUID,
+        segments_total: int,
+        segments_completed: int,
+        status: str
+    ):
+        """
+        Update render job progress in Redis.
+
+        Args:
+            render_job_id: UUID of the render job
+            segments_total: Total number of segments
+            segments_completed: Number of completed segments
+            status: Current status
+        """
+        key = f"render_job:{render_job_id}"
+        progress = {
+            "segments_total": segments_total,
+            "segments_completed": segments_completed,
+            "status": status,
+            "progress_percentage": (segments_completed / segments_total * 100) if segments_total > 0 else 0
+        }
+
+        async with self.client.pipeline(transaction=False) as pipe:
+            pipe.hset(key, mapping=progress)
+            # Set expiration to 24 hours
+            pipe.expire(key, 86400)
+            pipe.publish(
+                f"{RENDER_JOB_CHANNEL_PREFIX}{render_job_id}",
+                json.dumps({"render_job_id": str(render_job_id), **progress})
+            )
+            await pipe.execute()
+
+    async def get_render_job_progress(self, render_job_id: UUID) -> Optional[Dict[str, Any]]:
+        """
+        Get render job progress from Redis.
+
+        Args:
+            render_job_id: UUID of the render job
+
+        Returns:
+            Dictionary with progress data or None if not found
+        """
+        key = f"render_job:{render_job_id}"
+        return RedisClient._parse_progress(await self.client.hgetall(key))
+
+    async def get_many_render_job_progress(
+        self,
+        render_job_ids: Iterable[UUID]
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Get progress of many render jobs in one pipelined round-trip.
+
+        Args:
+            render_job_ids: UUIDs of the render jobs
+
+        Returns:
+            Dictionary of render job ID string to progress data (None if not found)
+        """
+        ids: List[str] = [str(render_job_id) for render_job_id in render_job_ids]
+        if not ids:
+            return {}
+
+        async with self.client.pipeline(transaction=False) as pipe:
+            for render_job_id in ids:
+                pipe.hgetall(f"render_job:{render_job_id}")
+            results = await pipe.execute()
+
+        return {
+            render_job_id: RedisClient._parse_progress(data)
+            for render_job_id, data in zip(ids, results)
+        }
+
+    async def increment_render_job_progress(self, render_job_id: UUID) -> bool:
+        """
+        Atomically increment the completed segments counter for a render job.
+
+        Args:
+            render_job_id: UUID of the render job
+
+        Returns:
+            True if this increment brought segments_completed up to segments_total
+        """
+        key = f"render_job:{render_job_id}"
+        return bool(await self._increment_progress(
+            keys=[key],
+            args=[86400, f"{RENDER_JOB_CHANNEL_PREFIX}{render_job_id}", str(render_job_id)]
+        ))
+
+    async def set_segment_status(
+        self,
+        segment_id: UUID,
+        status: str,
+        render_job_id: Optional[UUID] = None
+    ):
+        """
+        Update segment status in Redis.
+
+        Args:
+            segment_id: UUID of the segment
+            status: Current status
+            render_job_id: Optional render job ID for tracking
+        """
+        await self.set_many_segment_statuses([segment_id], status, render_job_id)
+
+    async def set_many_segment_statuses(
+        self,
+        segment_ids: Iterable[UUID],
+        status: str,
+        render_job_id: Optional[UUID] = None
+    ):
+        """
+        Update the status of many segments in one pipelined round-trip.
+
+        Args:
+            segment_ids: UUIDs of the segments
+            status: Current status
+            render_job_id: Optional render job ID for tracking
+        """
+        data = {"status": status}
+        if render_job_id:
+            data["render_job_id"] = str(render_job_id)
+
+        async with self.client.pipeline(transaction=False) as pipe:
+            for segment_id in segment_ids:
+                key = f"segment:{segment_id}"
+                pipe.hset(key, mapping=data)
+                # Set expiration to 24 hours
+                pipe.expire(key, 86400)
+                pipe.publish(
+                    f"{SEGMENT_CHANNEL_PREFIX}{segment_id}",
+                    json.dumps({"segment_id": str(segment_id), **data})
+                )
+            await pipe.execute()
+
+    async def get_segment_status(self, segment_id: UUID) -> Optional[str]:
+        """
+        Get segment status from Redis.
+
+        Args:
+            segment_id: UUID of the segment
+
+        Returns:
+            Status string or None if not found
+        """
+        key = f"segment:{segment_id}"
+        return await self.client.hget(key, "status")
+
+    async def get_many_segment_statuses(self, segment_ids: Iterable[UUID]) -> Dict[str, Optional[str]]:
+        """
+        Get the status of many segments in one pipelined round-trip.
+
+        Args:
+            segment_ids: UUIDs of the segments
+
+        Returns:
+            Dictionary of segment ID string to status (None if not found)
+        """
+        ids = [str(segment_id) for segment_id in segment_ids]
+        if not ids:
+            return {}
+
+        async with self.client.pipeline(transaction=False) as pipe:
+            for segment_id in ids:
+                pipe.hget(f"segment:{segment_id}", "status")
+            results = await pipe.execute()
+
+        return dict(zip(ids, results))
+
+    async def delete_render_job_progress(self, render_job_id: UUID):
+        """
+        Delete render job progress from Redis.
+
+        Args:
+            render_job_id: UUID of the render job
+        """
+        key = f"render_job:{render_job_id}"
+        await self.client.delete(key)
+
+    async def append_render_job_event(
+        self,
+        render_job_id: UUID,
+        event: RenderJobEvent,
+        segment_id: Optional[UUID] = None,
+        **data: Any
+    ) -> str:
+        """
+        Append an event to a render job's event log.
+
+        Args:
+            render_job_id: UUID of the render job
+            event: Event type
+            segment_id: Segment the event concerns (None for job-level events)
+            **data: Extra event fields (None values are dropped)
+
+        Returns:
+            Stream entry ID of the event
+        """
+        return (await self.append_segment_events(render_job_id, event, [segment_id], **data))[0]
+
+    async def append_segment_events(
+        self,
+        render_job_id: UUID,
+        event: RenderJobEvent,
+        segment_ids: Iterable[Optional[UUID]],
+        **data: Any
+    ) -> List[str]:
+        """
+        Append the same event for many segments in one pipelined round-trip.
+
+        Args:
+            render_job_id: UUID of the render job
+            event: Event type
+            segment_ids: Segments the events concern
+            **data: Extra event fields (None values are dropped)
+
+        Returns:
+            Stream entry IDs, in order
+        """
+        key = f"{RENDER_JOB_EVENTS_PREFIX}{render_job_id}"
+        async with self.client.pipeline(transaction=False) as pipe:
+            for segment_id in segment_ids:
+                pipe.xadd(
+                    key,
+                    RedisClient._event_fields(event, segment_id, data),
+                    maxlen=RENDER_JOB_EVENTS_MAXLEN,
+                    approximate=True
+                )
+            # Set expiration to 24 hours
+            pipe.expire(key, 86400)
+            results = await pipe.execute()
+        return results[:-1]
+
+    async def read_render_job_events(
+        self,
+        render_job_id: UUID,
+        last_event_id: str = "0",
+        count: Optional[int] = None,
+        block_ms: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Read the events of a render job after a given event.
+
+        Args:
+            render_job_id: UUID of the render job
+            last_event_id: Return events after this stream entry ID ("0" for all)
+            count: Maximum number of events to return
+            block_ms: Wait up to this many milliseconds for new events if there
+                are none yet (None returns immediately)
+
+        Returns:
+            Events in order, each with id, event and its fields (empty on timeout)
+        """
+        key = f"{RENDER_JOB_EVENTS_PREFIX}{render_job_id}"
+        response = await self.client.xread({key: last_event_id}, count=count, block=block_ms)
+        return RedisClient._parse_events(response)
+
+    async def record_render_cache_lookups(self, hits: int, misses: int):
+        """
+        Count render cache hits and misses.
+
+        Args:
+            hits: Number of fingerprints found in the cache
+            misses: Number of fingerprints not found
+        """
+        async with self.client.pipeline(transaction=False) as pipe:
+            pipe.hincrby("render_cache:stats", "hits", hits)
+            pipe.hincrby("render_cache:stats", "misses", misses)
+            await pipe.execute()
+
+    async def get_render_cache_stats(self) -> Dict[str, int]:
+        """
+        Get render cache hit and miss counters.
+
+        Returns:
+            Dictionary with hits and misses
+        """
+        data = await self.client.hgetall("render_cache:stats")
+        return {
+            "hits": int(data.get("hits", 0)),
+            "misses": int(data.get("misses", 0))
+        }
+
+    async def publish_segment_completed(self, segment_id: UUID, render_job_id: UUID):
+        """
+        Publish a segment completion event to a Redis pub/sub channel.
+
+        Args:
+            segment_id: UUID of the completed segment
+            render_job_id: UUID of the render job
+        """
+        message = json.dumps({
+            "segment_id": str(segment_id),
+            "render_job_id": str(render_job_id),
+            "event": "segment_completed"
+        })
+        await self.client.publish("segment_events", message)
@@ -0,0 +1,145 @@
+"""
+Canonical fingerprints for segment renders.
+
+Two segments with the same fingerprint produce the same video, so a render
+from one project can be reused by any other. The fingerprint covers the
+prompt, the normalized model parameters, the ComfyUI workflow (if any) and
+the version of the adapter that renders it.
+"""
+import hashlib
+import json
+from typing import Dict, Any, Optional
+
+# Bump when the fingerprint layout itself changes
+FINGERPRINT_VERSION = 1
+
+DEFAULT_MODEL = "mock-ai"
+
+# Model name aliases accepted by VideoModelFactory
+MODEL_ALIASES = {
+    "runway": "runway-gen3",
+    "stability": "stability-ai",
+    "mock": "mock-ai",
+    "comfy": "comfyui",
+}
+
+# Bump an adapter's version when a change to it alters the videos it renders,
+# so earlier cached renders are no longer reused.
+ADAPTER_VERSIONS = {
+    "runway-gen3": "1",
+    "stability-ai": "1",
+    "mock-ai": "1",
+    "comfyui": "1",
+}
+
+# Parameters that control how a segment is rendered, not what is rendered
+NON_RENDERING_PARAMS = {"cache"}
+
+
+def canonical_model_name(model_params: Optional[Dict[str, Any]]) -> str:
+    """
+    Resolve the model named in model_params to its canonical name.
+
+    Args:
+        model_params: Segment model parameters
+
+    Returns:
+        Canonical model name (e.g. "runway-gen3")
+    """
+    model = str((model_params or {}).get("model") or DEFAULT_MODEL).strip().lower()
+    return MODEL_ALIASES.get(model, model)
+
+
+def is_cacheable(model_params: Optional[Dict[str, Any]]) -> bool:
+    """
+    Whether a segment may be served from the render cache.
+
+    Segments opt out with ``"cache": false`` in their model parameters,
+    e.g. to force a fresh take of a prompt.
+
+    Args:
+        model_params: Segment model parameters
+
+    Returns:
+        False if the segment opted out of caching
+    """
+    return (model_params or {}).get("cache", True) is not False
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Collapse whitespace so formatting-only edits keep the same fingerprint."""
+    return " ".join((prompt or "").split())
+
+
+def normalize_value(value: Any) -> Any:
+    """
+    Normalize a parameter value for hashing.
+
+    Dict keys are stringified, integral floats become ints (5.0 == 5) and
+    strings are stripped.
+
+    Args:
+        value: JSON-compatible value
+
+    Returns:
+        Normalized value
+    """
+    if isinstance(value, dict):
+        return {str(k): normalize_value(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [normalize_value(v) for v in value]
+    if isinstance(value, bool) or value is None:
+        return value
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, str):
+        return value.strip()
+    return value
+
+
+def workflow_hash(workflow: Optional[Dict[str, Any]]) -> Optional[str]:
+    """
+    Hash a ComfyUI workflow.
+
+    Args:
+        workflow: Workflow JSON (or None for the adapter default)
+
+    Returns:
+        SHA-256 hex digest, or None if no workflow was given
+    """
+    if not workflow:
+        return None
+    canonical = json.dumps(normalize_value(workflow), sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def segment_fingerprint(prompt: str, model_params: Optional[Dict[str, Any]]) -> str:
+    """
+    Compute the render fingerprint of a segment.
+
+    Args:
+        prompt: Video generation prompt
+        model_params: Segment model parameters
+
+    Returns:
+        SHA-256 hex digest identifying the rendered video
+    """
+    model_params = model_params or {}
+    model = canonical_model_name(model_params)
+
+    params = {
+        key: value
+        for key, value in model_params.items()
+        if key not in NON_RENDERING_PARAMS and key not in ("model", "workflow")
+    }
+
+    payload = {
+        "v": FINGERPRINT_VERSION,
+        "model": model,
+        "adapter_version": ADAPTER_VERSIONS.get(model, "0"),
+        "prompt": normalize_prompt(prompt),
+        "params": normalize_value(params),
+        "workflow": workflow_hash(model_params.get("workflow")),
+    }
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
@@ -3,11 +3,20 @@ Local storage client for video storage operations (alternative to S3).
 """
 import os
 import shutil
+import tempfile
 from pathlib import Path
 from typing import Optional
 from uuid import UUID
 import mimetypes
 
+try:
+    import fcntl
+except ImportError:  # Not available on Windows
+    fcntl = None
+
+# ioctl that clones a file's extents into another file (Linux btrfs/XFS reflinks)
+FICLONE = 0x40049409
+
 
 class LocalStorageClient:
     """
@@ -82,6 +91,115 @@ class LocalStorageClient:
 
         return self.get_url(storage_key)
 
+    def upload_stream(
+        self,
+        stream,
+        storage_key: str,
+        content_type: Optional[str] = None
+    ) -> str:
+        """
+        Write a non-seekable stream (e.g. a pipe) to local storage as it arrives.
+
+        The file only appears under its final name once the stream ends.
+
+        Args:
+            stream: Readable binary stream
+            storage_key: Storage key (relative path)
+            content_type: MIME type
+
+        Returns:
+            Local file URL/path
+        """
+        dest_path = self.storage_path / storage_key
+        dest_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._temp_path(dest_path)
+
+        try:
+            with open(tmp_path, 'wb') as f:
+                shutil.copyfileobj(stream, f, length=1024 * 1024)
+            os.replace(tmp_path, dest_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        return self.get_url(storage_key)
+
+    def import_file(
+        self,
+        file_path: str,
+        storage_key: str,
+        move: bool = False
+    ) -> str:
+        """
+        Put an existing local file into storage without copying its data.
+
+        Tries, in order, a rename (only if move is set), a hardlink and a
+        reflink, all of which take constant time and no extra disk space,
+        and only copies the file when it is on another filesystem that
+        supports none of them. The file appears under its final name
+        atomically. The source is consumed only by a successful rename;
+        every fallback leaves it in place.
+
+        Args:
+            file_path: Local path to the source file
+            storage_key: Storage key (relative path in storage)
+            move: Whether the source file may be renamed into storage
+
+        Returns:
+            Local file URL/path of the stored file
+        """
+        dest_path = self.storage_path / storage_key
+        dest_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._temp_path(dest_path)
+
+        try:
+            if move:
+                try:
+                    os.replace(file_path, dest_path)
+                    return self.get_url(storage_key)
+                except OSError:
+                    pass
+
+            try:
+                # The link needs a free name; the reserved one is unique to this call
+                tmp_path.unlink()
+                os.link(file_path, tmp_path)
+            except OSError:
+                if not self._reflink(file_path, tmp_path):
+                    shutil.copy2(file_path, tmp_path)
+            os.replace(tmp_path, dest_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        return self.get_url(storage_key)
+
+    @staticmethod
+    def _temp_path(dest_path: Path) -> Path:
+        """
+        Reserve a unique temporary file next to dest_path.
+
+        Concurrent writers of one key (e.g. two segments with the same
+        fingerprint) each get their own file, and the last os.replace wins
+        with a complete one.
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=dest_path.parent, prefix=f".{dest_path.name}.", suffix=".part")
+        os.close(fd)
+        return Path(tmp_path)
+
+    @staticmethod
+    def _reflink(source_path, dest_path) -> bool:
+        """Clone a file copy-on-write; False if the filesystem can't."""
+        if fcntl is None:
+            return False
+        try:
+            with open(source_path, 'rb') as src, open(dest_path, 'wb') as dst:
+                fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+            return True
+        except OSError:
+            Path(dest_path).unlink(missing_ok=True)
+            return False
+
     def download_file(self, storage_key: str, download_path: str) -> None:
         """
         Copy a file from storage to a local path.
@@ -116,6 +234,18 @@ class LocalStorageClient:
         """
         return f"file://{self.storage_path / storage_key}"
 
+    def generate_cache_key(self, fingerprint: str) -> str:
+        """
+        Generate a content-addressed storage key for a cached segment render.
+
+        Args:
+            fingerprint: Render fingerprint of the segment
+
+        Returns:
+            Storage key path
+        """
+        return f"cache/segments/{fingerprint[:2]}/{fingerprint}.mp4"
+
     def generate_segment_key(self, project_id: UUID, segment_id: UUID) -> str:
         """
         Generate a storage key for a video segment.
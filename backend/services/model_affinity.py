@@ -0,0 +1,85 @@
+"""
+Model-affinity ordering of segment tasks.
+
+ComfyUI keeps the models of its last prompt loaded, and swapping checkpoints
+often takes longer than the generation itself. Dispatching a render job's
+segments grouped by the models they load means consecutive prompts reuse
+what is already resident, and the AI worker's ComfyUI pool can keep each
+group on the instance that holds its models.
+"""
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    from backend.services.fingerprint import canonical_model_name
+except ModuleNotFoundError:
+    from services.fingerprint import canonical_model_name
+
+# Loader node inputs that name a model file (same as the AI worker's workflow plans)
+MODEL_INPUTS = (
+    "ckpt_name",
+    "unet_name",
+    "vae_name",
+    "lora_name",
+    "clip_name",
+    "clip_name1",
+    "clip_name2",
+    "control_net_name",
+    "model_name",
+)
+
+
+def required_models(model_params: Optional[Dict[str, Any]]) -> Tuple[str, ...]:
+    """
+    List the models a segment's ComfyUI workflow loads.
+
+    Args:
+        model_params: Segment model parameters
+
+    Returns:
+        Sorted "input:file" strings (empty for segments without a workflow)
+    """
+    workflow = (model_params or {}).get("workflow")
+    if not isinstance(workflow, dict):
+        return ()
+
+    models = set()
+    for node in workflow.values():
+        inputs = node.get("inputs") if isinstance(node, dict) else None
+        if not isinstance(inputs, dict):
+            continue
+        for name in MODEL_INPUTS:
+            if isinstance(inputs.get(name), str):
+                models.add(f"{name}:{inputs[name]}")
+    return tuple(sorted(models))
+
+
+def model_set_key(model_params: Optional[Dict[str, Any]]) -> Tuple[str, Tuple[str, ...]]:
+    """
+    Key segments that can run back to back without a model swap.
+
+    Args:
+        model_params: Segment model parameters
+
+    Returns:
+        Tuple of the canonical model name and the workflow's models
+    """
+    return canonical_model_name(model_params), required_models(model_params)
+
+
+def group_by_model_set(tasks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Order segment tasks so those needing the same models are adjacent.
+
+    Groups keep the order in which their first task appears, and tasks keep
+    their timeline order within a group.
+
+    Args:
+        tasks: Task dicts with model_params
+
+    Returns:
+        The same tasks, grouped
+    """
+    groups: Dict[Tuple[str, Tuple[str, ...]], List[Dict[str, Any]]] = {}
+    for task in tasks:
+        groups.setdefault(model_set_key(task.get("model_params")), []).append(task)
+    return [task for group in groups.values() for task in group]
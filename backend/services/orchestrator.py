@@ -1,24 +1,36 @@
 """
 Orchestrator service for managing render jobs and dispatching tasks.
 """
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
-from typing import List
+from typing import Any, Callable, ContextManager, Dict, List, Optional, Tuple, TYPE_CHECKING
 from uuid import UUID
+import asyncio
 import logging
 
 # Handle imports for both backend container (/app) and worker containers (/app/backend)
 try:
-    from backend.models import Project, Segment, RenderJob
+    from backend.models import Project, Segment, RenderJob, RenderJobSegmentCompletion
     from backend.models.segment import SegmentStatus
     from backend.models.render_job import RenderJobStatus
     from backend.services.rabbitmq_client import RabbitMQClient
-    from backend.services.redis_client import RedisClient
+    from backend.services.redis_client import RedisClient, RenderJobEvent
+    from backend.services.render_cache import RenderCache
+    from backend.services.fingerprint import segment_fingerprint, is_cacheable, canonical_model_name
+    from backend.services.model_affinity import group_by_model_set, model_set_key
 except ModuleNotFoundError:
-    from models import Project, Segment, RenderJob
+    from models import Project, Segment, RenderJob, RenderJobSegmentCompletion
     from models.segment import SegmentStatus
     from models.render_job import RenderJobStatus
     from services.rabbitmq_client import RabbitMQClient
-    from services.redis_client import RedisClient
+    from services.redis_client import RedisClient, RenderJobEvent
+    from services.render_cache import RenderCache
+    from services.fingerprint import segment_fingerprint, is_cacheable, canonical_model_name
+    from services.model_affinity import group_by_model_set, model_set_key
+
+if TYPE_CHECKING:
+    from backend.services.async_rabbitmq_client import AsyncRabbitMQClient
 
 logger = logging.getLogger(__name__)
 
@@ -26,13 +38,16 @@ logger = logging.getLogger(__name__)
 class RenderOrchestrator:
     """
     Orchestrates the rendering of video projects.
-    Implements intelligent task dispatching to only regenerate modified segments.
+    Implements intelligent task dispatching to only regenerate modified segments,
+    and links renders from the shared render cache instead of regenerating them.
     """
 
     def __init__(
         self,
         rabbitmq_client: RabbitMQClient,
-        redis_client: RedisClient
+        redis_client: RedisClient,
+        render_cache: Optional[RenderCache] = None,
+        async_rabbitmq_client: Optional["AsyncRabbitMQClient"] = None
     ):
         """
         Initialize the orchestrator.
@@ -40,9 +55,13 @@ class RenderOrchestrator:
         Args:
             rabbitmq_client: RabbitMQ client for task publishing
             redis_client: Redis client for state management
+            render_cache: Render cache to consult before dispatch (default: backed by redis_client)
+            async_rabbitmq_client: Asyncio RabbitMQ client used by create_render_job_async
         """
         self.rabbitmq = rabbitmq_client
         self.redis = redis_client
+        self.render_cache = render_cache or RenderCache(redis_client)
+        self.async_rabbitmq = async_rabbitmq_client
 
     def create_render_job(
         self,
@@ -60,6 +79,121 @@ class RenderOrchestrator:
         Returns:
             Created RenderJob
 
+        Raises:
+            ValueError: If project not found or has no segments
+        """
+        render_job, tasks = self._prepare_render_job(db, project_id)
+
+        # Dispatch segment generation tasks
+        self._mark_segments_dispatched(db, tasks, render_job.id)
+        self.rabbitmq.publish_segment_tasks([
+            {**task, "render_job_id": render_job.id} for task in tasks
+        ])
+
+        # Nothing left to generate: compose straight away
+        if not tasks:
+            self._trigger_composition(db, render_job)
+
+        return render_job
+
+    async def create_render_job_async(
+        self,
+        session_scope: Callable[[], ContextManager[Session]],
+        project_id: UUID
+    ) -> Dict[str, Any]:
+        """
+        Create a new render job from an asyncio context (the FastAPI process).
+
+        Database and Redis work runs in one worker thread call with its own
+        session, and tasks are published through the asyncio RabbitMQ client,
+        so the event loop is never blocked, no session crosses threads and
+        concurrent requests don't share a blocking connection.
+
+        Args:
+            session_scope: Context manager factory yielding a database session
+                (e.g. get_db_context)
+            project_id: UUID of the project to render
+
+        Returns:
+            Column values of the created render job
+
+        Raises:
+            ValueError: If project not found or has no segments
+        """
+        if self.async_rabbitmq is None:
+            raise RuntimeError("create_render_job_async requires an async_rabbitmq_client")
+
+        render_job, tasks, compose = await asyncio.to_thread(
+            self._start_render_job, session_scope, project_id
+        )
+
+        # Dispatch segment generation tasks
+        await self.async_rabbitmq.publish_segment_tasks([
+            {**task, "render_job_id": render_job["id"]} for task in tasks
+        ])
+
+        # Nothing left to generate: compose straight away
+        if compose:
+            try:
+                await self.async_rabbitmq.publish_composition_task(
+                    render_job_id=render_job["id"],
+                    project_id=render_job["project_id"],
+                    segment_ids=[UUID(sid) for sid in render_job["segment_ids"]]
+                )
+            except Exception:
+                def release():
+                    with session_scope() as db:
+                        self._release_composition(db, render_job["id"])
+
+                await asyncio.to_thread(release)
+                raise
+            logger.info(f"Triggered composition for render job {render_job['id']}")
+
+        return render_job
+
+    def _start_render_job(
+        self,
+        session_scope: Callable[[], ContextManager[Session]],
+        project_id: UUID
+    ) -> Tuple[Dict[str, Any], List[Dict[str, Any]], bool]:
+        """
+        Prepare a render job and mark its segments dispatched (blocking).
+
+        Args:
+            session_scope: Context manager factory yielding a database session
+            project_id: UUID of the project to render
+
+        Returns:
+            Tuple of the render job's column values, the segment tasks to
+            publish, and whether this call claimed its composition
+        """
+        with session_scope() as db:
+            render_job, tasks = self._prepare_render_job(db, project_id)
+            self._mark_segments_dispatched(db, tasks, render_job.id)
+            compose = not tasks and self._claim_composition(db, render_job)
+            snapshot = {
+                column.name: getattr(render_job, column.name)
+                for column in RenderJob.__table__.columns
+            }
+        return snapshot, tasks, compose
+
+    def _prepare_render_job(
+        self,
+        db: Session,
+        project_id: UUID
+    ) -> Tuple[RenderJob, List[Dict[str, Any]]]:
+        """
+        Create the render job record and work out which segments to dispatch.
+
+        Args:
+            db: Database session
+            project_id: UUID of the project to render
+
+        Returns:
+            Tuple of the created RenderJob and task dicts (segment_id, prompt,
+            model_params, fingerprint) for the segments to generate, grouped
+            by the models they load
+
         Raises:
             ValueError: If project not found or has no segments
         """
@@ -71,21 +205,31 @@ class RenderOrchestrator:
         if not project.segments:
             raise ValueError(f"Project {project_id} has no segments")
 
-        # Get the last render job to compare segments
-        last_render_job = (
-            db.query(RenderJob)
-            .filter(RenderJob.project_id == project_id)
-            .filter(RenderJob.status == RenderJobStatus.COMPLETED)
-            .order_by(RenderJob.created_at.desc())
-            .first()
-        )
-
         # Determine which segments need regeneration
+        fingerprints = self._fingerprint_segments(project.segments)
         segments_to_generate = self._identify_segments_to_regenerate(
             current_segments=project.segments,
-            last_render_job=last_render_job
+            fingerprints=fingerprints
         )
 
+        # Link identical renders from the cache instead of regenerating them
+        cached = self._link_cached_renders(db, segments_to_generate, fingerprints)
+        segments_to_generate = [seg for seg in segments_to_generate if seg.id not in cached]
+
+        # Snapshot task inputs now; committing below expires the loaded segments.
+        # Segments loading the same models are dispatched together so workers
+        # don't swap checkpoints between consecutive generations.
+        tasks = group_by_model_set([
+            {
+                "segment_id": segment.id,
+                "prompt": segment.prompt,
+                "model_params": segment.model_params,
+                "fingerprint": fingerprints[segment.id]
+            }
+            for segment in segments_to_generate
+        ])
+        model_sets = len({model_set_key(task["model_params"]) for task in tasks})
+
         # Create new render job
         render_job = RenderJob(
             project_id=project_id,
@@ -99,6 +243,15 @@ class RenderOrchestrator:
         db.commit()
         db.refresh(render_job)
 
+        if cached:
+            self.redis.set_many_segment_statuses(cached.keys(), SegmentStatus.COMPLETED.value)
+            self.redis.append_segment_events(
+                render_job.id,
+                RenderJobEvent.COMPLETED,
+                cached.keys(),
+                cached=True
+            )
+
         # Initialize progress tracking in Redis
         self.redis.set_render_job_progress(
             render_job_id=render_job.id,
@@ -111,162 +264,406 @@ class RenderOrchestrator:
         render_job.status = RenderJobStatus.PROCESSING
         db.commit()
 
-        # Dispatch segment generation tasks
-        for segment in segments_to_generate:
-            self._dispatch_segment_task(db, segment, render_job.id)
-
         logger.info(
             f"Created render job {render_job.id} for project {project_id}. "
-            f"Dispatching {len(segments_to_generate)} segment tasks."
+            f"Dispatching {len(tasks)} segment tasks in {model_sets} model groups "
+            f"({len(cached)} served from render cache)."
         )
 
-        return render_job
+        return render_job, tasks
 
     def _identify_segments_to_regenerate(
         self,
         current_segments: List[Segment],
-        last_render_job: RenderJob | None
+        fingerprints: Dict[UUID, str]
     ) -> List[Segment]:
         """
         Identify which segments need to be regenerated.
-        Only regenerates segments that are new or have been modified.
+        Only regenerates segments whose inputs changed since their asset was rendered,
+        so reordering or editing a neighbour never forces a regeneration.
 
         Args:
             current_segments: Current segments in the project
-            last_render_job: Last completed render job (or None)
+            fingerprints: Segment ID to current render fingerprint
 
         Returns:
             List of segments that need regeneration
         """
-        if last_render_job is None:
-            # First render - generate all segments
-            return [seg for seg in current_segments if seg.status != SegmentStatus.COMPLETED]
-
-        # Get IDs of previously rendered segments
-        last_segment_ids = set(last_render_job.segment_ids)
-
         segments_to_generate = []
         for segment in current_segments:
+            fingerprint = fingerprints[segment.id]
+
             # Regenerate if:
-            # 1. Segment is new (not in last render)
-            # 2. Segment has not been completed yet
-            # 3. Segment has no S3 asset URL
-            if (
-                str(segment.id) not in last_segment_ids
-                or segment.status != SegmentStatus.COMPLETED
-                or not segment.s3_asset_url
-            ):
+            # 1. Segment has not been completed yet
+            # 2. Segment has no S3 asset URL
+            # 3. Segment's inputs changed since the asset was rendered
+            if segment.status != SegmentStatus.COMPLETED or not segment.s3_asset_url:
+                segments_to_generate.append(segment)
+            elif segment.rendered_fingerprint is None:
+                # Rendered before fingerprints were tracked; edits used to reset
+                # the status, so a completed asset still matches its inputs
+                segment.rendered_fingerprint = fingerprint
+            elif segment.rendered_fingerprint != fingerprint:
                 segments_to_generate.append(segment)
 
         return segments_to_generate
 
-    def _dispatch_segment_task(
+    def _fingerprint_segments(self, segments: List[Segment]) -> Dict[UUID, str]:
+        """
+        Compute render fingerprints for segments.
+
+        Args:
+            segments: Segments to fingerprint
+
+        Returns:
+            Dictionary of segment ID to fingerprint
+        """
+        return {
+            segment.id: segment_fingerprint(segment.prompt, segment.model_params)
+            for segment in segments
+        }
+
+    def _link_cached_renders(
         self,
         db: Session,
-        segment: Segment,
+        segments: List[Segment],
+        fingerprints: Dict[UUID, str]
+    ) -> Dict[UUID, str]:
+        """
+        Point segments at cached renders of the same fingerprint.
+
+        Changes are left for the caller to commit.
+
+        Args:
+            db: Database session
+            segments: Segments about to be generated
+            fingerprints: Segment ID to fingerprint
+
+        Returns:
+            Dictionary of segment ID to linked storage URL for every cache hit
+        """
+        cacheable = [segment for segment in segments if is_cacheable(segment.model_params)]
+        hits = self.render_cache.lookup(db, [fingerprints[segment.id] for segment in cacheable])
+
+        linked = {}
+        for segment in cacheable:
+            entry = hits.get(fingerprints[segment.id])
+            if entry is None:
+                continue
+            segment.status = SegmentStatus.COMPLETED
+            segment.s3_asset_url = entry.storage_url
+            segment.rendered_fingerprint = fingerprints[segment.id]
+            segment.error_message = None
+            segment.error_code = None
+            linked[segment.id] = entry.storage_url
+
+        if linked:
+            logger.info(f"Linked {len(linked)} segments to cached renders")
+
+        return linked
+
+    def _mark_segments_dispatched(
+        self,
+        db: Session,
+        tasks: List[Dict[str, Any]],
         render_job_id: UUID
     ):
         """
-        Dispatch a segment generation task to the worker queue.
+        Mark a batch of segments as generating before their tasks are published.
+
+        Segment statuses are updated with one SQL statement and the Redis
+        writes are pipelined.
 
         Args:
             db: Database session
-            segment: Segment to generate
+            tasks: Task dicts with segment_id
             render_job_id: UUID of the render job
         """
-        # Update segment status
-        segment.status = SegmentStatus.GENERATING
+        if not tasks:
+            return
+
+        segment_ids = [task["segment_id"] for task in tasks]
+
+        # Update segment statuses
+        db.execute(
+            update(Segment)
+            .where(Segment.id.in_(segment_ids))
+            .values(status=SegmentStatus.GENERATING),
+            execution_options={"synchronize_session": False}
+        )
         db.commit()
 
         # Update Redis
-        self.redis.set_segment_status(
-            segment_id=segment.id,
+        self.redis.set_many_segment_statuses(
+            segment_ids,
             status=SegmentStatus.GENERATING.value,
             render_job_id=render_job_id
         )
-
-        # Publish task to RabbitMQ
-        self.rabbitmq.publish_segment_task(
-            segment_id=segment.id,
-            render_job_id=render_job_id,
-            prompt=segment.prompt,
-            model_params=segment.model_params
-        )
-
-        logger.info(f"Dispatched segment task: segment_id={segment.id}")
+        self.redis.append_segment_events(render_job_id, RenderJobEvent.DISPATCHED, segment_ids)
 
     def handle_segment_completion(
         self,
         db: Session,
         segment_id: UUID,
         render_job_id: UUID,
-        s3_asset_url: str
-    ):
+        s3_asset_url: str,
+        fingerprint: Optional[str] = None
+    ) -> bool:
         """
         Handle completion of a segment generation task.
 
+        Safe to call concurrently from many workers and for redelivered tasks:
+        a segment is counted once per render job (a segment re-dispatched by a
+        newer render job while still generating counts for both), the counter
+        is incremented atomically in SQL, and composition is published only by
+        the call whose increment completes the render job. Composition is
+        triggered straight after the commit; the Redis and RabbitMQ
+        notifications that follow are best-effort, so a failure there can
+        never strand a render job whose last segment was already counted.
+
         Args:
             db: Database session
             segment_id: UUID of the completed segment
             render_job_id: UUID of the render job
             s3_asset_url: S3 URL of the generated video
+            fingerprint: Render fingerprint of the segment's inputs
+
+        Returns:
+            True if this call triggered composition
         """
-        # Update segment
-        segment = db.query(Segment).filter(Segment.id == segment_id).first()
-        if segment:
-            segment.status = SegmentStatus.COMPLETED
-            segment.s3_asset_url = s3_asset_url
-            db.commit()
+        # A redelivered task finds its completion already recorded for this job
+        newly_completed = self._record_completion(db, render_job_id, segment_id)
+        if newly_completed:
+            db.execute(
+                update(Segment)
+                .where(Segment.id == segment_id)
+                .values(
+                    status=SegmentStatus.COMPLETED,
+                    s3_asset_url=s3_asset_url,
+                    rendered_fingerprint=fingerprint
+                )
+            )
+
+        # Make the render reusable by identical segments
+        if newly_completed and fingerprint:
+            model_params = db.query(Segment.model_params).filter(Segment.id == segment_id).scalar()
+            if is_cacheable(model_params):
+                self.render_cache.record(
+                    db,
+                    fingerprint=fingerprint,
+                    storage_url=s3_asset_url,
+                    model=canonical_model_name(model_params)
+                )
 
         # Update render job progress
-        render_job = db.query(RenderJob).filter(RenderJob.id == render_job_id).first()
-        if render_job:
-            render_job.segments_completed += 1
-            db.commit()
+        progress = None
+        if newly_completed:
+            progress = db.execute(
+                update(RenderJob)
+                .where(RenderJob.id == render_job_id)
+                .values(segments_completed=RenderJob.segments_completed + 1)
+                .returning(RenderJob.segments_completed, RenderJob.segments_total)
+            ).first()
+        db.commit()
 
-            # Update Redis
-            self.redis.increment_render_job_progress(render_job_id)
+        if not newly_completed:
+            logger.info(
+                f"Segment {segment_id} was already counted for render job {render_job_id}; "
+                f"not counting it again"
+            )
+            return False
+
+        logger.info(f"Segment {segment_id} completed for render job {render_job_id}")
 
-            # Check if all segments are complete
-            if render_job.segments_completed >= render_job.segments_total:
-                self._trigger_composition(db, render_job)
+        # Check if all segments are complete
+        triggered = False
+        try:
+            if progress is not None and progress.segments_completed == progress.segments_total:
+                render_job = db.query(RenderJob).filter(RenderJob.id == render_job_id).first()
+                triggered = self._trigger_composition(db, render_job)
+        finally:
+            # A claimed composition already wrote the full count to Redis
+            self._announce_segment_completion(
+                segment_id, render_job_id, s3_asset_url, count_progress=not triggered
+            )
+
+        return triggered
+
+    def _announce_segment_completion(
+        self,
+        segment_id: UUID,
+        render_job_id: UUID,
+        s3_asset_url: str,
+        count_progress: bool = True
+    ):
+        """
+        Publish a recorded segment completion to Redis and RabbitMQ.
+
+        Best-effort: the completion is already committed, so failures are
+        logged rather than raised.
+
+        Args:
+            segment_id: UUID of the completed segment
+            render_job_id: UUID of the render job
+            s3_asset_url: S3 URL of the generated video
+            count_progress: Whether to increment the Redis progress counter
+        """
+        # Update Redis
+        try:
+            self.redis.set_segment_status(
+                segment_id=segment_id,
+                status=SegmentStatus.COMPLETED.value,
+                render_job_id=render_job_id
+            )
+            if count_progress:
+                self.redis.increment_render_job_progress(render_job_id)
+            self.redis.append_render_job_event(
+                render_job_id,
+                RenderJobEvent.COMPLETED,
+                segment_id=segment_id,
+                s3_asset_url=s3_asset_url
+            )
+        except Exception as e:
+            logger.error(f"Failed to update Redis for completed segment {segment_id}: {e}")
 
         # Publish completion event
-        self.rabbitmq.publish_segment_completed_event(
-            segment_id=segment_id,
-            render_job_id=render_job_id
-        )
+        try:
+            self.rabbitmq.publish_segment_completed_event(
+                segment_id=segment_id,
+                render_job_id=render_job_id
+            )
+        except Exception as e:
+            logger.error(f"Failed to publish completion event for segment {segment_id}: {e}")
 
-        logger.info(f"Segment {segment_id} completed for render job {render_job_id}")
+    @staticmethod
+    def _record_completion(db: Session, render_job_id: UUID, segment_id: UUID) -> bool:
+        """
+        Record that a segment completed for a render job.
+
+        The insert runs in a savepoint so a duplicate only rolls back itself.
 
-    def _trigger_composition(self, db: Session, render_job: RenderJob):
+        Args:
+            db: Database session
+            render_job_id: UUID of the render job
+            segment_id: UUID of the completed segment
+
+        Returns:
+            True if this is the first completion of the segment for the job
+        """
+        try:
+            with db.begin_nested():
+                db.add(RenderJobSegmentCompletion(render_job_id=render_job_id, segment_id=segment_id))
+            return True
+        except IntegrityError:
+            return False
+
+    def _trigger_composition(self, db: Session, render_job: RenderJob) -> bool:
         """
         Trigger video composition when all segments are complete.
 
+        If publishing the composition task fails, the claim is released so
+        the render job can be composed again, and the error is re-raised.
+
         Args:
             db: Database session
             render_job: RenderJob to compose
-        """
-        render_job.status = RenderJobStatus.COMPOSITING
-        db.commit()
 
-        # Update Redis
-        self.redis.set_render_job_progress(
-            render_job_id=render_job.id,
-            segments_total=render_job.segments_total,
-            segments_completed=render_job.segments_completed,
-            status=RenderJobStatus.COMPOSITING.value
-        )
+        Returns:
+            True if composition was published by this call
+        """
+        if not self._claim_composition(db, render_job):
+            return False
 
         # Publish composition task
         segment_ids = [UUID(sid) for sid in render_job.segment_ids]
-        self.rabbitmq.publish_composition_task(
-            render_job_id=render_job.id,
-            project_id=render_job.project_id,
-            segment_ids=segment_ids
-        )
+        try:
+            self.rabbitmq.publish_composition_task(
+                render_job_id=render_job.id,
+                project_id=render_job.project_id,
+                segment_ids=segment_ids
+            )
+        except Exception:
+            self._release_composition(db, render_job.id)
+            raise
 
         logger.info(f"Triggered composition for render job {render_job.id}")
+        return True
+
+    def _claim_composition(self, db: Session, render_job: RenderJob) -> bool:
+        """
+        Move a render job to COMPOSITING, at most once.
+
+        The transition is a conditional update, so only one caller per render
+        job wins and publishes the composition task.
+
+        Args:
+            db: Database session
+            render_job: RenderJob to compose
+
+        Returns:
+            True if this call claimed the composition
+        """
+        claimed = db.execute(
+            update(RenderJob)
+            .where(RenderJob.id == render_job.id)
+            .where(RenderJob.status.in_([RenderJobStatus.PENDING, RenderJobStatus.PROCESSING]))
+            .values(status=RenderJobStatus.COMPOSITING)
+        ).rowcount == 1
+        db.commit()
+
+        if not claimed:
+            logger.info(f"Composition for render job {render_job.id} already triggered")
+            return False
+
+        db.refresh(render_job)
+
+        # Update Redis (best-effort: the claim is committed and must be published)
+        try:
+            self.redis.set_render_job_progress(
+                render_job_id=render_job.id,
+                segments_total=render_job.segments_total,
+                segments_completed=render_job.segments_completed,
+                status=RenderJobStatus.COMPOSITING.value
+            )
+            self.redis.append_render_job_event(render_job.id, RenderJobEvent.COMPOSITING)
+        except Exception as e:
+            logger.error(f"Failed to update Redis for compositing render job {render_job.id}: {e}")
+        return True
+
+    def _release_composition(self, db: Session, render_job_id: UUID):
+        """
+        Undo a composition claim whose task could not be published.
+
+        Moves the render job from COMPOSITING back to PROCESSING with a
+        conditional update, so it can be claimed again.
+
+        Args:
+            db: Database session
+            render_job_id: UUID of the render job
+        """
+        db.rollback()
+        released = db.execute(
+            update(RenderJob)
+            .where(RenderJob.id == render_job_id)
+            .where(RenderJob.status == RenderJobStatus.COMPOSITING)
+            .values(status=RenderJobStatus.PROCESSING)
+        ).rowcount == 1
+        db.commit()
+
+        if not released:
+            return
+        logger.warning(f"Released composition claim of render job {render_job_id} after a failed publish")
+
+        render_job = db.query(RenderJob).filter(RenderJob.id == render_job_id).first()
+        try:
+            self.redis.set_render_job_progress(
+                render_job_id=render_job_id,
+                segments_total=render_job.segments_total,
+                segments_completed=render_job.segments_completed,
+                status=RenderJobStatus.PROCESSING.value
+            )
+        except Exception as e:
+            logger.error(f"Failed to update Redis for render job {render_job_id}: {e}")
 
     def handle_composition_completion(
         self,
@@ -295,5 +692,10 @@ class RenderOrchestrator:
                 segments_completed=render_job.segments_completed,
                 status=RenderJobStatus.COMPLETED.value
             )
+            self.redis.append_render_job_event(
+                render_job.id,
+                RenderJobEvent.DONE,
+                s3_final_url=s3_final_url
+            )
 
             logger.info(f"Render job {render_job_id} completed. Final video: {s3_final_url}")
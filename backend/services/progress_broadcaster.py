@@ -0,0 +1,182 @@
+"""
+Push fan-out of render progress events to WebSocket clients.
+"""
+import asyncio
+import json
+import os
+from typing import Dict, Any, Optional, Set
+import logging
+
+import redis.asyncio as aioredis
+
+try:
+    from backend.services.redis_client import RENDER_JOB_CHANNEL_PREFIX, SEGMENT_CHANNEL_PREFIX
+except ModuleNotFoundError:
+    from services.redis_client import RENDER_JOB_CHANNEL_PREFIX, SEGMENT_CHANNEL_PREFIX
+
+logger = logging.getLogger(__name__)
+
+
+class ProgressSubscription:
+    """
+    A client's view of one or more progress channels.
+
+    Updates are coalesced: if a channel changes several times before the
+    client reads, only the latest state is delivered.
+    """
+
+    def __init__(self, broadcaster: "ProgressBroadcaster"):
+        self.broadcaster = broadcaster
+        self.channels: Set[str] = set()
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._ready = asyncio.Event()
+
+    def add(self, channel: str):
+        """Start receiving updates for a channel."""
+        if channel not in self.channels:
+            self.channels.add(channel)
+            self.broadcaster._attach(channel, self)
+
+    def remove(self, channel: str):
+        """Stop receiving updates for a channel."""
+        if channel in self.channels:
+            self.channels.discard(channel)
+            self._pending.pop(channel, None)
+            self.broadcaster._detach(channel, self)
+
+    def close(self):
+        """Stop receiving updates for every channel."""
+        for channel in list(self.channels):
+            self.remove(channel)
+
+    def deliver(self, channel: str, payload: Dict[str, Any]):
+        """Queue the latest state of a channel (called by the broadcaster)."""
+        self._pending[channel] = payload
+        self._ready.set()
+
+    async def get(self, timeout: Optional[float] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Wait for updates.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits forever)
+
+        Returns:
+            Dictionary of channel to latest payload (empty on timeout)
+        """
+        if not self._pending:
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                return {}
+        updates, self._pending = self._pending, {}
+        self._ready.clear()
+        return updates
+
+
+class ProgressBroadcaster:
+    """
+    Single Redis subscriber per API process that fans progress events out.
+
+    Pattern-subscribes once to every render job and segment channel and hands
+    each event to the subscriptions watching that channel, skipping events
+    whose payload is unchanged. Sockets therefore cost no Redis round-trips
+    of their own and receive updates as soon as they are written.
+    """
+
+    PATTERNS = (f"{RENDER_JOB_CHANNEL_PREFIX}*", f"{SEGMENT_CHANNEL_PREFIX}*")
+
+    def __init__(self, redis_url: Optional[str] = None):
+        """
+        Initialize the broadcaster.
+
+        Args:
+            redis_url: Redis connection URL (default from environment)
+        """
+        self.redis_url = redis_url or os.getenv("REDIS_URL", "redis://localhost:6379/0")
+        self._subscribers: Dict[str, Set[ProgressSubscription]] = {}
+        self._last: Dict[str, str] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    @staticmethod
+    def render_job_channel(render_job_id) -> str:
+        """Channel carrying progress of a render job."""
+        return f"{RENDER_JOB_CHANNEL_PREFIX}{render_job_id}"
+
+    @staticmethod
+    def segment_channel(segment_id) -> str:
+        """Channel carrying status of a segment."""
+        return f"{SEGMENT_CHANNEL_PREFIX}{segment_id}"
+
+    def subscribe(self) -> ProgressSubscription:
+        """
+        Create a subscription, starting the Redis listener if needed.
+
+        Returns:
+            Empty ProgressSubscription; add channels to it
+        """
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="progress-broadcaster")
+        return ProgressSubscription(self)
+
+    async def close(self):
+        """Stop the Redis listener."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._task = None
+
+    def _attach(self, channel: str, subscription: ProgressSubscription):
+        self._subscribers.setdefault(channel, set()).add(subscription)
+
+    def _detach(self, channel: str, subscription: ProgressSubscription):
+        subscribers = self._subscribers.get(channel)
+        if subscribers is None:
+            return
+        subscribers.discard(subscription)
+        if not subscribers:
+            del self._subscribers[channel]
+            self._last.pop(channel, None)
+
+    def _dispatch(self, channel: str, data: str):
+        """Hand an event to every subscription watching its channel."""
+        subscribers = self._subscribers.get(channel)
+        if not subscribers or self._last.get(channel) == data:
+            return
+        self._last[channel] = data
+
+        try:
+            payload = json.loads(data)
+        except json.JSONDecodeError:
+            logger.warning(f"Discarding malformed progress event on {channel}")
+            return
+
+        for subscription in subscribers:
+            subscription.deliver(channel, payload)
+
+    async def _run(self):
+        """Listen for progress events, reconnecting with backoff."""
+        backoff = 1.0
+        while True:
+            client = aioredis.from_url(self.redis_url, decode_responses=True)
+            pubsub = client.pubsub()
+            try:
+                await pubsub.psubscribe(*self.PATTERNS)
+                logger.info("Progress broadcaster subscribed to Redis")
+                backoff = 1.0
+                async for message in pubsub.listen():
+                    if message["type"] == "pmessage":
+                        self._dispatch(message["channel"], message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Progress broadcaster lost Redis connection: {e}")
+            finally:
+                await pubsub.aclose()
+                await client.aclose()
+
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, 30.0)
@@ -2,15 +2,64 @@
 Redis client for real-time state management.
 """
 import redis
+import enum
 import json
 import os
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable, List, Tuple
 from uuid import UUID
 
+# Pub/sub channels carrying change events for progress writes
+RENDER_JOB_CHANNEL_PREFIX = "render_job_progress:"
+SEGMENT_CHANNEL_PREFIX = "segment_status:"
+
+# Per render job event log (Redis Stream), capped to roughly this many entries
+RENDER_JOB_EVENTS_PREFIX = "render_job_events:"
+RENDER_JOB_EVENTS_MAXLEN = int(os.getenv("RENDER_JOB_EVENTS_MAXLEN", "10000"))
+
+
+class RenderJobEvent(str, enum.Enum):
+    """Event types appended to a render job's event log."""
+    DISPATCHED = "dispatched"
+    GENERATING = "generating"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    COMPOSITING = "compositing"
+    DONE = "done"
+
+
+# Increment the completed counter, recompute the percentage, publish the new
+# snapshot and report whether this increment is the one that completed the
+# render job, in one round-trip.
+INCREMENT_PROGRESS_SCRIPT = """
+local completed = redis.call('HINCRBY', KEYS[1], 'segments_completed', 1)
+local total = tonumber(redis.call('HGET', KEYS[1], 'segments_total') or '0')
+local percentage = 0
+if total > 0 then
+    percentage = completed / total * 100
+    redis.call('HSET', KEYS[1], 'progress_percentage', tostring(percentage))
+end
+redis.call('EXPIRE', KEYS[1], ARGV[1])
+redis.call('PUBLISH', ARGV[2], cjson.encode({
+    render_job_id = ARGV[3],
+    segments_total = total,
+    segments_completed = completed,
+    status = redis.call('HGET', KEYS[1], 'status') or 'unknown',
+    progress_percentage = percentage
+}))
+if total > 0 and completed == total then
+    return 1
+end
+return 0
+"""
+
 
 class RedisClient:
     """
     Redis client for tracking real-time render job and segment status.
+
+    Every progress write also publishes the new state on a per-job or
+    per-segment pub/sub channel, so API processes can push updates to
+    clients instead of polling.
     """
 
     def __init__(self, redis_url: Optional[str] = None):
@@ -22,6 +71,7 @@ class RedisClient:
         """
         self.redis_url = redis_url or os.getenv("REDIS_URL", "redis://localhost:6379/0")
         self.client = redis.from_url(self.redis_url, decode_responses=True)
+        self._increment_progress = self.client.register_script(INCREMENT_PROGRESS_SCRIPT)
 
     def set_render_job_progress(
         self,
@@ -40,17 +90,22 @@ class RedisClient:
             status: Current status
         """
         key = f"render_job:{render_job_id}"
-        self.client.hset(
-            key,
-            mapping={
-                "segments_total": segments_total,
-                "segments_completed": segments_completed,
-                "status": status,
-                "progress_percentage": (segments_completed / segments_total * 100) if segments_total > 0 else 0
-            }
-        )
+        progress = {
+            "segments_total": segments_total,
+            "segments_completed": segments_completed,
+            "status": status,
+            "progress_percentage": (segments_completed / segments_total * 100) if segments_total > 0 else 0
+        }
+
+        pipe = self.client.pipeline(transaction=False)
+        pipe.hset(key, mapping=progress)
         # Set expiration to 24 hours
-        self.client.expire(key, 86400)
+        pipe.expire(key, 86400)
+        pipe.publish(
+            f"{RENDER_JOB_CHANNEL_PREFIX}{render_job_id}",
+            json.dumps({"render_job_id": str(render_job_id), **progress})
+        )
+        pipe.execute()
 
     def get_render_job_progress(self, render_job_id: UUID) -> Optional[Dict[str, Any]]:
         """
@@ -63,7 +118,33 @@ class RedisClient:
             Dictionary with progress data or None if not found
         """
         key = f"render_job:{render_job_id}"
-        data = self.client.hgetall(key)
+        return self._parse_progress(self.client.hgetall(key))
+
+    def get_many_render_job_progress(
+        self,
+        render_job_ids: Iterable[UUID]
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Get progress of many render jobs in one pipelined round-trip.
+
+        Args:
+            render_job_ids: UUIDs of the render jobs
+
+        Returns:
+            Dictionary of render job ID string to progress data (None if not found)
+        """
+        ids: List[str] = [str(render_job_id) for render_job_id in render_job_ids]
+        pipe = self.client.pipeline(transaction=False)
+        for render_job_id in ids:
+            pipe.hgetall(f"render_job:{render_job_id}")
+        return {
+            render_job_id: self._parse_progress(data)
+            for render_job_id, data in zip(ids, pipe.execute())
+        }
+
+    @staticmethod
+    def _parse_progress(data: Dict[str, str]) -> Optional[Dict[str, Any]]:
+        """Convert a render job progress hash to typed values."""
         if not data:
             return None
 
@@ -74,24 +155,21 @@ class RedisClient:
             "progress_percentage": float(data.get("progress_percentage", 0))
         }
 
-    def increment_render_job_progress(self, render_job_id: UUID):
+    def increment_render_job_progress(self, render_job_id: UUID) -> bool:
         """
-        Increment the completed segments counter for a render job.
+        Atomically increment the completed segments counter for a render job.
 
         Args:
             render_job_id: UUID of the render job
+
+        Returns:
+            True if this increment brought segments_completed up to segments_total
         """
         key = f"render_job:{render_job_id}"
-        self.client.hincrby(key, "segments_completed", 1)
-
-        # Recalculate progress percentage
-        data = self.client.hgetall(key)
-        segments_total = int(data.get("segments_total", 0))
-        segments_completed = int(data.get("segments_completed", 0))
-
-        if segments_total > 0:
-            progress = (segments_completed / segments_total) * 100
-            self.client.hset(key, "progress_percentage", progress)
+        return bool(self._increment_progress(
+            keys=[key],
+            args=[86400, f"{RENDER_JOB_CHANNEL_PREFIX}{render_job_id}", str(render_job_id)]
+        ))
 
     def set_segment_status(
         self,
@@ -107,14 +185,37 @@ class RedisClient:
             status: Current status
             render_job_id: Optional render job ID for tracking
         """
-        key = f"segment:{segment_id}"
+        self.set_many_segment_statuses([segment_id], status, render_job_id)
+
+    def set_many_segment_statuses(
+        self,
+        segment_ids: Iterable[UUID],
+        status: str,
+        render_job_id: Optional[UUID] = None
+    ):
+        """
+        Update the status of many segments in one pipelined round-trip.
+
+        Args:
+            segment_ids: UUIDs of the segments
+            status: Current status
+            render_job_id: Optional render job ID for tracking
+        """
         data = {"status": status}
         if render_job_id:
             data["render_job_id"] = str(render_job_id)
 
-        self.client.hset(key, mapping=data)
-        # Set expiration to 24 hours
-        self.client.expire(key, 86400)
+        pipe = self.client.pipeline(transaction=False)
+        for segment_id in segment_ids:
+            key = f"segment:{segment_id}"
+            pipe.hset(key, mapping=data)
+            # Set expiration to 24 hours
+            pipe.expire(key, 86400)
+            pipe.publish(
+                f"{SEGMENT_CHANNEL_PREFIX}{segment_id}",
+                json.dumps({"segment_id": str(segment_id), **data})
+            )
+        pipe.execute()
 
     def get_segment_status(self, segment_id: UUID) -> Optional[str]:
         """
@@ -129,6 +230,22 @@ class RedisClient:
         key = f"segment:{segment_id}"
         return self.client.hget(key, "status")
 
+    def get_many_segment_statuses(self, segment_ids: Iterable[UUID]) -> Dict[str, Optional[str]]:
+        """
+        Get the status of many segments in one pipelined round-trip.
+
+        Args:
+            segment_ids: UUIDs of the segments
+
+        Returns:
+            Dictionary of segment ID string to status (None if not found)
+        """
+        ids = [str(segment_id) for segment_id in segment_ids]
+        pipe = self.client.pipeline(transaction=False)
+        for segment_id in ids:
+            pipe.hget(f"segment:{segment_id}", "status")
+        return dict(zip(ids, pipe.execute()))
+
     def delete_render_job_progress(self, render_job_id: UUID):
         """
         Delete render job progress from Redis.
@@ -139,6 +256,128 @@ class RedisClient:
         key = f"render_job:{render_job_id}"
         self.client.delete(key)
 
+    def append_render_job_event(
+        self,
+        render_job_id: UUID,
+        event: RenderJobEvent,
+        segment_id: Optional[UUID] = None,
+        **data: Any
+    ) -> str:
+        """
+        Append an event to a render job's event log.
+
+        Args:
+            render_job_id: UUID of the render job
+            event: Event type
+            segment_id: Segment the event concerns (None for job-level events)
+            **data: Extra event fields (None values are dropped)
+
+        Returns:
+            Stream entry ID of the event
+        """
+        return self.append_segment_events(render_job_id, event, [segment_id], **data)[0]
+
+    def append_segment_events(
+        self,
+        render_job_id: UUID,
+        event: RenderJobEvent,
+        segment_ids: Iterable[Optional[UUID]],
+        **data: Any
+    ) -> List[str]:
+        """
+        Append the same event for many segments in one pipelined round-trip.
+
+        Args:
+            render_job_id: UUID of the render job
+            event: Event type
+            segment_ids: Segments the events concern
+            **data: Extra event fields (None values are dropped)
+
+        Returns:
+            Stream entry IDs, in order
+        """
+        key = f"{RENDER_JOB_EVENTS_PREFIX}{render_job_id}"
+        pipe = self.client.pipeline(transaction=False)
+        for segment_id in segment_ids:
+            pipe.xadd(
+                key,
+                self._event_fields(event, segment_id, data),
+                maxlen=RENDER_JOB_EVENTS_MAXLEN,
+                approximate=True
+            )
+        # Set expiration to 24 hours
+        pipe.expire(key, 86400)
+        return pipe.execute()[:-1]
+
+    def get_render_job_events(
+        self,
+        render_job_id: UUID,
+        last_event_id: str = "0",
+        count: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get the events of a render job after a given event.
+
+        Args:
+            render_job_id: UUID of the render job
+            last_event_id: Return events after this stream entry ID ("0" for all)
+            count: Maximum number of events to return
+
+        Returns:
+            Events in order, each with id, event and its fields
+        """
+        key = f"{RENDER_JOB_EVENTS_PREFIX}{render_job_id}"
+        return self._parse_events(self.client.xread({key: last_event_id}, count=count))
+
+    @staticmethod
+    def _event_fields(
+        event: RenderJobEvent,
+        segment_id: Optional[UUID],
+        data: Dict[str, Any]
+    ) -> Dict[str, str]:
+        """Flatten an event into stream entry fields."""
+        fields = {"event": RenderJobEvent(event).value}
+        if segment_id is not None:
+            fields["segment_id"] = str(segment_id)
+        for name, value in data.items():
+            if value is not None:
+                fields[name] = json.dumps(value) if isinstance(value, (bool, dict, list)) else str(value)
+        return fields
+
+    @staticmethod
+    def _parse_events(response: List[Tuple[str, List[Tuple[str, Dict[str, str]]]]]) -> List[Dict[str, Any]]:
+        """Convert an XREAD response for one stream to a list of events."""
+        if not response:
+            return []
+        _, entries = response[0]
+        return [{"id": entry_id, **fields} for entry_id, fields in entries]
+
+    def record_render_cache_lookups(self, hits: int, misses: int):
+        """
+        Count render cache hits and misses.
+
+        Args:
+            hits: Number of fingerprints found in the cache
+            misses: Number of fingerprints not found
+        """
+        pipe = self.client.pipeline(transaction=False)
+        pipe.hincrby("render_cache:stats", "hits", hits)
+        pipe.hincrby("render_cache:stats", "misses", misses)
+        pipe.execute()
+
+    def get_render_cache_stats(self) -> Dict[str, int]:
+        """
+        Get render cache hit and miss counters.
+
+        Returns:
+            Dictionary with hits and misses
+        """
+        data = self.client.hgetall("render_cache:stats")
+        return {
+            "hits": int(data.get("hits", 0)),
+            "misses": int(data.get("misses", 0))
+        }
+
     def publish_segment_completed(self, segment_id: UUID, render_job_id: UUID):
         """
         Publish a segment completion event to a Redis pub/sub channel.
@@ -0,0 +1,117 @@
+"""
+Content-addressed cache of rendered segment videos.
+"""
+from sqlalchemy.orm import Session
+from sqlalchemy.dialects.postgresql import insert
+from typing import Dict, Iterable, Optional, Any
+from datetime import datetime
+import logging
+
+# Handle imports for both backend container (/app) and worker containers (/app/backend)
+try:
+    from backend.models import RenderCacheEntry
+    from backend.services.redis_client import RedisClient
+except ModuleNotFoundError:
+    from models import RenderCacheEntry
+    from services.redis_client import RedisClient
+
+logger = logging.getLogger(__name__)
+
+
+class RenderCache:
+    """
+    Index from segment render fingerprint to stored video.
+
+    Lookups and records go through the database so the index is shared by
+    every API instance and worker; hit/miss counters are kept in Redis.
+    """
+
+    def __init__(self, redis_client: Optional[RedisClient] = None):
+        """
+        Initialize the render cache.
+
+        Args:
+            redis_client: Redis client for hit/miss metrics (metrics are skipped if None)
+        """
+        self.redis = redis_client
+
+    def lookup(self, db: Session, fingerprints: Iterable[str]) -> Dict[str, RenderCacheEntry]:
+        """
+        Find cached renders for a batch of fingerprints.
+
+        Hits are counted on the returned entries; the caller commits.
+
+        Args:
+            db: Database session
+            fingerprints: Render fingerprints to look up
+
+        Returns:
+            Dictionary of fingerprint to cache entry for every hit
+        """
+        wanted = set(fingerprints)
+        if not wanted:
+            return {}
+
+        entries = (
+            db.query(RenderCacheEntry)
+            .filter(RenderCacheEntry.fingerprint.in_(wanted))
+            .all()
+        )
+        hits = {entry.fingerprint: entry for entry in entries}
+
+        now = datetime.utcnow()
+        for entry in entries:
+            entry.hit_count += 1
+            entry.last_hit_at = now
+
+        if self.redis:
+            self.redis.record_render_cache_lookups(hits=len(hits), misses=len(wanted) - len(hits))
+
+        return hits
+
+    def record(self, db: Session, fingerprint: str, storage_url: str, model: str):
+        """
+        Add a rendered video to the cache.
+
+        The first render of a fingerprint wins; later ones are ignored. The
+        caller commits.
+
+        Args:
+            db: Database session
+            fingerprint: Render fingerprint of the segment
+            storage_url: URL of the stored, content-addressed video
+            model: Canonical model name that rendered the video
+        """
+        now = datetime.utcnow()
+        db.execute(
+            insert(RenderCacheEntry)
+            .values(
+                fingerprint=fingerprint,
+                storage_url=storage_url,
+                model=model,
+                hit_count=0,
+                created_at=now,
+                updated_at=now
+            )
+            .on_conflict_do_nothing(index_elements=["fingerprint"])
+        )
+        logger.info(f"Recorded render cache entry {fingerprint[:12]} ({model})")
+
+    def get_stats(self, db: Session) -> Dict[str, Any]:
+        """
+        Get cache hit/miss metrics.
+
+        Args:
+            db: Database session
+
+        Returns:
+            Dictionary with hits, misses, hit_rate and entry count
+        """
+        stats = self.redis.get_render_cache_stats() if self.redis else {"hits": 0, "misses": 0}
+        lookups = stats["hits"] + stats["misses"]
+        return {
+            "hits": stats["hits"],
+            "misses": stats["misses"],
+            "hit_rate": stats["hits"] / lookups if lookups else 0.0,
+            "entries": db.query(RenderCacheEntry).count()
+        }
@@ -5,6 +5,8 @@ import boto3
 import os
 from typing import Optional
 from uuid import UUID
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError
 import mimetypes
 
@@ -38,7 +40,9 @@ class S3Client:
             "s3",
             aws_access_key_id=aws_access_key_id or os.getenv("AWS_ACCESS_KEY_ID"),
             aws_secret_access_key=aws_secret_access_key or os.getenv("AWS_SECRET_ACCESS_KEY"),
-            region_name=self.region
+            region_name=self.region,
+            # Workers download and upload concurrently from thread pools
+            config=Config(max_pool_connections=int(os.getenv("S3_MAX_POOL_CONNECTIONS", "50")))
         )
 
     def upload_file(
@@ -104,6 +108,42 @@ class S3Client:
 
         return self.get_url(s3_key)
 
+    def upload_stream(
+        self,
+        stream,
+        s3_key: str,
+        content_type: str = "video/mp4"
+    ) -> str:
+        """
+        Upload a non-seekable stream (e.g. a pipe) to S3 while it is being written.
+
+        The stream is read sequentially and sent as a multipart upload, with
+        parts uploaded concurrently as soon as they fill.
+
+        Args:
+            stream: Readable binary stream
+            s3_key: S3 object key
+            content_type: MIME type
+
+        Returns:
+            S3 URL of the uploaded file
+        """
+        config = TransferConfig(
+            multipart_threshold=8 * 1024 * 1024,
+            multipart_chunksize=int(os.getenv("S3_MULTIPART_CHUNK_MB", "8")) * 1024 * 1024,
+            max_concurrency=int(os.getenv("S3_MULTIPART_CONCURRENCY", "4"))
+        )
+
+        self.s3_client.upload_fileobj(
+            stream,
+            self.bucket_name,
+            s3_key,
+            ExtraArgs={"ContentType": content_type},
+            Config=config
+        )
+
+        return self.get_url(s3_key)
+
     def download_file(self, s3_key: str, local_path: str):
         """
         Download a file from S3.
@@ -121,6 +161,25 @@ class S3Client:
             local_path
         )
 
+    def get_etag(self, s3_key: str) -> str:
+        """
+        Get the ETag of an S3 object without downloading it.
+
+        Args:
+            s3_key: S3 object key
+
+        Returns:
+            ETag, which changes whenever the object is rewritten
+
+        Raises:
+            ClientError: If the object does not exist
+        """
+        response = self.s3_client.head_object(
+            Bucket=self.bucket_name,
+            Key=s3_key
+        )
+        return response["ETag"].strip('"')
+
     def delete_file(self, s3_key: str):
         """
         Delete a file from S3.
@@ -173,6 +232,18 @@ class S3Client:
         except ClientError as e:
             raise Exception(f"Failed to generate presigned URL: {e}")
 
+    def generate_cache_key(self, fingerprint: str) -> str:
+        """
+        Generate a content-addressed S3 key for a cached segment render.
+
+        Args:
+            fingerprint: Render fingerprint of the segment
+
+        Returns:
+            S3 key path
+        """
+        return f"cache/segments/{fingerprint[:2]}/{fingerprint}.mp4"
+
     def generate_segment_key(self, project_id: UUID, segment_id: UUID) -> str:
         """
         Generate S3 key for a segment video.
@@ -198,3 +269,16 @@ class S3Client:
             S3 key path
         """
         return f"renders/{project_id}/{render_job_id}.mp4"
+
+    def generate_composition_key(self, project_id: UUID, render_job_id: UUID) -> str:
+        """
+        Generate S3 key for a composed video (same interface as LocalStorageClient).
+
+        Args:
+            project_id: Project UUID
+            render_job_id: Render job UUID
+
+        Returns:
+            S3 key path
+        """
+        return self.generate_final_video_key(project_id, render_job_id)
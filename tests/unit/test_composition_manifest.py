@@ -0,0 +1,76 @@
+"""
+Unit tests for incremental composition chunk planning and normalization targets.
+"""
+import hashlib
+import sys
+from pathlib import Path
+
+# Add composition worker to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "workers" / "composition_worker"))
+
+from composition.manifest import SegmentSource, CompositionManifest, plan_chunks
+from composition.normalize import StreamSignature, choose_target
+
+
+def _sources(names):
+    return [
+        SegmentSource(segment_id=name, content_key=hashlib.sha256(name.encode()).hexdigest())
+        for name in names
+    ]
+
+
+def test_editing_one_segment_changes_one_chunk():
+    """Only the chunk containing an edited segment gets a new key."""
+    names = [f"segment-{i}" for i in range(100)]
+    before = {chunk.key for chunk in plan_chunks(_sources(names), 8)}
+
+    names[40] = "segment-40-edited"
+    after = plan_chunks(_sources(names), 8)
+
+    assert len([chunk for chunk in after if chunk.key not in before]) <= 2
+    assert [sid for chunk in after for sid in chunk.segment_ids] == names
+
+
+def test_inserting_a_segment_keeps_later_chunks():
+    """Chunk boundaries follow content, so an insert doesn't shift later chunks."""
+    names = [f"segment-{i}" for i in range(100)]
+    before = plan_chunks(_sources(names), 8)
+
+    after = plan_chunks(_sources(names[:10] + ["inserted"] + names[10:]), 8)
+
+    assert before[-1].key == after[-1].key
+    assert len({chunk.key for chunk in after} - {chunk.key for chunk in before}) <= 2
+
+
+def test_manifest_round_trip(tmp_path):
+    """Manifests survive save and load."""
+    manifest = CompositionManifest(
+        project_id="p",
+        render_job_id="r",
+        chunks=plan_chunks(_sources(["a", "b", "c"]), 2),
+        final_url="file:///videos/final.mp4"
+    )
+    path = str(tmp_path / "manifest.json")
+    manifest.save(path)
+
+    assert CompositionManifest.load(path) == manifest
+    assert CompositionManifest.load(str(tmp_path / "missing.json")) is None
+
+
+def test_target_is_most_common_concat_ready_signature():
+    """The largest concat-ready group needs no transcoding; images never become the target."""
+    hd = StreamSignature("h264", 1280, 720, "yuv420p", "24/1", "1/12288")
+    square = StreamSignature("h264", 512, 512, "yuv420p", "8/1", "1/16384")
+    image = StreamSignature("png", 1024, 1024, "rgb24", "25/1", "1/25", still_image=True)
+
+    assert choose_target([square, hd, hd, image, image, image]) == hd
+
+
+def test_normalized_segment_gets_its_own_chunk_key():
+    """Changing a segment's target changes the chunk that contains it."""
+    source = _sources(["a"])[0]
+    before = plan_chunks([source], 8)[0].key
+
+    source.normalize_to = StreamSignature("h264", 1280, 720, "yuv420p", "24/1", "1/12288")
+
+    assert plan_chunks([source], 8)[0].key != before
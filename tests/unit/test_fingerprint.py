@@ -0,0 +1,34 @@
+"""
+Unit tests for segment render fingerprints.
+"""
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from backend.services.fingerprint import segment_fingerprint, is_cacheable, workflow_hash
+
+
+def test_fingerprint_ignores_formatting_and_aliases():
+    """Whitespace, key order, model aliases and 5 vs 5.0 don't change the fingerprint."""
+    a = segment_fingerprint("A cat  on a\nboat", {"model": "runway", "duration": 5, "seed": 7})
+    b = segment_fingerprint(" A cat on a\nboat ", {"seed": 7, "duration": 5.0, "model": "Runway-Gen3"})
+    assert a == b
+
+
+def test_fingerprint_changes_with_rendering_inputs():
+    """Prompt, parameters, model and workflow each change the fingerprint."""
+    base = segment_fingerprint("A cat", {"model": "comfyui", "seed": 1})
+    assert segment_fingerprint("A dog", {"model": "comfyui", "seed": 1}) != base
+    assert segment_fingerprint("A cat", {"model": "comfyui", "seed": 2}) != base
+    assert segment_fingerprint("A cat", {"model": "mock-ai", "seed": 1}) != base
+    assert segment_fingerprint("A cat", {"model": "comfyui", "seed": 1, "workflow": {"1": {}}}) != base
+
+
+def test_cache_opt_out():
+    """The cache flag opts out of caching without affecting the fingerprint."""
+    assert is_cacheable({"model": "mock"})
+    assert not is_cacheable({"model": "mock", "cache": False})
+    assert segment_fingerprint("x", {"cache": False}) == segment_fingerprint("x", {})
+    assert workflow_hash(None) is None
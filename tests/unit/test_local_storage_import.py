@@ -0,0 +1,114 @@
+"""
+Unit tests for importing local files into LocalStorageClient without copying.
+"""
+import os
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from backend.services import local_storage_client
+from backend.services.local_storage_client import LocalStorageClient
+
+
+def _setup(tmp_path, content=b"video"):
+    source = tmp_path / "comfyui" / "out.mp4"
+    source.parent.mkdir()
+    source.write_bytes(content)
+    return LocalStorageClient(storage_path=str(tmp_path / "storage")), source
+
+
+def _fail(*args, **kwargs):
+    raise OSError("unsupported")
+
+
+def test_move_renames_source_into_storage(tmp_path):
+    """With move, a same-filesystem rename consumes the source."""
+    storage, source = _setup(tmp_path)
+
+    url = storage.import_file(str(source), "segments/a.mp4", move=True)
+
+    dest = tmp_path / "storage" / "segments" / "a.mp4"
+    assert url == f"file://{dest}"
+    assert dest.read_bytes() == b"video"
+    assert not source.exists()
+
+
+def test_without_move_source_is_hardlinked(tmp_path):
+    """Without move, the stored file shares the source's inode."""
+    storage, source = _setup(tmp_path)
+
+    storage.import_file(str(source), "segments/a.mp4")
+
+    dest = tmp_path / "storage" / "segments" / "a.mp4"
+    assert source.exists()
+    assert os.stat(dest).st_ino == os.stat(source).st_ino
+
+
+def test_failed_rename_falls_back_and_keeps_source(tmp_path, monkeypatch):
+    """If the rename fails (another mount), move links instead and leaves the source."""
+    storage, source = _setup(tmp_path)
+    real_replace = os.replace
+
+    def replace(src, dst):
+        if str(src) == str(source):
+            raise OSError("cross-device link")
+        return real_replace(src, dst)
+
+    monkeypatch.setattr(local_storage_client.os, "replace", replace)
+    storage.import_file(str(source), "segments/a.mp4", move=True)
+
+    assert source.read_bytes() == b"video"
+    assert (tmp_path / "storage" / "segments" / "a.mp4").read_bytes() == b"video"
+
+
+def test_reflink_is_tried_before_copy(tmp_path, monkeypatch):
+    """Without hardlinks, a reflink is used when the filesystem supports it."""
+    storage, source = _setup(tmp_path)
+    reflinks = []
+
+    def reflink(src, dst):
+        reflinks.append(src)
+        Path(dst).write_bytes(Path(src).read_bytes())
+        return True
+
+    monkeypatch.setattr(local_storage_client.os, "link", _fail)
+    monkeypatch.setattr(LocalStorageClient, "_reflink", staticmethod(reflink))
+    monkeypatch.setattr(local_storage_client.shutil, "copy2", _fail)
+    storage.import_file(str(source), "segments/a.mp4")
+
+    assert reflinks == [str(source)]
+    assert (tmp_path / "storage" / "segments" / "a.mp4").read_bytes() == b"video"
+
+
+def test_copy_fallback_replaces_existing_file_atomically(tmp_path, monkeypatch):
+    """The last resort is a copy, moved over any existing file with no temp file left behind."""
+    storage, source = _setup(tmp_path, b"new")
+    dest = tmp_path / "storage" / "segments" / "a.mp4"
+    dest.parent.mkdir(parents=True)
+    dest.write_bytes(b"old")
+
+    monkeypatch.setattr(local_storage_client.os, "link", _fail)
+    monkeypatch.setattr(LocalStorageClient, "_reflink", staticmethod(lambda src, dst: False))
+    storage.import_file(str(source), "segments/a.mp4")
+
+    assert dest.read_bytes() == b"new"
+    assert source.exists()
+    assert sorted(p.name for p in dest.parent.iterdir()) == ["a.mp4"]
+
+
+def test_concurrent_writer_temp_files_are_left_alone(tmp_path):
+    """Each write to a key uses its own temp file, so another writer's in-progress file survives."""
+    storage, source = _setup(tmp_path)
+    dest_dir = tmp_path / "storage" / "segments"
+    dest_dir.mkdir(parents=True)
+    other_writer = dest_dir / ".a.mp4.part"
+    other_writer.write_bytes(b"in progress")
+
+    storage.import_file(str(source), "segments/a.mp4")
+    with open(source, "rb") as stream:
+        storage.upload_stream(stream, "segments/a.mp4")
+
+    assert other_writer.read_bytes() == b"in progress"
+    assert sorted(p.name for p in dest_dir.iterdir()) == [".a.mp4.part", "a.mp4"]
@@ -0,0 +1,36 @@
+"""
+Unit tests for model-affinity ordering of segment tasks.
+"""
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from backend.services.model_affinity import required_models, group_by_model_set
+
+
+def _workflow(checkpoint, lora=None):
+    workflow = {
+        "4": {"class_type": "CheckpointLoaderSimple", "inputs": {"ckpt_name": checkpoint}},
+        "6": {"class_type": "CLIPTextEncode", "inputs": {"text": "", "clip": ["4", 1]}},
+    }
+    if lora:
+        workflow["10"] = {"class_type": "LoraLoader", "inputs": {"lora_name": lora, "model": ["4", 0]}}
+    return workflow
+
+
+def test_required_models_reads_loader_inputs():
+    """Model file inputs are collected; linked inputs and other nodes are ignored."""
+    params = {"model": "comfyui", "workflow": _workflow("sdxl.safetensors", lora="style.safetensors")}
+    assert required_models(params) == ("ckpt_name:sdxl.safetensors", "lora_name:style.safetensors")
+    assert required_models({"model": "runway"}) == ()
+
+
+def test_grouping_keeps_first_appearance_and_timeline_order():
+    """Tasks are grouped by model set without reordering tasks within a group."""
+    a = {"model": "comfyui", "workflow": _workflow("a.safetensors")}
+    b = {"model": "comfyui", "workflow": _workflow("b.safetensors")}
+    tasks = [{"segment_id": i, "model_params": params} for i, params in enumerate([a, b, a, {"model": "mock"}, b])]
+
+    assert [task["segment_id"] for task in group_by_model_set(tasks)] == [0, 2, 1, 4, 3]
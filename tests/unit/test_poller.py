@@ -0,0 +1,65 @@
+"""
+Unit tests for the shared status poller's handling of failed polls.
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add AI worker to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "workers" / "ai_worker"))
+
+from adapters.base import GenerationResult, GenerationStatus
+from adapters.poller import StatusPoller
+
+
+class FlakyAdapter:
+    """Adapter stub whose first status polls fail."""
+    model_name = "flaky"
+
+    def __init__(self, bulk_failures=0, job_failures=0):
+        self.bulk_failures = bulk_failures
+        self.job_failures = job_failures
+        self.calls = 0
+
+    async def get_results_bulk(self, job_ids):
+        self.calls += 1
+        if self.calls <= self.bulk_failures:
+            raise ConnectionError("connect failed")
+        if self.calls <= self.bulk_failures + self.job_failures:
+            return {job_id: RuntimeError("HTTP 503 from status endpoint") for job_id in job_ids}
+        return {
+            job_id: GenerationResult(status=GenerationStatus.COMPLETED, video_url="https://cdn/v.mp4")
+            for job_id in job_ids
+        }
+
+
+def _wait(adapter, max_errors=5):
+    async def main():
+        poller = StatusPoller(min_interval=0.01, max_interval=0.05, max_errors=max_errors)
+        try:
+            return await poller.wait(adapter, "job-1", expected_duration=0, timeout=5)
+        finally:
+            await poller.close()
+    return asyncio.run(main())
+
+
+@pytest.mark.parametrize("failures", [{"bulk_failures": 2}, {"job_failures": 2}])
+def test_transient_poll_errors_are_retried(failures):
+    """Failed bulk calls and per-job errors leave the job in flight until it completes."""
+    adapter = FlakyAdapter(**failures)
+
+    result = _wait(adapter)
+
+    assert result.status == GenerationStatus.COMPLETED
+    assert adapter.calls == 3
+
+
+def test_job_fails_after_max_consecutive_errors():
+    """A job whose own status keeps failing gets the error after max_errors polls."""
+    adapter = FlakyAdapter(job_failures=10)
+
+    with pytest.raises(RuntimeError, match="HTTP 503"):
+        _wait(adapter, max_errors=3)
+    assert adapter.calls == 3
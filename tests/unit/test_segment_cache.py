@@ -0,0 +1,72 @@
+"""
+Unit tests for the composition worker's segment cache.
+"""
+import os
+import sys
+import time
+from pathlib import Path
+
+# Add composition worker to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "workers" / "composition_worker"))
+
+from composition.segment_cache import SegmentCache
+
+
+def _writer(content: bytes, calls: list):
+    def fetch(path):
+        calls.append(path)
+        Path(path).write_bytes(content)
+    return fetch
+
+
+def test_second_fetch_is_served_from_cache(tmp_path):
+    """A cached segment is linked into the job without fetching again."""
+    cache = SegmentCache(cache_dir=str(tmp_path), max_bytes=1024)
+    scratch = cache.create_scratch_dir("job")
+    key = SegmentCache.content_key("segments/p/s.mp4", "etag-1")
+    calls = []
+
+    assert cache.fetch_into(key, _writer(b"video", calls), os.path.join(scratch, "a.mp4")) is False
+    assert cache.fetch_into(key, _writer(b"video", calls), os.path.join(scratch, "b.mp4")) is True
+    assert len(calls) == 1
+    assert Path(scratch, "b.mp4").read_bytes() == b"video"
+    assert cache.get_stats()["hits"] == 1
+
+
+def test_changed_etag_is_a_different_entry():
+    """Re-rendering a segment in place changes its key."""
+    assert SegmentCache.content_key("k", "etag-1") != SegmentCache.content_key("k", "etag-2")
+
+
+def test_least_recently_used_entry_is_evicted_without_breaking_job_links(tmp_path):
+    """Eviction drops the oldest entry but files linked into jobs survive."""
+    cache = SegmentCache(cache_dir=str(tmp_path), max_bytes=10)
+    scratch = cache.create_scratch_dir("job")
+
+    cache.fetch_into("a", _writer(b"aaaa", []), os.path.join(scratch, "a.mp4"))
+    cache.fetch_into("b", _writer(b"bbbb", []), os.path.join(scratch, "b.mp4"))
+    cache.fetch_into("a", _writer(b"aaaa", []), os.path.join(scratch, "a2.mp4"))
+    cache.fetch_into("c", _writer(b"cccc", []), os.path.join(scratch, "c.mp4"))
+
+    names = {path.name for path in (tmp_path / "segments").iterdir()}
+    assert names == {"a.mp4", "c.mp4"}
+    assert Path(scratch, "b.mp4").read_bytes() == b"bbbb"
+    assert cache.get_stats()["size_bytes"] == 8
+
+
+def test_only_stale_fill_files_are_removed_at_startup(tmp_path):
+    """A fill another worker is still writing survives; an abandoned one is removed."""
+    entries = tmp_path / "segments"
+    entries.mkdir()
+    fresh = entries / ".fill-fresh.mp4"
+    stale = entries / ".fill-stale.mp4"
+    fresh.write_bytes(b"partial")
+    stale.write_bytes(b"partial")
+    old = time.time() - SegmentCache.STALE_FILL_SECONDS - 60
+    os.utime(stale, (old, old))
+
+    cache = SegmentCache(cache_dir=str(tmp_path), max_bytes=1024)
+
+    assert fresh.exists()
+    assert not stale.exists()
+    assert cache.get_stats()["entries"] == 0
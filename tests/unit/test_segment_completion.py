@@ -0,0 +1,136 @@
+"""
+Unit tests for idempotent segment completion counting.
+"""
+import sys
+import uuid
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import sessionmaker
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from backend.models import Base, Project, Segment, RenderJob, RenderJobSegmentCompletion
+from backend.models.segment import SegmentStatus
+from backend.models.render_job import RenderJobStatus
+from backend.services.orchestrator import RenderOrchestrator
+
+
+# The models use PostgreSQL types; render them as SQLite equivalents
+@compiles(JSONB, "sqlite")
+def _jsonb_on_sqlite(type_, compiler, **kw):
+    return "JSON"
+
+
+@compiles(UUID, "sqlite")
+def _uuid_on_sqlite(type_, compiler, **kw):
+    return "CHAR(32)"
+
+
+TABLES = [table.__table__ for table in (Project, Segment, RenderJob, RenderJobSegmentCompletion)]
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=TABLES)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def orchestrator():
+    orchestrator = RenderOrchestrator(MagicMock(), MagicMock(), render_cache=MagicMock())
+    orchestrator._trigger_composition = MagicMock(return_value=True)
+    return orchestrator
+
+
+def _render_job(db, segment_ids, total):
+    render_job = RenderJob(
+        id=uuid.uuid4(),
+        project_id=uuid.uuid4(),
+        status=RenderJobStatus.PROCESSING,
+        segments_total=total,
+        segments_completed=0,
+        segment_ids=[str(segment_id) for segment_id in segment_ids]
+    )
+    db.add(render_job)
+    db.commit()
+    return render_job.id
+
+
+def _segment(db):
+    segment = Segment(
+        id=uuid.uuid4(),
+        project_id=uuid.uuid4(),
+        order_index=0,
+        prompt="A cat",
+        model_params={},
+        status=SegmentStatus.GENERATING
+    )
+    db.add(segment)
+    db.commit()
+    return segment.id
+
+
+def test_redelivered_completion_is_counted_once(db, orchestrator):
+    """A second completion of the same segment for the same job is ignored."""
+    segment_id = _segment(db)
+    job_id = _render_job(db, [segment_id, uuid.uuid4()], total=2)
+
+    orchestrator.handle_segment_completion(db, segment_id, job_id, "file:///a.mp4")
+    orchestrator.handle_segment_completion(db, segment_id, job_id, "file:///a.mp4")
+
+    assert db.get(RenderJob, job_id).segments_completed == 1
+    orchestrator._trigger_composition.assert_not_called()
+
+
+def test_overlapping_render_jobs_each_count_the_segment(db, orchestrator):
+    """A segment re-dispatched by a newer job while generating completes both jobs."""
+    segment_id = _segment(db)
+    old_job = _render_job(db, [segment_id], total=1)
+    new_job = _render_job(db, [segment_id], total=1)
+
+    assert orchestrator.handle_segment_completion(db, segment_id, old_job, "file:///old.mp4")
+    assert orchestrator.handle_segment_completion(db, segment_id, new_job, "file:///new.mp4")
+
+    assert db.get(RenderJob, old_job).segments_completed == 1
+    assert db.get(RenderJob, new_job).segments_completed == 1
+    assert orchestrator._trigger_composition.call_count == 2
+    assert db.get(Segment, segment_id).s3_asset_url == "file:///new.mp4"
+
+
+def test_failed_notifications_do_not_block_composition(db, orchestrator):
+    """Redis and RabbitMQ errors after the commit are logged, and the last segment still composes."""
+    segment_id = _segment(db)
+    job_id = _render_job(db, [segment_id], total=1)
+    orchestrator.redis.set_segment_status.side_effect = ConnectionError("redis down")
+    orchestrator.rabbitmq.publish_segment_completed_event.side_effect = ConnectionError("broker down")
+
+    assert orchestrator.handle_segment_completion(db, segment_id, job_id, "file:///a.mp4")
+    orchestrator._trigger_composition.assert_called_once()
+
+
+def test_failed_composition_publish_releases_the_claim(db):
+    """A render job whose composition task could not be published can be claimed again."""
+    orchestrator = RenderOrchestrator(MagicMock(), MagicMock(), render_cache=MagicMock())
+    orchestrator.rabbitmq.publish_composition_task.side_effect = ConnectionError("broker down")
+    segment_id = _segment(db)
+    job_id = _render_job(db, [segment_id], total=1)
+
+    with pytest.raises(ConnectionError):
+        orchestrator.handle_segment_completion(db, segment_id, job_id, "file:///a.mp4")
+
+    render_job = db.get(RenderJob, job_id)
+    db.refresh(render_job)
+    assert render_job.status == RenderJobStatus.PROCESSING
+
+    orchestrator.rabbitmq.publish_composition_task.side_effect = None
+    assert orchestrator._trigger_composition(db, render_job)
+    assert db.get(RenderJob, job_id).status == RenderJobStatus.COMPOSITING
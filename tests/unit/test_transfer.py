@@ -0,0 +1,71 @@
+"""
+Unit tests for streaming generated videos into storage.
+"""
+import asyncio
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+# Add AI worker to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "workers" / "ai_worker"))
+
+from transfer import stream_to_storage
+
+
+async def _chunks(count: int, size: int = 64):
+    for _ in range(count):
+        await asyncio.sleep(0)
+        yield b"x" * size
+
+
+def _slow_upload(stream) -> str:
+    data = b""
+    while True:
+        block = stream.read(64)
+        if not block:
+            return f"stored:{len(data)}"
+        time.sleep(0.001)
+        data += block
+
+
+def test_concurrent_transfers_do_not_need_the_default_executor():
+    """With every default executor thread busy, feeding the pipes still makes progress."""
+    async def main():
+        loop = asyncio.get_running_loop()
+        loop.set_default_executor(ThreadPoolExecutor(max_workers=1))
+        uploads = ThreadPoolExecutor(max_workers=3)
+        try:
+            return await asyncio.wait_for(asyncio.gather(*(
+                stream_to_storage(_chunks(20), _slow_upload, max_buffered_chunks=1, executor=uploads)
+                for _ in range(3)
+            )), timeout=10)
+        finally:
+            uploads.shutdown(wait=False)
+
+    results = asyncio.run(main())
+    assert [url for url, _ in results] == ["stored:1280"] * 3
+    assert all(stats.bytes == 1280 for _, stats in results)
+
+
+def test_source_error_aborts_a_waiting_upload():
+    """A failing download makes the upload fail instead of hanging on an empty pipe."""
+    uploaded = []
+
+    async def failing_chunks():
+        yield b"partial"
+        await asyncio.sleep(0.05)
+        raise ConnectionError("download dropped")
+
+    def upload(stream) -> str:
+        uploaded.append(stream.read())
+        return "stored"
+
+    async def main():
+        await asyncio.wait_for(stream_to_storage(failing_chunks(), upload), timeout=5)
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(main())
+    assert uploaded == []
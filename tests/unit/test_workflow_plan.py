@@ -0,0 +1,86 @@
+"""
+Unit tests for ComfyUI workflow injection plans.
+"""
+import copy
+import sys
+from pathlib import Path
+
+# Add AI worker to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "workers" / "ai_worker"))
+
+from adapters.workflow_plan import InjectionPlan, PlanCache
+
+
+WORKFLOW = {
+    "4": {"class_type": "CheckpointLoaderSimple", "inputs": {"ckpt_name": "sdxl.safetensors"}},
+    "5": {"class_type": "EmptyLatentImage", "inputs": {"width": 512, "height": 512, "batch_size": 1}},
+    "7": {"class_type": "CLIPTextEncode", "inputs": {"text": "blurry", "clip": ["4", 1]}},
+    "12": {"class_type": "CLIPTextEncode", "inputs": {"text": "", "clip": ["4", 1]}},
+    "13": {"class_type": "ConditioningSetArea", "inputs": {"conditioning": ["12", 0], "strength": 1.0}},
+    "3": {
+        "class_type": "KSampler",
+        "inputs": {
+            "seed": 1, "steps": 20, "cfg": 7.0,
+            "model": ["4", 0], "positive": ["13", 0], "negative": ["7", 0], "latent_image": ["5", 0]
+        }
+    },
+}
+
+
+def test_compile_discovers_targets_by_class_type():
+    """The prompt goes to the encoder behind the positive input, not the negative one."""
+    plan = InjectionPlan.compile(WORKFLOW)
+
+    assert plan.prompt_targets == (("12", "text"),)
+    assert plan.sampler_nodes == ("3",)
+    assert plan.seed_targets == (("3", "seed"),)
+    assert plan.models == frozenset({"ckpt_name:sdxl.safetensors"})
+
+
+def test_apply_overlays_without_mutating_template():
+    """Edited nodes are copied, untouched nodes are shared and the template is unchanged."""
+    original = copy.deepcopy(WORKFLOW)
+    plan = InjectionPlan.compile(WORKFLOW)
+
+    body = plan.apply(WORKFLOW, "a cat", {"width": 768, "height": 432, "seed": 9, "steps": 30})
+
+    assert WORKFLOW == original
+    assert body["12"]["inputs"]["text"] == "a cat"
+    assert body["7"]["inputs"]["text"] == "blurry"
+    # Size is opt-in through sampler_node_id
+    assert body["5"] is WORKFLOW["5"]
+    sized = plan.apply(WORKFLOW, "a cat", {"width": 768, "height": 432, "sampler_node_id": "5"})
+    assert sized["5"]["inputs"]["width"] == 768 and sized["5"]["inputs"]["height"] == 432
+    assert body["3"]["inputs"]["seed"] == 9 and body["3"]["inputs"]["steps"] == 30
+    assert body["4"] is WORKFLOW["4"]
+
+
+def test_explicit_prompt_node_and_cache_reuse():
+    """prompt_node_id overrides discovery; equal workflows share one compiled plan."""
+    cache = PlanCache()
+    plan = cache.get(WORKFLOW)
+    assert cache.get(copy.deepcopy(WORKFLOW)) is plan
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    body = plan.apply(WORKFLOW, "override", {"prompt_node_id": "7"})
+    assert body["7"]["inputs"]["text"] == "override"
+    assert body["12"] is WORKFLOW["12"]
+
+
+def test_workflow_object_is_hashed_once(monkeypatch):
+    """Resubmitting the same workflow object reuses its key instead of rehashing."""
+    from adapters import workflow_plan
+
+    hashed = []
+    real_key = workflow_plan.workflow_key
+    monkeypatch.setattr(workflow_plan, "workflow_key", lambda wf: hashed.append(wf) or real_key(wf))
+
+    cache = PlanCache()
+    cache.get(WORKFLOW)
+    cache.get(WORKFLOW)
+    assert len(hashed) == 1
+
+    cache.get(WORKFLOW, key=real_key(WORKFLOW))
+    cache.get(copy.deepcopy(WORKFLOW))
+    assert len(hashed) == 2
+    assert (cache.hits, cache.misses) == (3, 1)
@@ -2,9 +2,11 @@
 Base interface for AI video generation models.
 Implements the Strategy pattern for pluggable model adapters.
 """
+import asyncio
+import httpx
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
 from datetime import datetime
 
@@ -40,16 +42,51 @@ class VideoModelInterface(ABC):
     model adapters must implement, following the Strategy pattern.
     """
 
-    def __init__(self, api_key: str, config: Optional[Dict[str, Any]] = None):
+    def __init__(
+        self,
+        api_key: str,
+        config: Optional[Dict[str, Any]] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
         """
         Initialize the video model adapter.
 
         Args:
             api_key: API key for the video generation service
             config: Additional configuration options
+            transport: Shared HTTP transport (connection pool) owned by the caller.
+                If omitted, the adapter's HTTP client manages its own connections.
         """
         self.api_key = api_key
         self.config = config or {}
+        self.transport = transport
+        self._http_clients: List[httpx.AsyncClient] = []
+
+    def _build_http_client(self, **kwargs) -> httpx.AsyncClient:
+        """
+        Create an HTTP client for this adapter.
+
+        Clients built on a shared transport reuse its keep-alive connections
+        while keeping their own headers and timeouts.
+
+        Args:
+            **kwargs: Arguments for httpx.AsyncClient (timeout, headers, ...)
+
+        Returns:
+            httpx.AsyncClient
+        """
+        client = httpx.AsyncClient(transport=self.transport, **kwargs)
+        self._http_clients.append(client)
+        return client
+
+    async def close(self):
+        """Release HTTP resources owned by this adapter."""
+        if self.transport is not None:
+            # Closing a client closes its transport, which belongs to the caller
+            return
+        for client in self._http_clients:
+            await client.aclose()
+        self._http_clients.clear()
 
     @abstractmethod
     async def initiate_generation(
@@ -117,6 +154,87 @@ class VideoModelInterface(ABC):
         """
         pass
 
+    @property
+    def poll_group(self) -> Any:
+        """
+        Key identifying adapters whose jobs can share one status poller.
+
+        Adapters that keep job state in memory must not share a poller with
+        other instances, so the default is per instance.
+        """
+        return (type(self).__name__, id(self))
+
+    def expected_generation_time(self, external_job_id: str) -> float:
+        """
+        Estimate how long a job takes in total, used to pace status polling.
+
+        Args:
+            external_job_id: Job ID from the external AI service
+
+        Returns:
+            Estimated generation time in seconds
+        """
+        return float(self.config.get("expected_generation_time", 60.0))
+
+    async def get_results_bulk(self, external_job_ids: List[str]) -> Dict[str, Any]:
+        """
+        Retrieve results for several jobs at once.
+
+        The default implementation calls get_result for each job with bounded
+        concurrency. Adapters whose API can report many jobs in one request
+        should override it.
+
+        Args:
+            external_job_ids: Job IDs from the external AI service
+
+        Returns:
+            Mapping of job ID to GenerationResult, or to the exception raised
+            while fetching that job
+        """
+        semaphore = asyncio.Semaphore(self.config.get("max_poll_concurrency", 8))
+
+        async def fetch(job_id: str):
+            async with semaphore:
+                return await self.get_result(job_id)
+
+        results = await asyncio.gather(
+            *(fetch(job_id) for job_id in external_job_ids),
+            return_exceptions=True
+        )
+        return dict(zip(external_job_ids, results))
+
+    async def wait_for_completion(
+        self,
+        external_job_id: str,
+        timeout: float = 180.0
+    ) -> GenerationResult:
+        """
+        Wait until a generation job reaches a terminal state.
+
+        The default implementation hands the job to the provider's shared
+        StatusPoller. Adapters with push-style completion notifications
+        should override it.
+
+        Args:
+            external_job_id: Job ID from the external AI service
+            timeout: Maximum seconds to wait
+
+        Returns:
+            GenerationResult in COMPLETED or FAILED state
+
+        Raises:
+            TimeoutError: If the job does not finish within the timeout
+        """
+        from .poller import StatusPoller
+
+        poller = StatusPoller.for_adapter(self)
+        return await poller.wait(
+            self,
+            external_job_id,
+            expected_duration=self.expected_generation_time(external_job_id),
+            timeout=timeout
+        )
+
     @property
     @abstractmethod
     def model_name(self) -> str:
@@ -7,11 +7,16 @@ import uuid
 import asyncio
 import json
 import logging
-from typing import Dict, Any, Optional
+import os
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
 from .base import VideoModelInterface, GenerationStatus, GenerationResult
+from .comfyui_events import ComfyUIEventListener, WEBSOCKETS_AVAILABLE
+from .comfyui_pool import ComfyUIPool, ComfyUIInstance
+from .workflow_plan import InjectionPlan, PlanCache, workflow_key
+from .poller import StatusPoller
 from .exceptions import (
     ComfyUIConnectionError,
     ComfyUITimeoutError,
@@ -34,26 +39,66 @@ class ComfyUIAdapter(VideoModelInterface):
     and retrieve generated videos.
     """
 
-    def __init__(self, api_key: str = "", config: Optional[Dict[str, Any]] = None):
+    def __init__(
+        self,
+        api_key: str = "",
+        config: Optional[Dict[str, Any]] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
         """
         Initialize ComfyUI adapter.
 
         Args:
             api_key: Not required for local ComfyUI instances, but kept for interface compatibility
             config: Configuration including ComfyUI URL and workflow settings
+            transport: Shared HTTP transport (connection pool)
         """
-        super().__init__(api_key, config)
-        self.comfyui_url = config.get("comfyui_url", "http://comfyui:8188") if config else "http://comfyui:8188"
+        super().__init__(api_key, config, transport)
+        config = config or {}
+        # One or more ComfyUI instances; prompts go to the least loaded one
+        urls = config.get("comfyui_urls") or os.getenv("COMFYUI_URLS") or [
+            config.get("comfyui_url") or os.getenv("COMFYUI_URL") or "http://comfyui:8188"
+        ]
+        if isinstance(urls, str):
+            urls = [url.strip() for url in urls.split(",") if url.strip()]
+        self.comfyui_urls = [url.rstrip("/") for url in urls]
+        self.comfyui_url = self.comfyui_urls[0]
         self.default_workflow = config.get("default_workflow") if config else None
 
         # Configure timeout - longer for generation, shorter for status checks
         self.request_timeout = config.get("request_timeout", 30.0) if config else 30.0
         self.generation_timeout = config.get("generation_timeout", 300.0) if config else 300.0
 
-        self.client = httpx.AsyncClient(timeout=self.request_timeout)
+        # Completion notifications via ComfyUI's /ws progress socket
+        self.use_websocket = config.get("use_websocket", True) if config else True
+        # How often to double-check /history while waiting on the socket
+        self.history_check_interval = config.get("history_check_interval", 30.0) if config else 30.0
+        # Entries requested per bulk /history poll (0 = the whole history)
+        self.history_batch_size = config.get("history_batch_size", 0) if config else 0
+        # ComfyUI's output directory as mounted on this worker, if shared;
+        # outputs are then read from disk instead of downloaded via /view
+        self.output_dir = (config.get("output_dir") if config else None) or os.getenv("COMFYUI_OUTPUT_DIR") or None
+
+        self.client = self._build_http_client(timeout=self.request_timeout)
         self._jobs: Dict[str, Dict[str, Any]] = {}
+        # Injection plans of recently submitted workflows, by content hash
+        self.plans = PlanCache(int(config.get("plan_cache_size", 256)))
+        # The default workflow is hashed once here instead of on every submission
+        self._default_workflow_key = (
+            workflow_key(self.default_workflow) if isinstance(self.default_workflow, dict) else None
+        )
+        self.pool = ComfyUIPool(
+            self.comfyui_urls,
+            self.client,
+            refresh_interval=float(
+                config.get("pool_refresh_interval") or os.getenv("COMFYUI_POOL_REFRESH_SECONDS") or 2.0
+            ),
+            model_swap_penalty=float(
+                config.get("model_swap_penalty") or os.getenv("COMFYUI_MODEL_SWAP_PENALTY") or 2.0
+            )
+        )
 
-        logger.info(f"ComfyUIAdapter initialized with URL: {self.comfyui_url}")
+        logger.info(f"ComfyUIAdapter initialized with URLs: {', '.join(self.comfyui_urls)}")
 
     @property
     def model_name(self) -> str:
@@ -63,39 +108,76 @@ class ComfyUIAdapter(VideoModelInterface):
         """
         Check if ComfyUI is reachable and responsive.
 
+        With several instances the adapter is healthy while any of them is,
+        and per-instance health, queue depth and throughput are included.
+
+        Returns:
+            Dictionary with health status information
+        """
+        if len(self.comfyui_urls) == 1:
+            return await self._check_instance(self.comfyui_url)
+
+        checks = await asyncio.gather(*(self._check_instance(url) for url in self.comfyui_urls))
+        instances = [
+            {**stats, "status": check["status"]}
+            for check, stats in zip(checks, self.pool.get_stats())
+        ]
+        healthy = any(check["status"] == "healthy" for check in checks)
+        return {
+            "status": "healthy" if healthy else "unreachable",
+            "url": self.comfyui_url,
+            "instances": instances
+        }
+
+    async def _check_instance(self, url: str) -> Dict[str, Any]:
+        """
+        Check if one ComfyUI instance is reachable and responsive.
+
+        Args:
+            url: ComfyUI base URL
+
         Returns:
             Dictionary with health status information
         """
         try:
-            response = await self.client.get(f"{self.comfyui_url}/system_stats", timeout=5.0)
+            response = await self.client.get(f"{url}/system_stats", timeout=5.0)
             response.raise_for_status()
             return {
                 "status": "healthy",
-                "url": self.comfyui_url,
+                "url": url,
                 "details": response.json()
             }
         except httpx.TimeoutException:
-            logger.warning(f"ComfyUI health check timed out: {self.comfyui_url}")
+            logger.warning(f"ComfyUI health check timed out: {url}")
             return {
                 "status": "timeout",
-                "url": self.comfyui_url,
+                "url": url,
                 "error": "Health check timed out"
             }
         except httpx.ConnectError as e:
-            logger.warning(f"ComfyUI health check connection failed: {self.comfyui_url}")
+            logger.warning(f"ComfyUI health check connection failed: {url}")
             return {
                 "status": "unreachable",
-                "url": self.comfyui_url,
+                "url": url,
                 "error": "Cannot connect to ComfyUI service"
             }
         except Exception as e:
             logger.error(f"ComfyUI health check error: {e}")
             return {
                 "status": "error",
-                "url": self.comfyui_url,
+                "url": url,
                 "error": str(e)
             }
 
+    def get_pool_stats(self) -> List[Dict[str, Any]]:
+        """
+        Get queue depth and throughput of each ComfyUI instance.
+
+        Returns:
+            One stats dictionary per instance
+        """
+        return self.pool.get_stats()
+
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10),
@@ -141,21 +223,61 @@ class ComfyUIAdapter(VideoModelInterface):
 
         # Inject prompt into workflow
         try:
-            workflow_with_prompt = self._inject_prompt(workflow, prompt, model_params)
+            key = self._default_workflow_key if workflow is self.default_workflow else None
+            plan = self.plans.get(workflow, key)
+            workflow_with_prompt = self._inject_prompt(workflow, prompt, model_params, plan)
         except Exception as e:
             logger.error(f"Failed to inject prompt into workflow: {e}")
             raise ComfyUIWorkflowError(f"Failed to process workflow: {str(e)}")
 
-        # Generate client ID for this request
-        client_id = str(uuid.uuid4())
+        # Fail over to another instance if the chosen one is unreachable;
+        # prefer one that already has the workflow's models loaded
+        for attempt in range(len(self.pool.instances)):
+            instance = await self.pool.choose(plan.models)
+            try:
+                return await self._submit(instance, workflow_with_prompt, prompt, model_params, plan)
+            except httpx.ConnectError as e:
+                logger.error(f"Cannot connect to ComfyUI at {instance.url}: {e}")
+                self.pool.mark_unhealthy(instance)
+
+        raise ComfyUIConnectionError(url=instance.url)
+
+    async def _submit(
+        self,
+        instance: ComfyUIInstance,
+        workflow: Dict[str, Any],
+        prompt: str,
+        model_params: Dict[str, Any],
+        plan: InjectionPlan
+    ) -> str:
+        """
+        Submit a prepared workflow to one ComfyUI instance.
+
+        Args:
+            instance: Instance to submit to
+            workflow: Workflow with the prompt injected
+            prompt: Text prompt (kept for the job record)
+            model_params: Model parameters (kept for the job record)
+            plan: Injection plan of the workflow (for its model loaders)
+
+        Returns:
+            prompt_id: Unique identifier for the ComfyUI job
+
+        Raises:
+            httpx.ConnectError: If the instance is unreachable
+        """
+        # Submit under the worker's progress socket client ID so completion
+        # events for this prompt are delivered to it
+        listener = self._get_event_listener(instance.url)
+        client_id = listener.client_id if listener else str(uuid.uuid4())
 
         # Submit prompt to ComfyUI
         try:
-            logger.debug(f"Submitting workflow to {self.comfyui_url}/prompt")
+            logger.debug(f"Submitting workflow to {instance.url}/prompt")
             response = await self.client.post(
-                f"{self.comfyui_url}/prompt",
+                f"{instance.url}/prompt",
                 json={
-                    "prompt": workflow_with_prompt,
+                    "prompt": workflow,
                     "client_id": client_id
                 }
             )
@@ -167,25 +289,30 @@ class ComfyUIAdapter(VideoModelInterface):
                 logger.error("No prompt_id in ComfyUI response")
                 raise ComfyUIGenerationError("No prompt_id returned from ComfyUI")
 
+            self.pool.assign(prompt_id, instance, plan.models)
+            if listener:
+                # Register before any completion event can be missed
+                listener.watch(prompt_id)
+
             # Store job info
             self._jobs[prompt_id] = {
                 "status": GenerationStatus.PROCESSING,
                 "prompt": prompt,
                 "model_params": model_params,
                 "client_id": client_id,
-                "started_at": datetime.utcnow()
+                "started_at": datetime.utcnow(),
+                "loader_nodes": list(plan.loaders)
             }
 
-            logger.info(f"ComfyUI generation initiated successfully: prompt_id={prompt_id}")
+            logger.info(f"ComfyUI generation initiated successfully on {instance.url}: prompt_id={prompt_id}")
             return prompt_id
 
         except httpx.TimeoutException as e:
             logger.error(f"ComfyUI request timed out: {e}")
-            raise ComfyUITimeoutError(url=self.comfyui_url, timeout=int(self.request_timeout))
+            raise ComfyUITimeoutError(url=instance.url, timeout=int(self.request_timeout))
 
-        except httpx.ConnectError as e:
-            logger.error(f"Cannot connect to ComfyUI at {self.comfyui_url}: {e}")
-            raise ComfyUIConnectionError(url=self.comfyui_url)
+        except httpx.ConnectError:
+            raise
 
         except httpx.HTTPStatusError as e:
             error_detail = ""
@@ -209,52 +336,244 @@ class ComfyUIAdapter(VideoModelInterface):
             logger.error(f"ComfyUI HTTP error: {e}")
             raise ComfyUIConnectionError(
                 message=f"HTTP error communicating with ComfyUI: {str(e)}",
-                url=self.comfyui_url
+                url=instance.url
+            )
+
+    def _get_event_listener(self, url: Optional[str] = None) -> Optional[ComfyUIEventListener]:
+        """
+        Get the shared progress socket listener for a ComfyUI instance.
+
+        Args:
+            url: Instance base URL (default: the primary instance)
+
+        Returns:
+            Running listener, or None if websocket notifications are disabled
+        """
+        if not self.use_websocket or not WEBSOCKETS_AVAILABLE:
+            return None
+        return ComfyUIEventListener.shared(url or self.comfyui_url)
+
+    @property
+    def poll_group(self) -> Any:
+        """All adapters talking to the same ComfyUI instances share one poller."""
+        return ("comfyui", tuple(self.comfyui_urls))
+
+    def expected_generation_time(self, external_job_id: str) -> float:
+        """Estimate generation time from config, defaulting to a fifth of the timeout."""
+        return float(self.config.get("expected_generation_time", self.generation_timeout / 5))
+
+    async def get_results_bulk(self, external_job_ids: List[str]) -> Dict[str, Any]:
+        """
+        Retrieve results for many ComfyUI jobs with a single /history request.
+
+        Args:
+            external_job_ids: ComfyUI prompt_ids
+
+        Returns:
+            Mapping of prompt_id to GenerationResult
+        """
+        # Each instance only knows its own prompts
+        by_url: Dict[str, List[str]] = {}
+        for job_id in external_job_ids:
+            by_url.setdefault(self.pool.url_for(job_id), []).append(job_id)
+
+        results: Dict[str, Any] = {}
+        for partial in await asyncio.gather(
+            *(self._get_instance_results(url, job_ids) for url, job_ids in by_url.items())
+        ):
+            results.update(partial)
+        return results
+
+    async def _get_instance_results(self, url: str, external_job_ids: List[str]) -> Dict[str, Any]:
+        """
+        Retrieve results for one instance's jobs with a single /history request.
+
+        Args:
+            url: Instance base URL
+            external_job_ids: ComfyUI prompt_ids owned by the instance
+
+        Returns:
+            Mapping of prompt_id to GenerationResult
+        """
+        params = {"max_items": self.history_batch_size} if self.history_batch_size else None
+        try:
+            response = await self.client.get(f"{url}/history", params=params)
+            response.raise_for_status()
+            history = response.json()
+        except httpx.ConnectError as e:
+            logger.error(f"Cannot connect to ComfyUI for bulk status poll: {e}")
+            raise ComfyUIConnectionError(url=url)
+        except httpx.TimeoutException:
+            logger.warning("Bulk status poll timed out, treating jobs as still processing")
+            return {}
+        except httpx.HTTPError as e:
+            logger.error(f"HTTP error during bulk status poll: {e}")
+            return {}
+
+        results = {
+            job_id: self._result_from_history(job_id, history)
+            for job_id in external_job_ids
+            if job_id in history
+        }
+
+        # A capped history window may not reach older jobs; ask for those directly
+        missing = [job_id for job_id in external_job_ids if job_id not in history]
+        if missing and self.history_batch_size:
+            results.update(await super().get_results_bulk(missing))
+
+        return results
+
+    async def wait_for_completion(
+        self,
+        external_job_id: str,
+        timeout: float = 180.0
+    ) -> GenerationResult:
+        """
+        Wait for a ComfyUI job to finish using progress socket events.
+
+        While the socket is connected this waits on the completion event and
+        only reads /history once the prompt has finished (plus an occasional
+        safety check). While the socket is down the job is handed to the
+        shared StatusPoller until the socket reconnects.
+
+        Args:
+            external_job_id: ComfyUI prompt_id
+            timeout: Maximum seconds to wait
+
+        Returns:
+            GenerationResult in COMPLETED or FAILED state
+
+        Raises:
+            TimeoutError: If the job does not finish within the timeout
+        """
+        succeeded = False
+        try:
+            result = await self._wait_for_events(external_job_id, timeout)
+            succeeded = result.status == GenerationStatus.COMPLETED
+            return result
+        finally:
+            # Feeds the owning instance's throughput figures
+            self.pool.release(external_job_id, succeeded)
+
+    async def _wait_for_events(self, external_job_id: str, timeout: float) -> GenerationResult:
+        """Wait for a job on its instance's progress socket (see wait_for_completion)."""
+        listener = self._get_event_listener(self.pool.url_for(external_job_id))
+        if listener is None:
+            return await super().wait_for_completion(external_job_id, timeout)
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        future = listener.watch(external_job_id)
+        poller = StatusPoller.for_adapter(self)
+
+        try:
+            while True:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    raise TimeoutError(f"Generation timed out after {timeout:.0f} seconds")
+
+                if not listener.connected and not future.done():
+                    # Socket is down: poll until it comes back or the job finishes
+                    poll_future = poller.watch(
+                        self, external_job_id, self.expected_generation_time(external_job_id)
+                    )
+                    reconnected = asyncio.ensure_future(listener.wait_connected(remaining))
+                    try:
+                        await asyncio.wait(
+                            {asyncio.shield(poll_future), asyncio.shield(future), reconnected},
+                            timeout=remaining,
+                            return_when=asyncio.FIRST_COMPLETED
+                        )
+                        if poll_future.done() and not poll_future.cancelled():
+                            return poll_future.result()
+                    finally:
+                        reconnected.cancel()
+                        poller.unwatch(external_job_id)
+                    continue
+
+                if not future.done():
+                    try:
+                        await asyncio.wait_for(
+                            asyncio.shield(future),
+                            timeout=min(self.history_check_interval, remaining)
+                        )
+                    except asyncio.TimeoutError:
+                        pass
+
+                result = await self.get_result(external_job_id)
+                if result.status in (GenerationStatus.COMPLETED, GenerationStatus.FAILED):
+                    if future.done():
+                        self._record_model_load(external_job_id, future.result())
+                    return result
+
+                if future.done():
+                    event = future.result()
+                    if event["event"] != "success":
+                        error_exception = ComfyUIGenerationError(
+                            details=event.get("exception_message") or "Execution was interrupted"
+                        )
+                        return GenerationResult(
+                            status=GenerationStatus.FAILED,
+                            error_message=error_exception.message,
+                            external_job_id=external_job_id,
+                            metadata={"error_code": error_exception.error_code}
+                        )
+                    # Finished event seen but /history not written yet
+                    await asyncio.sleep(min(0.25, max(deadline - loop.time(), 0)))
+        finally:
+            listener.forget(external_job_id)
+            # Pooled adapters live for the whole worker; don't keep finished jobs
+            self._jobs.pop(external_job_id, None)
+
+    def _record_model_load(self, external_job_id: str, event: Dict[str, Any]):
+        """
+        Report how long a finished prompt spent loading models.
+
+        Args:
+            external_job_id: ComfyUI prompt_id
+            event: Completion event from the progress socket
+        """
+        job = self._jobs.get(external_job_id)
+        if not job or not job.get("loader_nodes") or event.get("event") != "success":
+            return
+
+        # Loader nodes ComfyUI served from its cache did not run at all
+        node_seconds = event.get("node_seconds") or {}
+        seconds = sum(node_seconds.get(node, 0.0) for node in job["loader_nodes"])
+        self.pool.record_model_load(external_job_id, seconds)
+        if seconds > 0:
+            logger.info(
+                f"ComfyUI job {external_job_id} spent {seconds:.1f}s loading models "
+                f"on {self.pool.url_for(external_job_id)}"
             )
 
     def _inject_prompt(
         self,
         workflow: Dict[str, Any],
         prompt: str,
-        model_params: Dict[str, Any]
+        model_params: Dict[str, Any],
+        plan: Optional[InjectionPlan] = None
     ) -> Dict[str, Any]:
         """
         Inject prompt and parameters into ComfyUI workflow.
 
-        This method looks for text input nodes in the workflow and replaces
-        their text with the provided prompt. Override this method for custom
-        workflow structures.
+        Targets come from the workflow's compiled injection plan (prompt
+        encoders feeding the sampler, seed and sampler inputs); width and
+        height go to model_params["sampler_node_id"] if given. See
+        adapters.workflow_plan. The workflow itself is never
+        modified. Override this method for custom workflow structures.
 
         Args:
             workflow: ComfyUI workflow JSON
             prompt: Text prompt to inject
             model_params: Additional parameters to inject
+            plan: Compiled plan for workflow (looked up if omitted)
 
         Returns:
-            Modified workflow with injected values
+            Workflow with injected values, sharing unmodified nodes with workflow
         """
-        workflow = workflow.copy()
-
-        # Find and update text input nodes
-        # Common node types: "CLIPTextEncode", "TextNode", etc.
-        prompt_node_id = model_params.get("prompt_node_id", "6")  # Default node ID for prompts
-
-        if prompt_node_id in workflow:
-            if "inputs" in workflow[prompt_node_id]:
-                workflow[prompt_node_id]["inputs"]["text"] = prompt
-
-        # Inject other parameters (resolution, steps, etc.)
-        if "width" in model_params and "sampler_node_id" in model_params:
-            sampler_id = model_params["sampler_node_id"]
-            if sampler_id in workflow and "inputs" in workflow[sampler_id]:
-                workflow[sampler_id]["inputs"]["width"] = model_params["width"]
-
-        if "height" in model_params and "sampler_node_id" in model_params:
-            sampler_id = model_params["sampler_node_id"]
-            if sampler_id in workflow and "inputs" in workflow[sampler_id]:
-                workflow[sampler_id]["inputs"]["height"] = model_params["height"]
-
-        return workflow
+        plan = plan or self.plans.get(workflow)
+        return plan.apply(workflow, prompt, model_params)
 
     async def get_status(self, external_job_id: str) -> GenerationStatus:
         """
@@ -269,8 +588,9 @@ class ComfyUIAdapter(VideoModelInterface):
         Raises:
             ComfyUIConnectionError: If cannot connect to ComfyUI
         """
+        url = self.pool.url_for(external_job_id)
         try:
-            response = await self.client.get(f"{self.comfyui_url}/history/{external_job_id}")
+            response = await self.client.get(f"{url}/history/{external_job_id}")
             response.raise_for_status()
             history = response.json()
 
@@ -296,7 +616,7 @@ class ComfyUIAdapter(VideoModelInterface):
 
         except httpx.ConnectError as e:
             logger.error(f"Cannot connect to ComfyUI for status check: {e}")
-            raise ComfyUIConnectionError(url=self.comfyui_url)
+            raise ComfyUIConnectionError(url=url)
 
         except httpx.TimeoutException as e:
             logger.warning(f"Status check timed out for job {external_job_id}")
@@ -322,108 +642,17 @@ class ComfyUIAdapter(VideoModelInterface):
             ComfyUIConnectionError: If cannot connect to ComfyUI
             ComfyUIOutputError: If no valid output was produced
         """
+        url = self.pool.url_for(external_job_id)
         try:
-            response = await self.client.get(f"{self.comfyui_url}/history/{external_job_id}")
+            response = await self.client.get(f"{url}/history/{external_job_id}")
             response.raise_for_status()
             history = response.json()
 
-            if external_job_id not in history:
-                logger.debug(f"Job {external_job_id} not in history, still processing")
-                return GenerationResult(
-                    status=GenerationStatus.PROCESSING,
-                    external_job_id=external_job_id
-                )
-
-            job_info = history[external_job_id]
-
-            # Check for errors
-            if job_info.get("status", {}).get("status_str") == "error":
-                error_messages = job_info.get("status", {}).get("messages", [])
-                error_detail = "; ".join([str(msg) for msg in error_messages]) if error_messages else "Unknown error"
-
-                logger.error(f"ComfyUI job {external_job_id} failed: {error_detail}")
-
-                # Try to determine error type from message
-                error_lower = error_detail.lower()
-                if "node" in error_lower and ("not found" in error_lower or "missing" in error_lower):
-                    error_exception = ComfyUIMissingNodeError(details=error_detail)
-                elif "timeout" in error_lower:
-                    error_exception = ComfyUITimeoutError(message=error_detail)
-                elif "parameter" in error_lower or "invalid" in error_lower:
-                    error_exception = ComfyUIInvalidParametersError(details=error_detail)
-                else:
-                    error_exception = ComfyUIGenerationError(details=error_detail)
-
-                return GenerationResult(
-                    status=GenerationStatus.FAILED,
-                    error_message=error_exception.message,
-                    external_job_id=external_job_id,
-                    metadata={"error_code": error_exception.error_code}
-                )
-
-            # Check if job has completed and get outputs
-            if "outputs" not in job_info:
-                logger.debug(f"Job {external_job_id} has no outputs yet, still processing")
-                return GenerationResult(
-                    status=GenerationStatus.PROCESSING,
-                    external_job_id=external_job_id
-                )
-
-            outputs = job_info["outputs"]
-
-            # Find video/image outputs
-            video_url = None
-            media_type = None
-            for node_id, node_output in outputs.items():
-                if "videos" in node_output or "gifs" in node_output:
-                    # Get first video
-                    media_list = node_output.get("videos", node_output.get("gifs", []))
-                    if media_list:
-                        filename = media_list[0]["filename"]
-                        # Construct URL to retrieve the file
-                        video_url = f"{self.comfyui_url}/view?filename={filename}&type=output"
-                        media_type = "video"
-                        logger.info(f"Found video output: {filename}")
-                        break
-                elif "images" in node_output:
-                    # Fallback to images if no video
-                    images = node_output["images"]
-                    if images:
-                        filename = images[0]["filename"]
-                        video_url = f"{self.comfyui_url}/view?filename={filename}&type=output"
-                        media_type = "image"
-                        logger.info(f"Found image output: {filename}")
-                        break
-
-            if not video_url:
-                logger.error(f"No video or image output found for job {external_job_id}")
-                error_exception = ComfyUIOutputError()
-                return GenerationResult(
-                    status=GenerationStatus.FAILED,
-                    error_message=error_exception.message,
-                    external_job_id=external_job_id,
-                    metadata={"error_code": error_exception.error_code}
-                )
-
-            job_data = self._jobs.get(external_job_id, {})
-
-            logger.info(f"ComfyUI job {external_job_id} completed successfully")
-            return GenerationResult(
-                status=GenerationStatus.COMPLETED,
-                video_url=video_url,
-                external_job_id=external_job_id,
-                metadata={
-                    "prompt": job_data.get("prompt", ""),
-                    "model_params": job_data.get("model_params", {}),
-                    "comfyui_outputs": outputs,
-                    "media_type": media_type
-                },
-                completed_at=datetime.utcnow()
-            )
+            return self._result_from_history(external_job_id, history)
 
         except httpx.ConnectError as e:
             logger.error(f"Cannot connect to ComfyUI to retrieve result: {e}")
-            raise ComfyUIConnectionError(url=self.comfyui_url)
+            raise ComfyUIConnectionError(url=url)
 
         except httpx.TimeoutException as e:
             logger.error(f"Timeout retrieving result for job {external_job_id}")
@@ -433,9 +662,150 @@ class ComfyUIAdapter(VideoModelInterface):
             logger.error(f"HTTP error retrieving result: {e}")
             raise ComfyUIConnectionError(
                 message=f"Failed to retrieve ComfyUI result: {str(e)}",
-                url=self.comfyui_url
+                url=url
+            )
+
+    def _result_from_history(
+        self,
+        external_job_id: str,
+        history: Dict[str, Any]
+    ) -> GenerationResult:
+        """
+        Build a GenerationResult for a job from a ComfyUI /history payload.
+
+        Args:
+            external_job_id: ComfyUI prompt_id
+            history: /history response (single job or many)
+
+        Returns:
+            GenerationResult for the job (PROCESSING if it is not in the history)
+        """
+        if external_job_id not in history:
+            logger.debug(f"Job {external_job_id} not in history, still processing")
+            return GenerationResult(
+                status=GenerationStatus.PROCESSING,
+                external_job_id=external_job_id
+            )
+
+        job_info = history[external_job_id]
+
+        # Check for errors
+        if job_info.get("status", {}).get("status_str") == "error":
+            error_messages = job_info.get("status", {}).get("messages", [])
+            error_detail = "; ".join([str(msg) for msg in error_messages]) if error_messages else "Unknown error"
+
+            logger.error(f"ComfyUI job {external_job_id} failed: {error_detail}")
+
+            # Try to determine error type from message
+            error_lower = error_detail.lower()
+            if "node" in error_lower and ("not found" in error_lower or "missing" in error_lower):
+                error_exception = ComfyUIMissingNodeError(details=error_detail)
+            elif "timeout" in error_lower:
+                error_exception = ComfyUITimeoutError(message=error_detail)
+            elif "parameter" in error_lower or "invalid" in error_lower:
+                error_exception = ComfyUIInvalidParametersError(details=error_detail)
+            else:
+                error_exception = ComfyUIGenerationError(details=error_detail)
+
+            return GenerationResult(
+                status=GenerationStatus.FAILED,
+                error_message=error_exception.message,
+                external_job_id=external_job_id,
+                metadata={"error_code": error_exception.error_code}
             )
 
+        # Check if job has completed and get outputs
+        if "outputs" not in job_info:
+            logger.debug(f"Job {external_job_id} has no outputs yet, still processing")
+            return GenerationResult(
+                status=GenerationStatus.PROCESSING,
+                external_job_id=external_job_id
+            )
+
+        outputs = job_info["outputs"]
+
+        # Find video/image outputs
+        video_url = None
+        media_type = None
+        for node_id, node_output in outputs.items():
+            if "videos" in node_output or "gifs" in node_output:
+                # Get first video
+                media_list = node_output.get("videos", node_output.get("gifs", []))
+                if media_list:
+                    filename = media_list[0]["filename"]
+                    video_url = self._output_url(media_list[0], self.pool.url_for(external_job_id))
+                    media_type = "video"
+                    logger.info(f"Found video output: {filename}")
+                    break
+            elif "images" in node_output:
+                # Fallback to images if no video
+                images = node_output["images"]
+                if images:
+                    filename = images[0]["filename"]
+                    video_url = self._output_url(images[0], self.pool.url_for(external_job_id))
+                    media_type = "image"
+                    logger.info(f"Found image output: {filename}")
+                    break
+
+        if not video_url:
+            logger.error(f"No video or image output found for job {external_job_id}")
+            error_exception = ComfyUIOutputError()
+            return GenerationResult(
+                status=GenerationStatus.FAILED,
+                error_message=error_exception.message,
+                external_job_id=external_job_id,
+                metadata={"error_code": error_exception.error_code}
+            )
+
+        job_data = self._jobs.get(external_job_id, {})
+
+        logger.info(f"ComfyUI job {external_job_id} completed successfully")
+        return GenerationResult(
+            status=GenerationStatus.COMPLETED,
+            video_url=video_url,
+            external_job_id=external_job_id,
+            metadata={
+                "prompt": job_data.get("prompt", ""),
+                "model_params": job_data.get("model_params", {}),
+                "comfyui_outputs": outputs,
+                "media_type": media_type
+            },
+            completed_at=datetime.utcnow()
+        )
+
+    def _output_url(self, output: Dict[str, Any], base_url: str) -> str:
+        """
+        Build the URL of an output file from a /history output entry.
+
+        Args:
+            output: Output entry with filename, subfolder and type
+            base_url: Base URL of the instance that produced it
+
+        Returns:
+            file:// URL if the file is in the shared output directory,
+            otherwise a /view URL to download it from ComfyUI
+        """
+        filename = output["filename"]
+        subfolder = output.get("subfolder", "")
+        output_type = output.get("type", "output")
+
+        if self.output_dir and output_type == "output":
+            # subfolder and filename come from ComfyUI; never follow them out of output_dir
+            root = os.path.realpath(self.output_dir)
+            path = os.path.realpath(os.path.join(root, subfolder, filename))
+            if os.path.commonpath([root, path]) != root:
+                logger.warning(f"Ignoring output path {path} outside {root}")
+            elif os.path.isfile(path):
+                return f"file://{path}"
+            else:
+                logger.debug(f"Output {path} not found on the shared volume, downloading it")
+
+        # Construct URL to retrieve the file
+        url = f"{base_url}/view?filename={filename}&type={output_type}"
+        if subfolder:
+            url += f"&subfolder={subfolder}"
+        return url
+
     async def cancel_generation(self, external_job_id: str) -> bool:
         """
         Cancel a ComfyUI generation job.
@@ -449,7 +819,7 @@ class ComfyUIAdapter(VideoModelInterface):
         try:
             logger.info(f"Cancelling ComfyUI job {external_job_id}")
             # ComfyUI's interrupt endpoint
-            response = await self.client.post(f"{self.comfyui_url}/interrupt")
+            response = await self.client.post(f"{self.pool.url_for(external_job_id)}/interrupt")
             response.raise_for_status()
 
             # Update local job status
@@ -465,4 +835,4 @@ class ComfyUIAdapter(VideoModelInterface):
     async def close(self):
         """Close the HTTP client."""
         logger.info("Closing ComfyUIAdapter HTTP client")
-        await self.client.aclose()
+        await super().close()
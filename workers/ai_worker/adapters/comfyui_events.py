@@ -0,0 +1,271 @@
+"""
+ComfyUI progress socket listener.
+
+Keeps a single ComfyUI websocket per worker (one ``client_id``) and resolves
+completion futures from ``executing``/``executed``/``execution_error`` events,
+so the adapter does not have to poll ``/history`` for every job. The same
+events time each node's execution, which is how model load time is measured.
+"""
+import asyncio
+import json
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
+
+try:
+    import websockets
+    WEBSOCKETS_AVAILABLE = True
+except ImportError:
+    websockets = None
+    WEBSOCKETS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+class ComfyUIEventListener:
+    """
+    Listens on ComfyUI's ``/ws`` progress socket and tracks prompt completion.
+
+    Futures returned by :meth:`watch` resolve with a dict describing how the
+    prompt finished (``{"event": "success" | "error" | "interrupted", ...}``),
+    including ``node_seconds`` (execution time per node ID) and
+    ``cached_nodes`` (nodes ComfyUI reused from its cache without running).
+    The listener reconnects with exponential backoff if the socket drops;
+    callers should check :attr:`connected` and fall back to polling while it
+    is down.
+    """
+
+    # Shared listeners, keyed by (event loop, ComfyUI base URL)
+    _instances: Dict[Tuple[int, str], "ComfyUIEventListener"] = {}
+
+    # How many finished prompt ids to remember for late watchers
+    FINISHED_HISTORY_SIZE = 2048
+
+    def __init__(self, base_url: str, client_id: Optional[str] = None):
+        """
+        Initialize the listener.
+
+        Args:
+            base_url: ComfyUI HTTP base URL (e.g. http://comfyui:8188)
+            client_id: Client ID to register with ComfyUI (generated if omitted)
+        """
+        self.base_url = base_url.rstrip("/")
+        self.client_id = client_id or str(uuid.uuid4())
+        self.ws_url = self._to_ws_url(self.base_url) + f"/ws?clientId={self.client_id}"
+
+        self._waiters: Dict[str, asyncio.Future] = {}
+        self._finished: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._outputs: Dict[str, Dict[str, Any]] = {}
+        # prompt_id -> (node currently executing, when it started)
+        self._running_node: Dict[str, Tuple[Optional[str], float]] = {}
+        self._node_seconds: Dict[str, Dict[str, float]] = {}
+        self._cached_nodes: Dict[str, List[str]] = {}
+        self._connected = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+
+    @classmethod
+    def shared(cls, base_url: str) -> "ComfyUIEventListener":
+        """
+        Get (and start) the listener shared by all adapters on the running loop.
+
+        Args:
+            base_url: ComfyUI HTTP base URL
+
+        Returns:
+            Running ComfyUIEventListener
+        """
+        loop = asyncio.get_running_loop()
+        key = (id(loop), base_url.rstrip("/"))
+        listener = cls._instances.get(key)
+        if listener is None or listener._closed:
+            listener = cls(base_url)
+            cls._instances[key] = listener
+        listener.start()
+        return listener
+
+    @classmethod
+    async def close_all(cls):
+        """Close every shared listener bound to the running loop."""
+        loop_id = id(asyncio.get_running_loop())
+        for key in [k for k in cls._instances if k[0] == loop_id]:
+            await cls._instances.pop(key).close()
+
+    @staticmethod
+    def _to_ws_url(base_url: str) -> str:
+        if base_url.startswith("https://"):
+            return "wss://" + base_url[len("https://"):]
+        if base_url.startswith("http://"):
+            return "ws://" + base_url[len("http://"):]
+        return base_url
+
+    @property
+    def connected(self) -> bool:
+        """Whether the progress socket is currently connected."""
+        return self._connected.is_set()
+
+    def start(self):
+        """Start the background receive loop if it is not running."""
+        if not WEBSOCKETS_AVAILABLE or self._closed:
+            return
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name=f"comfyui-ws-{self.client_id[:8]}")
+
+    async def close(self):
+        """Stop the receive loop and fail any outstanding waiters."""
+        self._closed = True
+        self._connected.clear()
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, Exception):
+                pass
+        for future in self._waiters.values():
+            if not future.done():
+                future.cancel()
+        self._waiters.clear()
+
+    def watch(self, prompt_id: str) -> asyncio.Future:
+        """
+        Get a future that resolves when the prompt finishes.
+
+        Args:
+            prompt_id: ComfyUI prompt_id
+
+        Returns:
+            Future resolving to the completion event dict
+        """
+        future = self._waiters.get(prompt_id)
+        if future is not None:
+            return future
+
+        future = asyncio.get_running_loop().create_future()
+        finished = self._finished.get(prompt_id)
+        if finished is not None:
+            future.set_result(finished)
+        else:
+            self._waiters[prompt_id] = future
+        return future
+
+    def forget(self, prompt_id: str):
+        """Drop any state kept for a prompt."""
+        self._waiters.pop(prompt_id, None)
+        self._outputs.pop(prompt_id, None)
+        self._finished.pop(prompt_id, None)
+        self._running_node.pop(prompt_id, None)
+        self._node_seconds.pop(prompt_id, None)
+        self._cached_nodes.pop(prompt_id, None)
+
+    async def wait_connected(self, timeout: float) -> bool:
+        """
+        Wait until the socket is connected.
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if connected within the timeout
+        """
+        if not WEBSOCKETS_AVAILABLE:
+            return False
+        try:
+            await asyncio.wait_for(self._connected.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def _run(self):
+        """Receive loop with reconnect and exponential backoff."""
+        backoff = 1.0
+        while not self._closed:
+            try:
+                async with websockets.connect(self.ws_url, max_size=None, ping_interval=20) as ws:
+                    logger.info(f"Connected to ComfyUI progress socket at {self.base_url}")
+                    self._connected.set()
+                    backoff = 1.0
+                    async for raw in ws:
+                        if isinstance(raw, bytes):
+                            # Binary frames carry preview images
+                            continue
+                        self._handle_message(raw)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"ComfyUI progress socket error ({self.base_url}): {e}")
+            finally:
+                self._connected.clear()
+
+            if self._closed:
+                break
+            logger.info(f"Reconnecting to ComfyUI progress socket in {backoff:.0f}s")
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, 30.0)
+
+    def _handle_message(self, raw: str):
+        """Dispatch a single JSON event from the socket."""
+        try:
+            message = json.loads(raw)
+        except json.JSONDecodeError:
+            return
+
+        event_type = message.get("type")
+        data = message.get("data") or {}
+        prompt_id = data.get("prompt_id")
+        if not prompt_id:
+            return
+
+        if event_type == "executed":
+            # Per-node output; keep it so the result is available without /history
+            outputs = self._outputs.setdefault(prompt_id, {})
+            outputs[str(data.get("node"))] = data.get("output") or {}
+        elif event_type == "execution_start":
+            self._running_node[prompt_id] = (None, time.monotonic())
+        elif event_type == "execution_cached":
+            self._cached_nodes[prompt_id] = [str(node) for node in data.get("nodes") or []]
+        elif event_type == "executing" and data.get("node") is not None:
+            self._node_started(prompt_id, str(data["node"]))
+        elif event_type == "executing":
+            self._finish(prompt_id, {"event": "success"})
+        elif event_type == "execution_success":
+            self._finish(prompt_id, {"event": "success"})
+        elif event_type == "execution_error":
+            self._finish(prompt_id, {
+                "event": "error",
+                "exception_message": data.get("exception_message"),
+                "exception_type": data.get("exception_type"),
+                "node_type": data.get("node_type")
+            })
+        elif event_type == "execution_interrupted":
+            self._finish(prompt_id, {"event": "interrupted"})
+
+    def _node_started(self, prompt_id: str, node: Optional[str]):
+        """Close the timing of the node that was running and start the next."""
+        now = time.monotonic()
+        running, started = self._running_node.get(prompt_id, (None, now))
+        if running is not None:
+            timings = self._node_seconds.setdefault(prompt_id, {})
+            timings[running] = timings.get(running, 0.0) + now - started
+        if node is None:
+            self._running_node.pop(prompt_id, None)
+        else:
+            self._running_node[prompt_id] = (node, now)
+
+    def _finish(self, prompt_id: str, result: Dict[str, Any]):
+        """Record a finished prompt and resolve its waiter."""
+        if prompt_id in self._finished:
+            return
+
+        self._node_started(prompt_id, None)
+        result["outputs"] = self._outputs.pop(prompt_id, {})
+        result["node_seconds"] = self._node_seconds.pop(prompt_id, {})
+        result["cached_nodes"] = self._cached_nodes.pop(prompt_id, [])
+        self._finished[prompt_id] = result
+        while len(self._finished) > self.FINISHED_HISTORY_SIZE:
+            self._finished.popitem(last=False)
+
+        future = self._waiters.pop(prompt_id, None)
+        if future is not None and not future.done():
+            future.set_result(result)
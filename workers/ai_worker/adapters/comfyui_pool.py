@@ -0,0 +1,290 @@
+"""
+Load-aware routing across several ComfyUI instances.
+
+Each ``/prompt`` goes to the healthy instance with the shortest queue, read
+from ``/queue`` (running and pending prompts) and ``/system_stats`` (free
+VRAM, as a tie-breaker). Loads are refreshed at most every
+``refresh_interval`` seconds; prompts submitted in between are counted
+locally so a burst of submissions still spreads out. Every prompt_id
+remembers its instance, so status, results and cancellation go to the
+ComfyUI that owns the prompt.
+
+Routing is also model-aware: switching checkpoints often costs more than
+a generation, so an instance whose last prompt used the same models is
+preferred unless its queue is longer by more than ``model_swap_penalty``.
+"""
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Any, FrozenSet, List
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ComfyUIInstance:
+    """One ComfyUI endpoint and what is known about its load."""
+    url: str
+    healthy: bool = True
+    queue_running: int = 0
+    queue_pending: int = 0
+    vram_free: int = 0
+    # Prompts submitted since the last /queue refresh
+    submitted_since_refresh: int = 0
+    # Models of the last prompt submitted (resident once the queue reaches it)
+    models: FrozenSet[str] = frozenset()
+    refreshed_at: float = 0.0
+    retry_at: float = 0.0
+    # Counters for throughput reporting
+    in_flight: int = 0
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    generation_seconds: float = 0.0
+    model_loads: int = 0
+    model_reuses: int = 0
+    model_load_seconds: float = 0.0
+    started_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def queue_depth(self) -> int:
+        """Prompts queued or running, including unrefreshed local submissions."""
+        return self.queue_running + self.queue_pending + self.submitted_since_refresh
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get load and throughput figures for this instance.
+
+        Returns:
+            Dictionary of queue depth, counters, throughput and health
+        """
+        uptime_minutes = max(time.monotonic() - self.started_at, 1e-9) / 60
+        return {
+            "url": self.url,
+            "healthy": self.healthy,
+            "queue_running": self.queue_running,
+            "queue_pending": self.queue_pending,
+            "queue_depth": self.queue_depth,
+            "vram_free": self.vram_free,
+            "in_flight": self.in_flight,
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "completed_per_minute": round(self.completed / uptime_minutes, 3),
+            "avg_generation_seconds": (
+                round(self.generation_seconds / self.completed, 2) if self.completed else None
+            ),
+            "resident_models": sorted(self.models),
+            "model_loads": self.model_loads,
+            "model_reuses": self.model_reuses,
+            "model_load_seconds": round(self.model_load_seconds, 2)
+        }
+
+    def holds(self, models: FrozenSet[str]) -> bool:
+        """Whether the given models will be loaded when the next prompt runs."""
+        return models <= self.models
+
+
+class ComfyUIPool:
+    """Routes prompts to the least-loaded of several ComfyUI instances."""
+
+    def __init__(
+        self,
+        urls: List[str],
+        client: httpx.AsyncClient,
+        refresh_interval: float = 2.0,
+        unhealthy_backoff: float = 15.0,
+        model_swap_penalty: float = 2.0
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            urls: ComfyUI base URLs; the first is used for prompts of unknown owner
+            client: HTTP client for load probes
+            refresh_interval: Seconds a load reading stays fresh
+            unhealthy_backoff: Seconds to skip an instance after it fails a probe or request
+            model_swap_penalty: Extra queued prompts worth waiting behind to avoid a model swap
+        """
+        if not urls:
+            raise ValueError("ComfyUIPool needs at least one URL")
+
+        self.instances = [ComfyUIInstance(url=url.rstrip("/")) for url in urls]
+        self.client = client
+        self.refresh_interval = refresh_interval
+        self.unhealthy_backoff = unhealthy_backoff
+        self.model_swap_penalty = model_swap_penalty
+
+        self._by_url = {instance.url: instance for instance in self.instances}
+        # prompt_id -> (instance, submit time)
+        self._owners: Dict[str, tuple] = {}
+        self._refresh_lock = asyncio.Lock()
+
+    @property
+    def primary(self) -> ComfyUIInstance:
+        """The first configured instance."""
+        return self.instances[0]
+
+    async def choose(self, models: FrozenSet[str] = frozenset()) -> ComfyUIInstance:
+        """
+        Pick the instance to submit the next prompt to.
+
+        Args:
+            models: Models the prompt loads (see InjectionPlan.models)
+
+        Returns:
+            The healthy instance with the shortest queue, counting a model
+            swap as model_swap_penalty extra prompts (most free VRAM on
+            ties); if none is healthy, the one whose backoff ends first
+        """
+        if len(self.instances) == 1:
+            return self.primary
+
+        await self._refresh_stale()
+
+        now = time.monotonic()
+        candidates = [
+            instance for instance in self.instances
+            if instance.healthy or instance.retry_at <= now
+        ]
+        if not candidates:
+            return min(self.instances, key=lambda instance: instance.retry_at)
+
+        def cost(instance: ComfyUIInstance):
+            swap = self.model_swap_penalty if models and not instance.holds(models) else 0
+            return (instance.queue_depth + swap, instance.in_flight, -instance.vram_free)
+
+        return min(candidates, key=cost)
+
+    def assign(self, prompt_id: str, instance: ComfyUIInstance, models: FrozenSet[str] = frozenset()):
+        """
+        Record that a prompt was submitted to an instance.
+
+        Args:
+            prompt_id: ComfyUI prompt_id
+            instance: Instance that accepted the prompt
+            models: Models the prompt loads
+        """
+        if models:
+            instance.models = models
+        instance.submitted += 1
+        instance.in_flight += 1
+        instance.submitted_since_refresh += 1
+        instance.healthy = True
+        self._owners[prompt_id] = (instance, time.monotonic())
+
+    def owner(self, prompt_id: str) -> ComfyUIInstance:
+        """
+        Get the instance a prompt was submitted to.
+
+        Prompts this pool did not submit (e.g. from before a worker restart)
+        are assumed to belong to the primary instance.
+
+        Args:
+            prompt_id: ComfyUI prompt_id
+
+        Returns:
+            Owning instance
+        """
+        entry = self._owners.get(prompt_id)
+        return entry[0] if entry else self.primary
+
+    def url_for(self, prompt_id: str) -> str:
+        """Base URL of the instance that owns a prompt."""
+        return self.owner(prompt_id).url
+
+    def release(self, prompt_id: str, succeeded: bool):
+        """
+        Record that a prompt finished and forget its owner.
+
+        Args:
+            prompt_id: ComfyUI prompt_id
+            succeeded: Whether the prompt produced an output
+        """
+        entry = self._owners.pop(prompt_id, None)
+        if entry is None:
+            return
+
+        instance, submitted_at = entry
+        instance.in_flight = max(0, instance.in_flight - 1)
+        if succeeded:
+            instance.completed += 1
+            instance.generation_seconds += time.monotonic() - submitted_at
+        else:
+            instance.failed += 1
+
+    def record_model_load(self, prompt_id: str, seconds: float):
+        """
+        Record the time a prompt spent in its model loader nodes.
+
+        Args:
+            prompt_id: ComfyUI prompt_id
+            seconds: Loader execution time (0 if every model was already resident)
+        """
+        instance = self.owner(prompt_id)
+        if seconds > 0:
+            instance.model_loads += 1
+            instance.model_load_seconds += seconds
+        else:
+            instance.model_reuses += 1
+
+    def mark_unhealthy(self, instance: ComfyUIInstance):
+        """
+        Take an instance out of rotation for the backoff period.
+
+        Args:
+            instance: Instance that failed a request
+        """
+        if instance.healthy:
+            logger.warning(f"ComfyUI instance {instance.url} marked unhealthy")
+        instance.healthy = False
+        instance.retry_at = time.monotonic() + self.unhealthy_backoff
+
+    def get_stats(self) -> List[Dict[str, Any]]:
+        """
+        Get per-instance load and throughput.
+
+        Returns:
+            One stats dictionary per instance, in configuration order
+        """
+        return [instance.get_stats() for instance in self.instances]
+
+    async def _refresh_stale(self):
+        """Re-read the load of every instance whose reading has gone stale."""
+        async with self._refresh_lock:
+            now = time.monotonic()
+            stale = [
+                instance for instance in self.instances
+                if now - instance.refreshed_at >= self.refresh_interval
+                and (instance.healthy or instance.retry_at <= now)
+            ]
+            if stale:
+                await asyncio.gather(*(self._refresh(instance) for instance in stale))
+
+    async def _refresh(self, instance: ComfyUIInstance):
+        """Read one instance's queue and free VRAM."""
+        try:
+            queue_response, stats_response = await asyncio.gather(
+                self.client.get(f"{instance.url}/queue", timeout=5.0),
+                self.client.get(f"{instance.url}/system_stats", timeout=5.0)
+            )
+            queue_response.raise_for_status()
+            stats_response.raise_for_status()
+            queue = queue_response.json()
+            devices = stats_response.json().get("devices", [])
+        except (httpx.HTTPError, ValueError) as e:
+            logger.debug(f"Load probe of ComfyUI instance {instance.url} failed: {e}")
+            self.mark_unhealthy(instance)
+            return
+
+        if not instance.healthy:
+            logger.info(f"ComfyUI instance {instance.url} is healthy again")
+        instance.healthy = True
+        instance.queue_running = len(queue.get("queue_running", []))
+        instance.queue_pending = len(queue.get("queue_pending", []))
+        instance.vram_free = max((device.get("vram_free", 0) for device in devices), default=0)
+        instance.submitted_since_refresh = 0
+        instance.refreshed_at = time.monotonic()
@@ -1,15 +1,24 @@
 """
 Factory for creating video model adapters based on configuration.
 """
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
+import asyncio
+import hashlib
+import importlib.util
+import json
+import logging
 import os
 
+import httpx
+
 from .base import VideoModelInterface
 from .runway import RunwayGen3Adapter
 from .stability import StabilityAIAdapter
 from .mock import MockAIAdapter
 from .comfyui import ComfyUIAdapter
 
+logger = logging.getLogger(__name__)
+
 
 class VideoModelFactory:
     """
@@ -29,12 +38,20 @@ class VideoModelFactory:
         "comfy": ComfyUIAdapter  # Alias
     }
 
+    # Long-lived adapters handed out by get(), keyed by
+    # (event loop, adapter class, API key hash, config hash)
+    _pool: Dict[Tuple[int, str, str, str], VideoModelInterface] = {}
+
+    # Shared keep-alive connection pool per event loop
+    _transports: Dict[int, httpx.AsyncHTTPTransport] = {}
+
     @classmethod
     def create(
         cls,
         model_name: str,
         api_key: Optional[str] = None,
-        config: Optional[Dict[str, Any]] = None
+        config: Optional[Dict[str, Any]] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None
     ) -> VideoModelInterface:
         """
         Create a video model adapter instance.
@@ -43,10 +60,94 @@ class VideoModelFactory:
             model_name: Name of the model (e.g., "runway-gen3", "stability-ai")
             api_key: API key for the model service (if None, will try to get from env)
             config: Additional configuration for the adapter
+            transport: Shared HTTP transport for the adapter's connections
 
         Returns:
             VideoModelInterface instance
 
+        Raises:
+            ValueError: If model_name is not supported
+            ValueError: If API key is missing and required
+        """
+        adapter_class, api_key = cls._resolve(model_name, api_key)
+        return adapter_class(api_key=api_key, config=config, transport=transport)
+
+    @classmethod
+    def get(
+        cls,
+        model_name: str,
+        api_key: Optional[str] = None,
+        config: Optional[Dict[str, Any]] = None
+    ) -> VideoModelInterface:
+        """
+        Get a long-lived adapter from the pool, creating it on first use.
+
+        Adapters are pooled per model and configuration and share one
+        keep-alive HTTP connection pool per event loop, so repeated calls
+        reuse open connections instead of paying TCP/TLS setup per request.
+        Must be called from a running event loop; release everything with
+        close_all() on shutdown.
+
+        Args:
+            model_name: Name of the model (e.g., "runway-gen3", "stability-ai")
+            api_key: API key for the model service (if None, will try to get from env)
+            config: Additional configuration for the adapter
+
+        Returns:
+            Shared VideoModelInterface instance
+
+        Raises:
+            ValueError: If model_name is not supported
+            ValueError: If API key is missing and required
+        """
+        adapter_class, api_key = cls._resolve(model_name, api_key)
+        loop_id = id(asyncio.get_running_loop())
+
+        key = (
+            loop_id,
+            adapter_class.__name__,
+            hashlib.sha256((api_key or "").encode()).hexdigest(),
+            cls._config_hash(config)
+        )
+
+        adapter = cls._pool.get(key)
+        if adapter is None:
+            adapter = adapter_class(
+                api_key=api_key,
+                config=config,
+                transport=cls._get_transport(loop_id)
+            )
+            cls._pool[key] = adapter
+            logger.info(f"Created pooled {adapter_class.__name__} ({len(cls._pool)} pooled adapters)")
+
+        return adapter
+
+    @classmethod
+    async def close_all(cls):
+        """Close every pooled adapter and connection pool bound to the running loop."""
+        loop_id = id(asyncio.get_running_loop())
+
+        for key in [k for k in cls._pool if k[0] == loop_id]:
+            adapter = cls._pool.pop(key)
+            try:
+                await adapter.close()
+            except Exception as e:
+                logger.warning(f"Error closing {type(adapter).__name__}: {e}")
+
+        transport = cls._transports.pop(loop_id, None)
+        if transport is not None:
+            await transport.aclose()
+            logger.info("Closed shared adapter connection pool")
+
+    @classmethod
+    def _resolve(
+        cls,
+        model_name: str,
+        api_key: Optional[str]
+    ) -> Tuple[type, Optional[str]]:
+        """
+        Look up the adapter class and API key for a model name.
+
         Raises:
             ValueError: If model_name is not supported
             ValueError: If API key is missing and required
@@ -70,13 +171,52 @@ class VideoModelFactory:
         if model_name_lower in ["mock", "mock-ai"]:
             api_key = api_key or "mock_key"
 
+        # ComfyUI needs no key; the adapter finds its instances from
+        # COMFYUI_URLS or COMFYUI_URL itself
+        if model_name_lower in ["comfyui", "comfy"]:
+            return adapter_class, api_key or ""
+
         if not api_key:
             raise ValueError(
                 f"API key required for {model_name}. "
                 f"Provide via api_key parameter or environment variable."
             )
 
-        return adapter_class(api_key=api_key, config=config)
+        return adapter_class, api_key
+
+    @staticmethod
+    def _config_hash(config: Optional[Dict[str, Any]]) -> str:
+        """Stable hash of an adapter configuration."""
+        canonical = json.dumps(config or {}, sort_keys=True, default=str)
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    @classmethod
+    def _get_transport(cls, loop_id: int) -> httpx.AsyncHTTPTransport:
+        """
+        Get the shared keep-alive transport for an event loop.
+
+        HTTP/2 is enabled when ADAPTER_HTTP2 is set (default) and the h2
+        package is installed; it only applies to TLS endpoints.
+        """
+        transport = cls._transports.get(loop_id)
+        if transport is not None:
+            return transport
+
+        http2 = os.getenv("ADAPTER_HTTP2", "true").lower() == "true"
+        if http2 and importlib.util.find_spec("h2") is None:
+            logger.warning("ADAPTER_HTTP2 is enabled but the h2 package is not installed; using HTTP/1.1")
+            http2 = False
+
+        limits = httpx.Limits(
+            max_connections=int(os.getenv("ADAPTER_MAX_CONNECTIONS", "100")),
+            max_keepalive_connections=int(os.getenv("ADAPTER_MAX_KEEPALIVE_CONNECTIONS", "20")),
+            keepalive_expiry=float(os.getenv("ADAPTER_KEEPALIVE_EXPIRY", "60"))
+        )
+
+        transport = httpx.AsyncHTTPTransport(http2=http2, limits=limits)
+        cls._transports[loop_id] = transport
+        logger.info(f"Created shared adapter connection pool (http2={http2})")
+        return transport
 
     @classmethod
     def _get_api_key_from_env(cls, model_name: str) -> Optional[str]:
@@ -19,16 +19,28 @@ class MockAIAdapter(VideoModelInterface):
     Simulates video generation with configurable delays and responses.
     """
 
-    def __init__(self, api_key: str = "mock_key", config: Optional[Dict[str, Any]] = None):
-        super().__init__(api_key, config)
+    def __init__(
+        self,
+        api_key: str = "mock_key",
+        config: Optional[Dict[str, Any]] = None,
+        transport=None
+    ):
+        super().__init__(api_key, config, transport)
         self.generation_delay = config.get("generation_delay", 2.0) if config else 2.0
         self.fail_rate = config.get("fail_rate", 0.0) if config else 0.0
         self._jobs: Dict[str, Dict[str, Any]] = {}
 
+    # Finished jobs kept for late get_result calls on a pooled adapter
+    MAX_FINISHED_JOBS = 1000
+
     @property
     def model_name(self) -> str:
         return "mock-ai"
 
+    def expected_generation_time(self, external_job_id: str) -> float:
+        """Mock jobs take the configured delay plus ffmpeg encoding time."""
+        return self.generation_delay + 1.0
+
     async def initiate_generation(
         self,
         prompt: str,
@@ -38,6 +50,7 @@ class MockAIAdapter(VideoModelInterface):
         Initiate mock video generation.
         """
         external_job_id = f"mock_job_{uuid.uuid4().hex[:12]}"
+        self._prune_finished_jobs()
 
         self._jobs[external_job_id] = {
             "status": GenerationStatus.PROCESSING,
@@ -52,6 +65,15 @@ class MockAIAdapter(VideoModelInterface):
 
         return external_job_id
 
+    def _prune_finished_jobs(self):
+        """Drop the oldest finished jobs beyond MAX_FINISHED_JOBS."""
+        finished = [
+            job_id for job_id, job in self._jobs.items()
+            if job["status"] in (GenerationStatus.COMPLETED, GenerationStatus.FAILED)
+        ]
+        for job_id in finished[:max(len(finished) - self.MAX_FINISHED_JOBS, 0)]:
+            del self._jobs[job_id]
+
     async def _simulate_generation(self, external_job_id: str):
         """
         Generate a real test video using ffmpeg.
@@ -0,0 +1,315 @@
+"""
+Shared status poller for in-flight generation jobs.
+
+Instead of every segment running its own polling loop, a single poller per
+provider tracks all outstanding ``external_job_id``s, fetches their status in
+bulk through the adapter and wakes the waiting coroutines as results arrive.
+"""
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, Any, Optional, Tuple, TYPE_CHECKING
+
+from .base import GenerationStatus, GenerationResult
+
+if TYPE_CHECKING:
+    from .base import VideoModelInterface
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _PollEntry:
+    """A job being tracked by the poller."""
+    adapter: "VideoModelInterface"
+    future: asyncio.Future
+    expected_duration: float
+    started_at: float
+    next_poll_at: float
+    polls: int = 0
+    # Consecutive failed status calls
+    errors: int = 0
+    waiters: int = field(default=1)
+
+
+class StatusPoller:
+    """
+    Polls the status of all outstanding jobs of one provider.
+
+    The poll rate adapts to each job's expected remaining duration: a job
+    expected to take another minute is checked a few times, not sixty, and
+    once a job runs past its estimate it is checked at ``min_interval``.
+    Jobs that fall due at about the same time are fetched in one bulk call
+    via ``adapter.get_results_bulk``.
+
+    A failed status call, whether the whole bulk call or the entry for one
+    job (e.g. a connection blip or a 5xx), leaves the job in flight and
+    retries it with exponential backoff; it only fails after
+    ``max_errors`` consecutive failures, or when its waiter times out.
+    """
+
+    # Shared pollers, keyed by (event loop, adapter poll group)
+    _instances: Dict[Tuple[int, Any], "StatusPoller"] = {}
+
+    # Jobs due within this many seconds are folded into the current batch
+    BATCH_WINDOW = 0.5
+
+    def __init__(self, min_interval: float = 1.0, max_interval: float = 15.0, max_errors: int = 5):
+        """
+        Initialize the poller.
+
+        Args:
+            min_interval: Shortest delay between polls of the same job in seconds
+            max_interval: Longest delay between polls of the same job in seconds
+            max_errors: Consecutive failed status calls after which a job fails
+        """
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.max_errors = max(1, max_errors)
+        self._entries: Dict[str, _PollEntry] = {}
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    @classmethod
+    def for_adapter(cls, adapter: "VideoModelInterface") -> "StatusPoller":
+        """
+        Get the poller shared by every adapter in the same poll group.
+
+        Args:
+            adapter: Adapter whose jobs will be polled
+
+        Returns:
+            StatusPoller bound to the running event loop
+        """
+        loop = asyncio.get_running_loop()
+        key = (id(loop), adapter.poll_group)
+        poller = cls._instances.get(key)
+        if poller is None:
+            poller = cls(
+                min_interval=adapter.config.get("poll_min_interval", 1.0),
+                max_interval=adapter.config.get("poll_max_interval", 15.0),
+                max_errors=adapter.config.get("poll_max_errors", 5)
+            )
+            cls._instances[key] = poller
+        return poller
+
+    @classmethod
+    async def close_all(cls):
+        """Stop every poller bound to the running loop."""
+        loop_id = id(asyncio.get_running_loop())
+        for key in [k for k in cls._instances if k[0] == loop_id]:
+            await cls._instances.pop(key).close()
+
+    @property
+    def in_flight(self) -> int:
+        """Number of jobs currently tracked."""
+        return len(self._entries)
+
+    def watch(
+        self,
+        adapter: "VideoModelInterface",
+        external_job_id: str,
+        expected_duration: float
+    ) -> asyncio.Future:
+        """
+        Start tracking a job.
+
+        Args:
+            adapter: Adapter that owns the job
+            external_job_id: Job ID from the external AI service
+            expected_duration: Estimated total generation time in seconds
+
+        Returns:
+            Future resolving to the terminal GenerationResult
+        """
+        entry = self._entries.get(external_job_id)
+        if entry is not None:
+            entry.waiters += 1
+            return entry.future
+
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        entry = _PollEntry(
+            adapter=adapter,
+            future=loop.create_future(),
+            expected_duration=max(expected_duration, 0.0),
+            started_at=now,
+            next_poll_at=now + self._interval_for(expected_duration, 0.0, 0)
+        )
+        self._entries[external_job_id] = entry
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="status-poller")
+        self._wakeup.set()
+        return entry.future
+
+    def unwatch(self, external_job_id: str):
+        """
+        Stop tracking a job once its last waiter has gone.
+
+        Args:
+            external_job_id: Job ID from the external AI service
+        """
+        entry = self._entries.get(external_job_id)
+        if entry is None:
+            return
+        entry.waiters -= 1
+        if entry.waiters <= 0:
+            self._entries.pop(external_job_id, None)
+            if not entry.future.done():
+                entry.future.cancel()
+
+    async def wait(
+        self,
+        adapter: "VideoModelInterface",
+        external_job_id: str,
+        expected_duration: float,
+        timeout: float
+    ) -> GenerationResult:
+        """
+        Track a job and wait for its terminal result.
+
+        Args:
+            adapter: Adapter that owns the job
+            external_job_id: Job ID from the external AI service
+            expected_duration: Estimated total generation time in seconds
+            timeout: Maximum seconds to wait
+
+        Returns:
+            GenerationResult in COMPLETED or FAILED state
+
+        Raises:
+            TimeoutError: If the job does not finish within the timeout
+        """
+        future = self.watch(adapter, external_job_id, expected_duration)
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout=timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"Generation timed out after {timeout:.0f} seconds")
+        finally:
+            self.unwatch(external_job_id)
+
+    async def close(self):
+        """Stop polling and cancel all outstanding waiters."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, Exception):
+                pass
+        for entry in self._entries.values():
+            if not entry.future.done():
+                entry.future.cancel()
+        self._entries.clear()
+
+    def _interval_for(self, expected_duration: float, elapsed: float, polls: int) -> float:
+        """
+        Compute the delay before the next poll of a job.
+
+        Args:
+            expected_duration: Estimated total generation time in seconds
+            elapsed: Seconds since the job was submitted
+            polls: Number of polls already made for the job
+
+        Returns:
+            Delay in seconds
+        """
+        remaining = expected_duration - elapsed
+        if remaining > 0:
+            # Check a few times over the remaining estimate
+            interval = remaining / 4
+        else:
+            # Overdue: back off gently from the minimum
+            interval = self.min_interval * (1.25 ** min(polls, 10))
+        return max(self.min_interval, min(interval, self.max_interval))
+
+    async def _run(self):
+        """Poll loop: sleep until the next job is due, then poll a batch."""
+        loop = asyncio.get_running_loop()
+
+        while self._entries:
+            now = loop.time()
+            next_due = min(entry.next_poll_at for entry in self._entries.values())
+            if next_due > now:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=next_due - now)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            due = {
+                job_id: entry
+                for job_id, entry in self._entries.items()
+                if entry.next_poll_at <= now + self.BATCH_WINDOW
+            }
+            await self._poll_batch(due)
+
+    async def _poll_batch(self, due: Dict[str, _PollEntry]):
+        """Fetch results for due jobs, grouped by adapter, and settle futures."""
+        loop = asyncio.get_running_loop()
+
+        by_adapter: Dict[int, Tuple["VideoModelInterface", list]] = {}
+        for job_id, entry in due.items():
+            by_adapter.setdefault(id(entry.adapter), (entry.adapter, []))[1].append(job_id)
+
+        batches = list(by_adapter.values())
+        outcomes = await asyncio.gather(
+            *(adapter.get_results_bulk(job_ids) for adapter, job_ids in batches),
+            return_exceptions=True
+        )
+
+        now = loop.time()
+        for (adapter, job_ids), results in zip(batches, outcomes):
+            if isinstance(results, BaseException):
+                logger.warning(f"Bulk status poll failed for {adapter.model_name}: {results}")
+                for job_id in job_ids:
+                    entry = self._entries.get(job_id)
+                    if entry is not None:
+                        self._poll_failed(job_id, entry, results, now)
+                continue
+
+            for job_id in job_ids:
+                entry = self._entries.get(job_id)
+                if entry is None:
+                    continue
+                result = results.get(job_id)
+
+                if isinstance(result, BaseException):
+                    logger.warning(f"Status poll of job {job_id} failed: {result}")
+                    self._poll_failed(job_id, entry, result, now)
+                elif result is not None and result.status in (
+                    GenerationStatus.COMPLETED, GenerationStatus.FAILED
+                ):
+                    self._entries.pop(job_id, None)
+                    if not entry.future.done():
+                        entry.future.set_result(result)
+                else:
+                    entry.errors = 0
+                    entry.polls += 1
+                    entry.next_poll_at = now + self._interval_for(
+                        entry.expected_duration, now - entry.started_at, entry.polls
+                    )
+
+    def _poll_failed(self, job_id: str, entry: _PollEntry, error: BaseException, now: float):
+        """
+        Count a failed status poll of one job.
+
+        The job is treated as still processing and re-polled with
+        exponential backoff until max_errors consecutive failures, when
+        error is raised to its waiters.
+
+        Args:
+            job_id: Job ID from the external AI service
+            entry: The job's poll entry
+            error: Error from the bulk call or for this job
+            now: Current loop time
+        """
+        entry.errors += 1
+        if entry.errors >= self.max_errors:
+            logger.error(f"Giving up on job {job_id} after {entry.errors} failed status polls")
+            self._entries.pop(job_id, None)
+            if not entry.future.done():
+                entry.future.set_exception(error)
+        else:
+            entry.next_poll_at = now + min(self.min_interval * (2 ** entry.errors), self.max_interval)
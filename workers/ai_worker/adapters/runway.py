@@ -18,18 +18,41 @@ class RunwayGen3Adapter(VideoModelInterface):
 
     BASE_URL = "https://api.runwayml.com/v1"
 
-    def __init__(self, api_key: str, config: Optional[Dict[str, Any]] = None):
-        super().__init__(api_key, config)
+    # Map Runway statuses to our GenerationStatus enum
+    STATUS_MAP = {
+        "pending": GenerationStatus.PENDING,
+        "processing": GenerationStatus.PROCESSING,
+        "running": GenerationStatus.PROCESSING,
+        "succeeded": GenerationStatus.COMPLETED,
+        "completed": GenerationStatus.COMPLETED,
+        "failed": GenerationStatus.FAILED,
+        "error": GenerationStatus.FAILED
+    }
+
+    def __init__(
+        self,
+        api_key: str,
+        config: Optional[Dict[str, Any]] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
+        super().__init__(api_key, config, transport)
         self.headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json"
         }
         self.timeout = config.get("timeout", 300) if config else 300
+        # Long-lived client; status checks override the timeout per request
+        self.client = self._build_http_client(timeout=self.timeout, headers=self.headers)
 
     @property
     def model_name(self) -> str:
         return "runway-gen3"
 
+    @property
+    def poll_group(self) -> Any:
+        """Jobs are stateless API lookups, so all adapters for one account share a poller."""
+        return ("runway-gen3", self.api_key)
+
     def validate_params(self, model_params: Dict[str, Any]) -> Dict[str, Any]:
         """
         Validate Runway Gen-3 specific parameters.
@@ -79,103 +102,91 @@ class RunwayGen3Adapter(VideoModelInterface):
             "resolution": validated_params["resolution"]
         }
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(
-                f"{self.BASE_URL}/generate",
-                json=payload,
-                headers=self.headers
-            )
-            response.raise_for_status()
+        response = await self.client.post(
+            f"{self.BASE_URL}/generate",
+            json=payload
+        )
+        response.raise_for_status()
+
+        data = response.json()
+        external_job_id = data.get("id")
 
-            data = response.json()
-            external_job_id = data.get("id")
+        if not external_job_id:
+            raise Exception("No job ID returned from Runway API")
 
-            if not external_job_id:
-                raise Exception("No job ID returned from Runway API")
+        return external_job_id
 
-            return external_job_id
+    async def _fetch_job(self, external_job_id: str) -> Dict[str, Any]:
+        """
+        Fetch the raw job document from Runway.
+        """
+        response = await self.client.get(
+            f"{self.BASE_URL}/generate/{external_job_id}",
+            timeout=30
+        )
+        response.raise_for_status()
+        return response.json()
+
+    def _map_status(self, data: Dict[str, Any]) -> GenerationStatus:
+        """
+        Map a Runway job document to a GenerationStatus.
+        """
+        runway_status = data.get("status", "").lower()
+        return self.STATUS_MAP.get(runway_status, GenerationStatus.PENDING)
 
     async def get_status(self, external_job_id: str) -> GenerationStatus:
         """
         Check the status of a Runway generation job.
         """
-        async with httpx.AsyncClient(timeout=30) as client:
-            response = await client.get(
-                f"{self.BASE_URL}/generate/{external_job_id}",
-                headers=self.headers
-            )
-            response.raise_for_status()
-
-            data = response.json()
-            runway_status = data.get("status", "").lower()
-
-            # Map Runway statuses to our GenerationStatus enum
-            status_map = {
-                "pending": GenerationStatus.PENDING,
-                "processing": GenerationStatus.PROCESSING,
-                "running": GenerationStatus.PROCESSING,
-                "succeeded": GenerationStatus.COMPLETED,
-                "completed": GenerationStatus.COMPLETED,
-                "failed": GenerationStatus.FAILED,
-                "error": GenerationStatus.FAILED
-            }
-
-            return status_map.get(runway_status, GenerationStatus.PENDING)
+        data = await self._fetch_job(external_job_id)
+        return self._map_status(data)
 
     async def get_result(self, external_job_id: str) -> GenerationResult:
         """
         Retrieve the result of a completed Runway generation job.
         """
-        async with httpx.AsyncClient(timeout=30) as client:
-            response = await client.get(
-                f"{self.BASE_URL}/generate/{external_job_id}",
-                headers=self.headers
-            )
-            response.raise_for_status()
-
-            data = response.json()
-            status = await self.get_status(external_job_id)
-
-            if status == GenerationStatus.FAILED:
-                error_msg = data.get("error", "Unknown error")
-                return GenerationResult(
-                    status=status,
-                    error_message=error_msg,
-                    external_job_id=external_job_id
-                )
+        data = await self._fetch_job(external_job_id)
+        status = self._map_status(data)
 
-            if status != GenerationStatus.COMPLETED:
-                return GenerationResult(
-                    status=status,
-                    external_job_id=external_job_id
-                )
-
-            video_url = data.get("output", {}).get("url")
-            if not video_url:
-                raise Exception("No video URL in completed job")
+        if status == GenerationStatus.FAILED:
+            error_msg = data.get("error", "Unknown error")
+            return GenerationResult(
+                status=status,
+                error_message=error_msg,
+                external_job_id=external_job_id
+            )
 
+        if status != GenerationStatus.COMPLETED:
             return GenerationResult(
-                status=GenerationStatus.COMPLETED,
-                video_url=video_url,
-                external_job_id=external_job_id,
-                metadata={
-                    "duration": data.get("duration"),
-                    "resolution": data.get("resolution"),
-                    "aspect_ratio": data.get("aspect_ratio")
-                },
-                completed_at=datetime.utcnow()
+                status=status,
+                external_job_id=external_job_id
             )
 
+        video_url = data.get("output", {}).get("url")
+        if not video_url:
+            raise Exception("No video URL in completed job")
+
+        return GenerationResult(
+            status=GenerationStatus.COMPLETED,
+            video_url=video_url,
+            external_job_id=external_job_id,
+            metadata={
+                "duration": data.get("duration"),
+                "resolution": data.get("resolution"),
+                "aspect_ratio": data.get("aspect_ratio")
+            },
+            completed_at=datetime.utcnow()
+        )
+
     async def cancel_generation(self, external_job_id: str) -> bool:
         """
         Cancel a Runway generation job.
         """
         try:
-            async with httpx.AsyncClient(timeout=30) as client:
-                response = await client.delete(
-                    f"{self.BASE_URL}/generate/{external_job_id}",
-                    headers=self.headers
-                )
-                return response.status_code == 200
+            response = await self.client.delete(
+                f"{self.BASE_URL}/generate/{external_job_id}",
+                timeout=30
+            )
+            return response.status_code == 200
         except Exception:
             return False
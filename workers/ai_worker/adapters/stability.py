@@ -18,18 +18,30 @@ class StabilityAIAdapter(VideoModelInterface):
 
     BASE_URL = "https://api.stability.ai/v2beta"
 
-    def __init__(self, api_key: str, config: Optional[Dict[str, Any]] = None):
-        super().__init__(api_key, config)
+    def __init__(
+        self,
+        api_key: str,
+        config: Optional[Dict[str, Any]] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
+        super().__init__(api_key, config, transport)
         self.headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json"
         }
         self.timeout = config.get("timeout", 300) if config else 300
+        # Long-lived client; status checks override the timeout per request
+        self.client = self._build_http_client(timeout=self.timeout, headers=self.headers)
 
     @property
     def model_name(self) -> str:
         return "stability-ai"
 
+    @property
+    def poll_group(self) -> Any:
+        """Jobs are stateless API lookups, so all adapters for one account share a poller."""
+        return ("stability-ai", self.api_key)
+
     def validate_params(self, model_params: Dict[str, Any]) -> Dict[str, Any]:
         """
         Validate Stability AI specific parameters.
@@ -79,98 +91,93 @@ class StabilityAIAdapter(VideoModelInterface):
         if "seed" in validated_params:
             payload["seed"] = validated_params["seed"]
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(
-                f"{self.BASE_URL}/video/generate",
-                json=payload,
-                headers=self.headers
-            )
-            response.raise_for_status()
+        response = await self.client.post(
+            f"{self.BASE_URL}/video/generate",
+            json=payload
+        )
+        response.raise_for_status()
 
-            data = response.json()
-            external_job_id = data.get("id")
+        data = response.json()
+        external_job_id = data.get("id")
 
-            if not external_job_id:
-                raise Exception("No job ID returned from Stability AI API")
+        if not external_job_id:
+            raise Exception("No job ID returned from Stability AI API")
 
-            return external_job_id
+        return external_job_id
 
     async def get_status(self, external_job_id: str) -> GenerationStatus:
         """
         Check the status of a Stability AI generation job.
         """
-        async with httpx.AsyncClient(timeout=30) as client:
-            response = await client.get(
-                f"{self.BASE_URL}/video/result/{external_job_id}",
-                headers=self.headers
-            )
-
-            # Stability AI returns 202 while processing, 200 when complete
-            if response.status_code == 202:
-                return GenerationStatus.PROCESSING
-            elif response.status_code == 200:
-                return GenerationStatus.COMPLETED
-            elif response.status_code >= 400:
-                return GenerationStatus.FAILED
-            else:
-                return GenerationStatus.PENDING
+        response = await self.client.get(
+            f"{self.BASE_URL}/video/result/{external_job_id}",
+            timeout=30
+        )
+
+        # Stability AI returns 202 while processing, 200 when complete
+        if response.status_code == 202:
+            return GenerationStatus.PROCESSING
+        elif response.status_code == 200:
+            return GenerationStatus.COMPLETED
+        elif response.status_code >= 400:
+            return GenerationStatus.FAILED
+        else:
+            return GenerationStatus.PENDING
 
     async def get_result(self, external_job_id: str) -> GenerationResult:
         """
         Retrieve the result of a completed Stability AI generation job.
         """
-        async with httpx.AsyncClient(timeout=30) as client:
-            response = await client.get(
-                f"{self.BASE_URL}/video/result/{external_job_id}",
-                headers=self.headers
-            )
+        response = await self.client.get(
+            f"{self.BASE_URL}/video/result/{external_job_id}",
+            timeout=30
+        )
 
-            if response.status_code == 202:
-                return GenerationResult(
-                    status=GenerationStatus.PROCESSING,
-                    external_job_id=external_job_id
-                )
-
-            if response.status_code >= 400:
-                error_data = response.json() if response.text else {}
-                error_msg = error_data.get("message", f"HTTP {response.status_code}")
-                return GenerationResult(
-                    status=GenerationStatus.FAILED,
-                    error_message=error_msg,
-                    external_job_id=external_job_id
-                )
-
-            # Status code 200 - completed
-            # Stability AI returns video as binary data or URL in response
-            data = response.json()
-            video_url = data.get("video_url") or data.get("artifacts", [{}])[0].get("url")
-
-            if not video_url:
-                raise Exception("No video URL in completed job")
+        if response.status_code == 202:
+            return GenerationResult(
+                status=GenerationStatus.PROCESSING,
+                external_job_id=external_job_id
+            )
 
+        if response.status_code >= 400:
+            error_data = response.json() if response.text else {}
+            error_msg = error_data.get("message", f"HTTP {response.status_code}")
             return GenerationResult(
-                status=GenerationStatus.COMPLETED,
-                video_url=video_url,
-                external_job_id=external_job_id,
-                metadata={
-                    "seed": data.get("seed"),
-                    "cfg_scale": data.get("cfg_scale"),
-                    "motion_bucket_id": data.get("motion_bucket_id")
-                },
-                completed_at=datetime.utcnow()
+                status=GenerationStatus.FAILED,
+                error_message=error_msg,
+                external_job_id=external_job_id
             )
 
+        # Status code 200 - completed
+        # Stability AI returns video as binary data or URL in response
+        data = response.json()
+        video_url = data.get("video_url") or data.get("artifacts", [{}])[0].get("url")
+
+        if not video_url:
+            raise Exception("No video URL in completed job")
+
+        return GenerationResult(
+            status=GenerationStatus.COMPLETED,
+            video_url=video_url,
+            external_job_id=external_job_id,
+            metadata={
+                "seed": data.get("seed"),
+                "cfg_scale": data.get("cfg_scale"),
+                "motion_bucket_id": data.get("motion_bucket_id")
+            },
+            completed_at=datetime.utcnow()
+        )
+
     async def cancel_generation(self, external_job_id: str) -> bool:
         """
         Cancel a Stability AI generation job.
         Note: Stability AI may not support cancellation for all job types.
         """
         try:
-            async with httpx.AsyncClient(timeout=30) as client:
-                response = await client.delete(
-                    f"{self.BASE_URL}/video/{external_job_id}",
-                    headers=self.headers
-                )
-                return response.status_code in [200, 204]
+            response = await self.client.delete(
+                f"{self.BASE_URL}/video/{external_job_id}",
+                timeout=30
+            )
+            return response.status_code in [200, 204]
         except Exception:
             return False
@@ -0,0 +1,340 @@
+"""
+Precompiled injection plans for ComfyUI workflows.
+
+Finding where a prompt, seed and sampler settings go means walking every node of a
+workflow, and heavy workflows have hundreds. A workflow is compiled once per
+content hash into an :class:`InjectionPlan` listing its targets, discovered
+by ``class_type`` and by following the sampler's ``positive`` link. Applying
+a plan builds the request body as an overlay: only the nodes that change are
+copied and every other node is shared with the cached template, which is
+never mutated, so concurrent submissions of one workflow can't leak prompts
+into each other.
+"""
+import hashlib
+import json
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+# Loader node inputs that name a model file ComfyUI has to load into memory
+MODEL_INPUTS = (
+    "ckpt_name",
+    "unet_name",
+    "vae_name",
+    "lora_name",
+    "clip_name",
+    "clip_name1",
+    "clip_name2",
+    "control_net_name",
+    "model_name",
+)
+
+# Text inputs of prompt encoder nodes, by preference
+TEXT_INPUTS = ("text", "text_g", "text_l", "clip_l", "t5xxl", "prompt")
+
+# Sampler inputs that take conditioning
+POSITIVE_INPUTS = ("positive", "conditioning")
+NEGATIVE_INPUTS = ("negative",)
+
+# Sampler settings injected from model_params when present
+SAMPLER_PARAMS = ("steps", "cfg", "sampler_name", "scheduler", "denoise")
+
+SEED_INPUTS = ("seed", "noise_seed")
+
+# Node ID the adapter used for prompts before plans existed
+LEGACY_PROMPT_NODE_ID = "6"
+
+
+def model_loaders(workflow: Dict[str, Any]) -> Dict[str, FrozenSet[str]]:
+    """
+    Find the nodes of a workflow that load models.
+
+    Args:
+        workflow: ComfyUI workflow (API format)
+
+    Returns:
+        Mapping of node ID to the models it loads, as "input:file" strings
+    """
+    loaders = {}
+    for node_id, node in workflow.items():
+        inputs = _inputs(node)
+        models = frozenset(
+            f"{name}:{inputs[name]}"
+            for name in MODEL_INPUTS
+            if isinstance(inputs.get(name), str)
+        )
+        if models:
+            loaders[str(node_id)] = models
+    return loaders
+
+
+def workflow_key(workflow: Dict[str, Any]) -> str:
+    """
+    Hash a workflow's content.
+
+    Args:
+        workflow: ComfyUI workflow
+
+    Returns:
+        Hex digest that is the same for equal workflows
+    """
+    canonical = json.dumps(workflow, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+@dataclass(frozen=True)
+class InjectionPlan:
+    """Where per-segment values go in one workflow."""
+    # (node ID, text input) pairs that receive the prompt
+    prompt_targets: Tuple[Tuple[str, str], ...] = ()
+    sampler_nodes: Tuple[str, ...] = ()
+    # (node ID, seed input) pairs
+    seed_targets: Tuple[Tuple[str, str], ...] = ()
+    loaders: Dict[str, FrozenSet[str]] = field(default_factory=dict)
+
+    @property
+    def models(self) -> FrozenSet[str]:
+        """Every model the workflow loads."""
+        return frozenset().union(*self.loaders.values())
+
+    @classmethod
+    def compile(cls, workflow: Dict[str, Any]) -> "InjectionPlan":
+        """
+        Discover a workflow's injection targets.
+
+        The prompt goes to the text encoders feeding a sampler's positive
+        input (through any conditioning nodes in between). Workflows without
+        a recognizable sampler fall back to every text encoder that isn't
+        wired into a negative input.
+
+        Args:
+            workflow: ComfyUI workflow (API format)
+
+        Returns:
+            InjectionPlan for the workflow
+        """
+        samplers = [
+            node_id for node_id, node in workflow.items()
+            if "Sampler" in _class_type(node) or any(
+                _is_link(_inputs(node).get(name)) for name in ("positive", "negative")
+            )
+        ]
+
+        positive_roots = [
+            _inputs(workflow[node_id])[name][0]
+            for node_id in samplers
+            for name in POSITIVE_INPUTS
+            if _is_link(_inputs(workflow[node_id]).get(name))
+        ]
+        prompt_nodes = _upstream_text_nodes(workflow, positive_roots)
+
+        if not prompt_nodes:
+            negative = _upstream_text_nodes(workflow, [
+                inputs[name][0]
+                for inputs in map(_inputs, workflow.values())
+                for name in NEGATIVE_INPUTS
+                if _is_link(inputs.get(name))
+            ])
+            prompt_nodes = [
+                node_id for node_id, node in workflow.items()
+                if _text_input(node) and node_id not in negative
+            ]
+
+        prompt_targets = tuple((node_id, _text_input(workflow[node_id])) for node_id in prompt_nodes)
+        legacy = _inputs(workflow.get(LEGACY_PROMPT_NODE_ID))
+        if not prompt_targets and isinstance(legacy.get("text"), str):
+            prompt_targets = ((LEGACY_PROMPT_NODE_ID, "text"),)
+
+        return cls(
+            prompt_targets=prompt_targets,
+            sampler_nodes=tuple(samplers),
+            seed_targets=tuple(
+                (node_id, name)
+                for node_id, node in workflow.items()
+                for name in SEED_INPUTS
+                if _is_number(_inputs(node).get(name))
+            ),
+            loaders=model_loaders(workflow)
+        )
+
+    def apply(
+        self,
+        workflow: Dict[str, Any],
+        prompt: str,
+        model_params: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Build a request body with the prompt and parameters filled in.
+
+        An explicit ``prompt_node_id`` in model_params takes precedence over
+        the discovered prompt targets. Width and height are only injected
+        into the node named by ``sampler_node_id``, as they always were;
+        workflows without it keep their own size. Nodes that are not edited
+        are shared with workflow, so treat the result as read-only.
+
+        Args:
+            workflow: The workflow this plan was compiled from (not modified)
+            prompt: Text prompt to inject
+            model_params: Parameters (width, height, seed, steps, cfg, ...)
+
+        Returns:
+            New workflow dict with the edits applied
+        """
+        edits: Dict[str, Dict[str, Any]] = {}
+
+        def edit(node_id: str, name: str, value: Any):
+            node = workflow.get(node_id)
+            if isinstance(node, dict) and isinstance(node.get("inputs"), dict):
+                edits.setdefault(node_id, {})[name] = value
+
+        prompt_node_id = model_params.get("prompt_node_id")
+        if prompt_node_id is not None:
+            edit(str(prompt_node_id), "text", prompt)
+        else:
+            for node_id, name in self.prompt_targets:
+                edit(node_id, name, prompt)
+
+        sampler_node_id = model_params.get("sampler_node_id")
+        if sampler_node_id is not None:
+            for name in ("width", "height"):
+                if name in model_params:
+                    edit(str(sampler_node_id), name, model_params[name])
+
+        if "seed" in model_params:
+            for node_id, name in self.seed_targets:
+                edit(node_id, name, model_params["seed"])
+
+        for name in SAMPLER_PARAMS:
+            if name in model_params:
+                for node_id in self.sampler_nodes:
+                    if name in _inputs(workflow[node_id]):
+                        edit(node_id, name, model_params[name])
+
+        body = dict(workflow)
+        for node_id, inputs in edits.items():
+            node = workflow[node_id]
+            body[node_id] = {**node, "inputs": {**node["inputs"], **inputs}}
+        return body
+
+
+class PlanCache:
+    """
+    LRU cache of compiled injection plans, keyed by workflow content.
+
+    Hashing a large workflow costs about as much as compiling it, so the
+    content key of each workflow object is remembered by identity and only
+    computed the first time that object is seen. Workflows must therefore
+    not be modified in place once submitted.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Number of plans to keep
+        """
+        self.max_entries = max_entries
+        self._plans: "OrderedDict[str, InjectionPlan]" = OrderedDict()
+        # id(workflow) -> (workflow, content key); holding the workflow keeps
+        # its id from being reused by another object while the entry exists
+        self._keys: "OrderedDict[int, Tuple[Dict[str, Any], str]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def key_for(self, workflow: Dict[str, Any]) -> str:
+        """
+        Get a workflow's content key, hashing it only on first sight.
+
+        Args:
+            workflow: ComfyUI workflow (API format)
+
+        Returns:
+            workflow_key of the workflow
+        """
+        entry = self._keys.get(id(workflow))
+        if entry is not None and entry[0] is workflow:
+            self._keys.move_to_end(id(workflow))
+            return entry[1]
+
+        key = workflow_key(workflow)
+        self._keys[id(workflow)] = (workflow, key)
+        while len(self._keys) > self.max_entries:
+            self._keys.popitem(last=False)
+        return key
+
+    def get(self, workflow: Dict[str, Any], key: Optional[str] = None) -> InjectionPlan:
+        """
+        Get the plan for a workflow, compiling it on first use.
+
+        Args:
+            workflow: ComfyUI workflow (API format)
+            key: Precomputed workflow_key of workflow, if known
+
+        Returns:
+            InjectionPlan for the workflow
+        """
+        key = key or self.key_for(workflow)
+        plan = self._plans.get(key)
+        if plan is not None:
+            self.hits += 1
+            self._plans.move_to_end(key)
+            return plan
+
+        self.misses += 1
+        plan = InjectionPlan.compile(workflow)
+        self._plans[key] = plan
+        while len(self._plans) > self.max_entries:
+            self._plans.popitem(last=False)
+        return plan
+
+
+def _inputs(node: Any) -> Dict[str, Any]:
+    inputs = node.get("inputs") if isinstance(node, dict) else None
+    return inputs if isinstance(inputs, dict) else {}
+
+
+def _class_type(node: Any) -> str:
+    return str(node.get("class_type", "")) if isinstance(node, dict) else ""
+
+
+def _is_link(value: Any) -> bool:
+    """Whether an input value is a link ([source node ID, output index])."""
+    return isinstance(value, list) and len(value) == 2 and isinstance(value[1], int)
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _text_input(node: Any) -> Optional[str]:
+    """Name of a prompt encoder node's text input, or None for other nodes."""
+    if "TextEncode" not in _class_type(node):
+        return None
+    inputs = _inputs(node)
+    return next((name for name in TEXT_INPUTS if isinstance(inputs.get(name), str)), None)
+
+
+def _upstream_text_nodes(workflow: Dict[str, Any], roots: List[Any]) -> List[str]:
+    """
+    Text encoder nodes reachable upstream from roots, stopping at each encoder
+    and never following negative inputs (e.g. through ControlNet apply nodes).
+    """
+    order = {node_id: index for index, node_id in enumerate(workflow)}
+    found: List[str] = []
+    seen = set()
+    stack = [str(root) for root in roots]
+    while stack:
+        node_id = stack.pop()
+        if node_id in seen or node_id not in workflow:
+            continue
+        seen.add(node_id)
+        node = workflow[node_id]
+        if _text_input(node):
+            found.append(node_id)
+            continue
+        stack.extend(
+            str(value[0]) for name, value in _inputs(node).items()
+            if _is_link(value) and name not in NEGATIVE_INPUTS
+        )
+    return sorted(found, key=order.__getitem__)
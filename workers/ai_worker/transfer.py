@@ -0,0 +1,207 @@
+"""
+Streaming transfer of generated videos from AI providers into storage.
+"""
+import asyncio
+import hashlib
+import io
+import queue
+import time
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from typing import AsyncIterator, Callable, Optional, Tuple
+
+
+@dataclass
+class TransferStats:
+    """Size, checksum and speed of one transfer."""
+    bytes: int
+    seconds: float
+    sha256: str
+
+    @property
+    def throughput_mbps(self) -> float:
+        """Throughput in megabytes per second."""
+        return (self.bytes / 1024 ** 2) / self.seconds if self.seconds > 0 else 0.0
+
+
+class ChunkPipe(io.RawIOBase):
+    """
+    Blocking, bounded byte stream fed with chunks from the event loop.
+
+    The event loop puts chunks in; a storage upload running in a worker
+    thread reads them as an ordinary file object. At most max_chunks chunks
+    are buffered, so memory stays bounded however large the video is.
+
+    The loop side never blocks a thread: when the pipe is full, ``send``
+    waits on an asyncio event that the reader sets whenever it takes a
+    chunk. The reader polls with a timeout so an ``abort`` reaches it even
+    while the pipe is empty.
+    """
+
+    # Seconds the reader waits for a chunk before checking for an abort
+    READ_POLL_INTERVAL = 0.5
+
+    def __init__(self, max_chunks: int = 4, loop: Optional[asyncio.AbstractEventLoop] = None):
+        super().__init__()
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_chunks)
+        self._buffer = memoryview(b"")
+        self._eof = False
+        self._error: Optional[BaseException] = None
+        self._loop = loop
+        self._space = asyncio.Event()
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        while not self._buffer and not self._eof:
+            if self._error is not None:
+                raise self._error
+            try:
+                item = self._queue.get(timeout=self.READ_POLL_INTERVAL)
+            except queue.Empty:
+                continue
+            self._notify_space()
+            if item is None:
+                self._eof = True
+            elif isinstance(item, BaseException):
+                raise item
+            else:
+                self._buffer = memoryview(item)
+
+        n = min(len(b), len(self._buffer))
+        b[:n] = self._buffer[:n]
+        self._buffer = self._buffer[n:]
+        return n
+
+    def offer(self, item) -> bool:
+        """
+        Queue a chunk, end marker (None) or error without blocking.
+
+        Returns:
+            False if the pipe is full
+
+        Raises:
+            BrokenPipeError: If the reader closed the pipe (e.g. the upload failed)
+        """
+        if self.closed:
+            raise BrokenPipeError("Upload stopped reading")
+        try:
+            self._queue.put_nowait(item)
+            return True
+        except queue.Full:
+            return False
+
+    async def send(self, item):
+        """
+        Queue a chunk or end marker (None), waiting on the loop for space.
+
+        Raises:
+            BrokenPipeError: If the reader closed the pipe (e.g. the upload failed)
+        """
+        while True:
+            # Cleared before trying, so a read in between still wakes us
+            self._space.clear()
+            if self.offer(item):
+                return
+            await self._space.wait()
+
+    def abort(self, error: BaseException):
+        """Make the reader raise error instead of reading further chunks."""
+        self._error = error
+
+    def close(self):
+        super().close()
+        # Wakes a sender waiting for space; it then sees the closed pipe
+        self._notify_space()
+
+    def _notify_space(self):
+        """Tell the loop side that a chunk was taken (called from the reader thread)."""
+        if self._loop is None:
+            return
+        try:
+            self._loop.call_soon_threadsafe(self._space.set)
+        except RuntimeError:
+            # Loop already closed
+            pass
+
+
+async def stream_to_storage(
+    chunks: AsyncIterator[bytes],
+    upload: Callable[[io.RawIOBase], str],
+    expected_bytes: Optional[int] = None,
+    max_buffered_chunks: int = 4,
+    executor: Optional[Executor] = None
+) -> Tuple[str, TransferStats]:
+    """
+    Copy an async byte stream into storage without buffering it whole.
+
+    The upload runs in a thread and reads from a bounded pipe while chunks
+    are still arriving, so download and upload overlap. Each upload holds
+    its thread for the whole transfer, so concurrent transfers need an
+    executor with a thread per transfer; the loop's default executor is
+    shared and may be smaller.
+
+    Args:
+        chunks: Async iterator of byte chunks (e.g. ``response.aiter_bytes()``)
+        upload: Blocking function that uploads a readable stream and returns
+            its storage URL (e.g. ``storage.upload_stream``)
+        expected_bytes: Content length announced by the source, if known
+        max_buffered_chunks: Chunks held in memory between download and upload
+        executor: Executor to run the upload on (default: the loop's default executor)
+
+    Returns:
+        Tuple of the storage URL and transfer stats
+
+    Raises:
+        IOError: If fewer or more bytes arrived than expected_bytes
+    """
+    loop = asyncio.get_running_loop()
+    pipe = ChunkPipe(max_buffered_chunks, loop=loop)
+
+    def run_upload() -> str:
+        try:
+            # Buffered reads return full-sized blocks, which multipart
+            # uploads need (every part but the last must be at least 5 MB)
+            return upload(io.BufferedReader(pipe, buffer_size=1024 * 1024))
+        finally:
+            # Unblocks the producer if the upload stops early
+            pipe.close()
+
+    started = time.perf_counter()
+    upload_task = loop.run_in_executor(executor, run_upload)
+    hasher = hashlib.sha256()
+    received = 0
+
+    try:
+        async for chunk in chunks:
+            if not chunk:
+                continue
+            hasher.update(chunk)
+            received += len(chunk)
+            await pipe.send(chunk)
+
+        if expected_bytes is not None and received != expected_bytes:
+            raise IOError(f"Expected {expected_bytes} bytes, received {received}")
+
+        await pipe.send(None)
+
+    except BaseException as e:
+        # Make the upload fail (aborting any multipart upload) instead of
+        # storing a truncated video
+        pipe.abort(e)
+        try:
+            await upload_task
+        except BaseException as upload_error:
+            if isinstance(e, BrokenPipeError):
+                # The upload failed first; report its error
+                raise upload_error from None
+        raise
+
+    storage_url = await upload_task
+    stats = TransferStats(
+        bytes=received,
+        seconds=time.perf_counter() - started,
+        sha256=hasher.hexdigest()
+    )
+    return storage_url, stats
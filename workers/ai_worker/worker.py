@@ -6,6 +6,8 @@ import asyncio
 import logging
 import os
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from uuid import UUID
 from pathlib import Path
 import time
@@ -15,11 +17,18 @@ from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_excep
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from backend.config import get_db_context
-from backend.models import Segment, RenderJob
+from backend.models import Segment
 from backend.models.segment import SegmentStatus
-from backend.services import RabbitMQClient, RedisClient, S3Client, LocalStorageClient
+from backend.services import RabbitMQClient, RedisClient, S3Client, LocalStorageClient, RenderCache, RenderOrchestrator
+from backend.services.async_redis_client import AsyncRedisClient
+from backend.services.redis_client import RenderJobEvent
+from backend.services.fingerprint import is_cacheable
 from adapters import VideoModelFactory
+from adapters.comfyui_events import ComfyUIEventListener
+from adapters.poller import StatusPoller
 from adapters.exceptions import AdapterError, get_user_friendly_message
+from transfer import stream_to_storage
+import httpx
 import pika.exceptions
 
 logging.basicConfig(
@@ -37,7 +46,18 @@ class AIWorker:
     def __init__(self):
         """Initialize the AI worker."""
         self.rabbitmq = RabbitMQClient()
+        # Segment tasks run on the event loop thread while the consumer blocks the
+        # main thread. Recording a completion queries the database, writes Redis
+        # and publishes with confirms, all blocking, so it runs on a single
+        # executor thread that owns the publisher (pika connections are not
+        # thread-safe). Other database work goes through asyncio.to_thread.
+        self.publisher = RabbitMQClient()
         self.redis = RedisClient()
+        self.render_cache = RenderCache(self.redis)
+        self.orchestrator = RenderOrchestrator(self.publisher, self.redis, self.render_cache)
+        self._completion_executor: ThreadPoolExecutor | None = None
+        # Status writes made from the event loop use the asyncio client
+        self.aredis = AsyncRedisClient()
 
         # Use local storage if AWS credentials are not configured
         aws_key = os.getenv("AWS_ACCESS_KEY_ID", "")
@@ -52,7 +72,31 @@ class AIWorker:
 
         self.queue_name = os.getenv("SEGMENT_QUEUE_NAME", "segment_generation")
 
-        logger.info("AI Worker initialized")
+        # Number of segments a single worker process keeps in flight at once.
+        # Most of a generation is spent waiting on the provider, so one long-lived
+        # event loop can drive many of them concurrently.
+        self.max_in_flight = max(1, int(os.getenv("AI_WORKER_MAX_IN_FLIGHT", "32")))
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread: threading.Thread | None = None
+
+        # Generated videos are streamed into storage through a bounded buffer
+        # of transfer_buffered_chunks chunks of transfer_chunk_bytes each
+        self.transfer_chunk_bytes = int(os.getenv("AI_WORKER_TRANSFER_CHUNK_KB", "1024")) * 1024
+        self.transfer_buffered_chunks = max(1, int(os.getenv("AI_WORKER_TRANSFER_BUFFERED_CHUNKS", "8")))
+        self._http_client: httpx.AsyncClient | None = None
+        # Every in-flight transfer holds an upload thread until it finishes, so
+        # uploads get their own pool sized to max_in_flight rather than the
+        # loop's default executor (min(32, CPUs + 4) threads, shared)
+        self._upload_executor: ThreadPoolExecutor | None = None
+        self.bytes_transferred = 0
+        self.transfer_seconds = 0.0
+        # Outputs the worker can see on disk (file:// URLs) are handed to
+        # storage by hardlink/reflink. The output volume belongs to ComfyUI, so
+        # source files are only consumed when opted in, and then only by a
+        # same-filesystem rename into local storage.
+        self.move_local_outputs = os.getenv("AI_WORKER_MOVE_LOCAL_OUTPUTS", "false").lower() == "true"
+
+        logger.info(f"AI Worker initialized (max in flight: {self.max_in_flight})")
 
     async def process_segment_task(self, message: dict):
         """
@@ -65,22 +109,29 @@ class AIWorker:
         render_job_id = UUID(message["render_job_id"])
         prompt = message["prompt"]
         model_params = message["model_params"]
+        fingerprint = message.get("fingerprint")
+        cacheable = fingerprint is not None and is_cacheable(model_params)
 
         logger.info(f"Processing segment {segment_id} for render job {render_job_id}")
 
         try:
             # Update status in Redis
-            self.redis.set_segment_status(
+            await self.aredis.set_segment_status(
                 segment_id=segment_id,
                 status=SegmentStatus.GENERATING.value,
                 render_job_id=render_job_id
             )
+            await self.aredis.append_render_job_event(
+                render_job_id,
+                RenderJobEvent.GENERATING,
+                segment_id=segment_id
+            )
 
             # Get model name from params (default to mock for testing)
             model_name = model_params.get("model", "mock-ai")
 
-            # Create video model adapter
-            adapter = VideoModelFactory.create(model_name)
+            # Get the long-lived pooled adapter for this model
+            adapter = VideoModelFactory.get(model_name)
 
             # Initiate video generation with better error handling
             logger.info(f"Initiating generation with {model_name} for segment {segment_id}")
@@ -89,7 +140,7 @@ class AIWorker:
             except AdapterError as e:
                 # Adapter-specific error with error code
                 logger.error(f"Adapter error initiating generation: {e.message}")
-                self._handle_segment_failure(
+                await self._handle_segment_failure(
                     segment_id=segment_id,
                     render_job_id=render_job_id,
                     error_message=e.message,
@@ -99,11 +150,7 @@ class AIWorker:
                 return
 
             # Update database with external job ID
-            with get_db_context() as db:
-                segment = db.query(Segment).filter(Segment.id == segment_id).first()
-                if segment:
-                    segment.external_job_id = external_job_id
-                    db.commit()
+            await asyncio.to_thread(self._save_external_job_id, segment_id, external_job_id)
 
             # Poll for completion
             logger.info(f"Polling for completion: external_job_id={external_job_id}")
@@ -114,52 +161,19 @@ class AIWorker:
                 s3_url = await self._upload_to_s3(
                     video_url=result.video_url,
                     segment_id=segment_id,
-                    render_job_id=render_job_id
-                )
-
-                # Update database
-                with get_db_context() as db:
-                    segment = db.query(Segment).filter(Segment.id == segment_id).first()
-                    if segment:
-                        segment.status = SegmentStatus.COMPLETED
-                        segment.s3_asset_url = s3_url
-                        db.commit()
-
-                    # Update render job progress
-                    render_job = db.query(RenderJob).filter(RenderJob.id == render_job_id).first()
-                    if render_job:
-                        render_job.segments_completed += 1
-                        db.commit()
-
-                        # Check if all segments are complete and trigger composition
-                        if render_job.segments_completed >= render_job.segments_total:
-                            from backend.models.render_job import RenderJobStatus
-                            render_job.status = RenderJobStatus.COMPOSITING
-                            db.commit()
-
-                            # Trigger composition
-                            segment_ids = [UUID(sid) for sid in render_job.segment_ids]
-                            self.rabbitmq.publish_composition_task(
-                                render_job_id=render_job_id,
-                                project_id=render_job.project_id,
-                                segment_ids=segment_ids
-                            )
-                            logger.info(f"Triggered composition for render job {render_job_id}")
-
-                # Update Redis
-                self.redis.set_segment_status(
-                    segment_id=segment_id,
-                    status=SegmentStatus.COMPLETED.value,
-                    render_job_id=render_job_id
+                    render_job_id=render_job_id,
+                    fingerprint=fingerprint if cacheable else None
                 )
 
-                # Increment render job progress in Redis
-                self.redis.increment_render_job_progress(render_job_id)
-
-                # Publish completion event
-                self.rabbitmq.publish_segment_completed_event(
-                    segment_id=segment_id,
-                    render_job_id=render_job_id
+                # Record completion; only the call that completes the render
+                # job publishes its composition task
+                await asyncio.get_running_loop().run_in_executor(
+                    self._completion_executor,
+                    self._record_completion,
+                    segment_id,
+                    render_job_id,
+                    s3_url,
+                    fingerprint
                 )
 
                 logger.info(f"Segment {segment_id} completed successfully. S3 URL: {s3_url}")
@@ -178,7 +192,7 @@ class AIWorker:
                     # Errors like connection issues and timeouts are retryable
                     is_retryable = error_code in ["COMFYUI_CONNECTION_ERROR", "COMFYUI_TIMEOUT", "COMFYUI_GENERATION_ERROR"]
 
-                self._handle_segment_failure(
+                await self._handle_segment_failure(
                     segment_id=segment_id,
                     render_job_id=render_job_id,
                     error_message=error_msg,
@@ -189,7 +203,7 @@ class AIWorker:
         except AdapterError as e:
             # Adapter-specific error with error code
             logger.error(f"Adapter error during processing: {e.message}", exc_info=True)
-            self._handle_segment_failure(
+            await self._handle_segment_failure(
                 segment_id=segment_id,
                 render_job_id=render_job_id,
                 error_message=e.message,
@@ -199,7 +213,7 @@ class AIWorker:
 
         except TimeoutError as e:
             logger.error(f"Timeout processing segment {segment_id}: {e}")
-            self._handle_segment_failure(
+            await self._handle_segment_failure(
                 segment_id=segment_id,
                 render_job_id=render_job_id,
                 error_message="Video generation timed out. The service may be overloaded.",
@@ -209,7 +223,7 @@ class AIWorker:
 
         except Exception as e:
             logger.error(f"Unexpected error processing segment {segment_id}: {e}", exc_info=True)
-            self._handle_segment_failure(
+            await self._handle_segment_failure(
                 segment_id=segment_id,
                 render_job_id=render_job_id,
                 error_message="An unexpected error occurred during video generation.",
@@ -217,7 +231,7 @@ class AIWorker:
                 is_retryable=False
             )
 
-    def _handle_segment_failure(
+    async def _handle_segment_failure(
         self,
         segment_id: UUID,
         render_job_id: UUID,
@@ -241,6 +255,33 @@ class AIWorker:
         )
 
         # Update database
+        await asyncio.to_thread(self._mark_segment_failed, segment_id, error_message, error_code)
+
+        # Update Redis
+        await self.aredis.set_segment_status(
+            segment_id=segment_id,
+            status=SegmentStatus.FAILED.value,
+            render_job_id=render_job_id
+        )
+        await self.aredis.append_render_job_event(
+            render_job_id,
+            RenderJobEvent.FAILED,
+            segment_id=segment_id,
+            error_code=error_code,
+            error_message=error_message,
+            retryable=is_retryable
+        )
+
+    def _save_external_job_id(self, segment_id: UUID, external_job_id: str):
+        """Store the provider's job ID on a segment (blocking; run off the event loop)."""
+        with get_db_context() as db:
+            segment = db.query(Segment).filter(Segment.id == segment_id).first()
+            if segment:
+                segment.external_job_id = external_job_id
+                db.commit()
+
+    def _mark_segment_failed(self, segment_id: UUID, error_message: str, error_code: str = None):
+        """Mark a segment failed in the database (blocking; run off the event loop)."""
         with get_db_context() as db:
             segment = db.query(Segment).filter(Segment.id == segment_id).first()
             if segment:
@@ -249,85 +290,241 @@ class AIWorker:
                 segment.error_code = error_code
                 db.commit()
 
-        # Update Redis
-        self.redis.set_segment_status(
-            segment_id=segment_id,
-            status=SegmentStatus.FAILED.value,
-            render_job_id=render_job_id
-        )
+    def _get_project_id(self, segment_id: UUID):
+        """Look up a segment's project (blocking; run off the event loop)."""
+        with get_db_context() as db:
+            segment = db.query(Segment).filter(Segment.id == segment_id).first()
+            return segment.project_id if segment else segment_id
 
-    async def _poll_for_completion(self, adapter, external_job_id: str, max_attempts: int = 180):
+    def _record_completion(
+        self,
+        segment_id: UUID,
+        render_job_id: UUID,
+        s3_url: str,
+        fingerprint: str | None
+    ):
         """
-        Poll the AI model for job completion.
+        Record a finished segment through the orchestrator.
+
+        Blocking (database, Redis, publisher confirms); runs on the
+        completion executor, the only thread that uses the publisher.
+        """
+        with get_db_context() as db:
+            self.orchestrator.handle_segment_completion(
+                db,
+                segment_id=segment_id,
+                render_job_id=render_job_id,
+                s3_asset_url=s3_url,
+                fingerprint=fingerprint
+            )
+
+    async def _poll_for_completion(self, adapter, external_job_id: str, timeout: float = 180.0):
+        """
+        Wait for the AI model to finish a job.
+
+        Adapters decide how to wait: polling with backoff by default, or
+        push notifications where the provider supports them (ComfyUI).
 
         Args:
             adapter: Video model adapter
             external_job_id: External job ID
-            max_attempts: Maximum polling attempts (default 180 = 3 minutes at 1s intervals)
+            timeout: Maximum seconds to wait (default 3 minutes)
 
         Returns:
             GenerationResult
         """
-        for attempt in range(max_attempts):
-            result = await adapter.get_result(external_job_id)
-
-            if result.status.value in ["completed", "failed"]:
-                return result
-
-            await asyncio.sleep(1)
-
-        # Timeout
-        raise TimeoutError(f"Generation timed out after {max_attempts} seconds")
+        return await adapter.wait_for_completion(external_job_id, timeout=timeout)
 
-    async def _upload_to_s3(self, video_url: str, segment_id: UUID, render_job_id: UUID) -> str:
+    async def _upload_to_s3(
+        self,
+        video_url: str,
+        segment_id: UUID,
+        render_job_id: UUID,
+        fingerprint: str | None = None
+    ) -> str:
         """
         Download video from AI service and upload to S3.
 
+        The video is streamed: chunks from the provider are uploaded (S3
+        multipart, or written to local storage) as they arrive, so worker
+        memory stays bounded whatever the video size. Outputs already on a
+        filesystem the worker can see (file:// URLs) skip the download.
+
+        Cacheable renders are stored under a content-addressed key so that
+        later re-renders of the segment never overwrite a shared asset.
+
         Args:
             video_url: URL of the generated video
             segment_id: Segment UUID
             render_job_id: Render job UUID
+            fingerprint: Render fingerprint of the segment, if cacheable
 
         Returns:
             S3 URL of the uploaded video
         """
-        import httpx
-        import tempfile
+        if fingerprint:
+            storage_key = self.storage.generate_cache_key(fingerprint)
+        else:
+            # Generate S3 key
+            # Get project_id from database
+            project_id = await asyncio.to_thread(self._get_project_id, segment_id)
+            storage_key = self.storage.generate_segment_key(project_id, segment_id)
+
+        if video_url.startswith("file://"):
+            return await asyncio.get_running_loop().run_in_executor(
+                self._upload_executor,
+                self._store_local_output, video_url[len("file://"):], storage_key, segment_id
+            )
+
+        def upload(stream) -> str:
+            # Upload to storage (S3 or local)
+            return self.storage.upload_stream(stream, storage_key, content_type="video/mp4")
 
         # For mock adapter, the video_url might be fake
         # In production, download the video
         if video_url.startswith("https://mock-cdn"):
-            # Mock case: create a dummy file
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".mp4") as tmp:
-                tmp.write(b"MOCK_VIDEO_DATA")
-                tmp_path = tmp.name
+            # Mock case: store dummy data
+            async def mock_chunks():
+                yield b"MOCK_VIDEO_DATA"
+
+            storage_url, stats = await stream_to_storage(
+                mock_chunks(), upload, executor=self._upload_executor
+            )
         else:
-            # Download from AI service
-            async with httpx.AsyncClient() as client:
-                response = await client.get(video_url)
+            # Stream from AI service
+            async with self._get_http_client().stream("GET", video_url) as response:
                 response.raise_for_status()
 
-                with tempfile.NamedTemporaryFile(delete=False, suffix=".mp4") as tmp:
-                    tmp.write(response.content)
-                    tmp_path = tmp.name
+                # Content-Length counts encoded bytes, so only check it for identity encoding
+                content_length = response.headers.get("Content-Length")
+                expected_bytes = (
+                    int(content_length)
+                    if content_length and "Content-Encoding" not in response.headers
+                    else None
+                )
 
-        try:
-            # Generate S3 key
-            # Get project_id from database
-            with get_db_context() as db:
-                segment = db.query(Segment).filter(Segment.id == segment_id).first()
-                project_id = segment.project_id if segment else segment_id
+                storage_url, stats = await stream_to_storage(
+                    response.aiter_bytes(self.transfer_chunk_bytes),
+                    upload,
+                    expected_bytes=expected_bytes,
+                    max_buffered_chunks=self.transfer_buffered_chunks,
+                    executor=self._upload_executor
+                )
 
-            storage_key = self.storage.generate_segment_key(project_id, segment_id)
+        self.bytes_transferred += stats.bytes
+        self.transfer_seconds += stats.seconds
+        logger.info(
+            f"Stored segment {segment_id}: {stats.bytes / 1024 ** 2:.1f} MB in {stats.seconds:.2f}s "
+            f"({stats.throughput_mbps:.1f} MB/s, sha256 {stats.sha256}); "
+            f"worker total {self.bytes_transferred / 1024 ** 2:.1f} MB "
+            f"at {(self.bytes_transferred / 1024 ** 2) / self.transfer_seconds if self.transfer_seconds else 0.0:.1f} MB/s"
+        )
 
-            # Upload to storage (S3 or local)
-            storage_url = self.storage.upload_file(tmp_path, storage_key, content_type="video/mp4")
+        return storage_url
 
-            return storage_url
+    def _store_local_output(self, file_path: str, storage_key: str, segment_id: UUID) -> str:
+        """
+        Store a generated video that is already on local disk.
 
-        finally:
-            # Clean up temp file
-            Path(tmp_path).unlink(missing_ok=True)
+        Local storage takes the file over without copying its data (see
+        LocalStorageClient.import_file); S3 uploads it straight from disk and
+        leaves the source in place.
+
+        Args:
+            file_path: Path of the generated video
+            storage_key: Storage key to store it under
+            segment_id: Segment UUID (for logging)
+
+        Returns:
+            Storage URL of the video
+        """
+        started = time.perf_counter()
+        size = os.path.getsize(file_path)
+
+        if isinstance(self.storage, LocalStorageClient):
+            storage_url = self.storage.import_file(file_path, storage_key, move=self.move_local_outputs)
+        else:
+            storage_url = self.storage.upload_file(file_path, storage_key, content_type="video/mp4")
+
+        logger.info(
+            f"Stored segment {segment_id} from local file {file_path}: "
+            f"{size / 1024 ** 2:.1f} MB in {time.perf_counter() - started:.3f}s"
+        )
+        return storage_url
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """
+        Get the HTTP client used to download generated videos.
+
+        Created on first use so it binds to the worker's event loop, then
+        reused so downloads share pooled connections.
+        """
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(
+                timeout=httpx.Timeout(60.0, connect=10.0),
+                follow_redirects=True
+            )
+        return self._http_client
+
+    def _start_event_loop(self):
+        """Start the long-lived event loop that runs segment tasks."""
+        if self.loop is not None and self.loop.is_running():
+            return
+
+        self._completion_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ai-worker-completion")
+        self._upload_executor = ThreadPoolExecutor(
+            max_workers=self.max_in_flight, thread_name_prefix="ai-worker-upload"
+        )
+        self.loop = asyncio.new_event_loop()
+        ready = threading.Event()
+
+        def run_loop():
+            asyncio.set_event_loop(self.loop)
+            self.loop.call_soon(ready.set)
+            self.loop.run_forever()
+
+        self._loop_thread = threading.Thread(target=run_loop, name="ai-worker-loop", daemon=True)
+        self._loop_thread.start()
+        ready.wait()
+        logger.info("AI Worker event loop started")
+
+    def _stop_event_loop(self):
+        """Cancel outstanding segment tasks and stop the event loop."""
+        if self.loop is None:
+            return
+
+        async def cancel_pending():
+            await ComfyUIEventListener.close_all()
+            await StatusPoller.close_all()
+            await VideoModelFactory.close_all()
+            await self.aredis.close()
+            if self._http_client is not None:
+                await self._http_client.aclose()
+            tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        try:
+            asyncio.run_coroutine_threadsafe(cancel_pending(), self.loop).result(timeout=30)
+        except Exception as e:
+            logger.warning(f"Error cancelling in-flight tasks: {e}")
+
+        try:
+            self._completion_executor.submit(self.publisher.close).result(timeout=10)
+        except Exception:
+            pass
+        self._completion_executor.shutdown(wait=False)
+        self._completion_executor = None
+        self._upload_executor.shutdown(wait=False)
+        self._upload_executor = None
+
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        if self._loop_thread:
+            self._loop_thread.join(timeout=5)
+        self.loop.close()
+        self.loop = None
+        logger.info("AI Worker event loop stopped")
 
     @retry(
         stop=stop_after_attempt(5),
@@ -337,23 +534,27 @@ class AIWorker:
     )
     def _connect_and_consume(self):
         """Connect to RabbitMQ and start consuming with retry logic."""
-        def callback(message: dict):
-            """Callback for RabbitMQ messages with error handling."""
-            try:
-                asyncio.run(self.process_segment_task(message))
-            except Exception as e:
-                logger.error(f"Error processing message: {e}", exc_info=True)
-                # Message will be requeued if not acknowledged
-                raise
-
         logger.info(f"Connecting to RabbitMQ and starting consumer on queue: {self.queue_name}")
-        self.rabbitmq.consume_messages(self.queue_name, callback)
+        self.rabbitmq.consume_messages_concurrently(
+            self.queue_name,
+            self.process_segment_task,
+            loop=self.loop,
+            max_in_flight=self.max_in_flight
+        )
 
     def run(self):
         """Start the worker and begin consuming messages with resilience."""
         logger.info(f"AI Worker starting. Listening on queue: {self.queue_name}")
 
-        max_retries = 3
+        self._start_event_loop()
+
+        try:
+            self._consume_with_retries(max_retries=3)
+        finally:
+            self._stop_event_loop()
+
+    def _consume_with_retries(self, max_retries: int):
+        """Consume messages, reconnecting on connection errors."""
         retry_count = 0
 
         while retry_count < max_retries:
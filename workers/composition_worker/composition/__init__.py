@@ -0,0 +1,19 @@
+"""
+Composition pipeline building blocks for the Composition Worker.
+"""
+from .segment_cache import SegmentCache
+from .normalize import StreamSignature, SignatureStore, probe, choose_target, normalize
+from .manifest import SegmentSource, ChunkEntry, CompositionManifest, plan_chunks
+
+__all__ = [
+    "SegmentCache",
+    "StreamSignature",
+    "SignatureStore",
+    "probe",
+    "choose_target",
+    "normalize",
+    "SegmentSource",
+    "ChunkEntry",
+    "CompositionManifest",
+    "plan_chunks"
+]
@@ -0,0 +1,154 @@
+"""
+Composition manifests and chunk planning for incremental composition.
+
+A timeline is split into chunks of consecutive segments and each chunk is
+muxed once and cached under a key derived from its segments' content. Chunk
+boundaries are content-defined (chosen from the segment keys themselves
+rather than their positions), so inserting, removing or editing a segment
+only changes the chunk it falls in; every other chunk keeps its key and is
+reused as-is on the next render.
+"""
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import List, Optional
+
+from .normalize import StreamSignature, normalized_key
+
+MANIFEST_VERSION = 1
+
+
+@dataclass
+class SegmentSource:
+    """Where to read one segment video from, and its content key."""
+    segment_id: str
+    content_key: str
+    local_path: Optional[str] = None
+    storage_key: Optional[str] = None
+    signature: Optional[StreamSignature] = None
+    # Set when the segment must be transcoded before it can be concatenated
+    normalize_to: Optional[StreamSignature] = None
+
+    @property
+    def cache_key(self) -> str:
+        """Key of the video that goes into the concat (normalized if needed)."""
+        if self.normalize_to is None:
+            return self.content_key
+        return normalized_key(self.content_key, self.normalize_to)
+
+
+@dataclass
+class ChunkEntry:
+    """One muxed chunk of the final video."""
+    key: str
+    segment_ids: List[str]
+    segment_keys: List[str]
+    start: float = 0.0
+    duration: float = 0.0
+    size: int = 0
+
+
+@dataclass
+class CompositionManifest:
+    """Chunks that make up a project's most recent final video, in order."""
+    project_id: str
+    render_job_id: str
+    chunks: List[ChunkEntry] = field(default_factory=list)
+    final_url: Optional[str] = None
+    version: int = MANIFEST_VERSION
+
+    @property
+    def chunk_keys(self) -> List[str]:
+        """Keys of the chunks, in order."""
+        return [chunk.key for chunk in self.chunks]
+
+    def save(self, path: str):
+        """
+        Write the manifest atomically.
+
+        Args:
+            path: Destination file path
+        """
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(asdict(self), f)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> Optional["CompositionManifest"]:
+        """
+        Read a manifest.
+
+        Args:
+            path: Manifest file path
+
+        Returns:
+            CompositionManifest, or None if missing, unreadable or from another version
+        """
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if data.get("version") != MANIFEST_VERSION:
+            return None
+
+        data["chunks"] = [ChunkEntry(**chunk) for chunk in data.get("chunks", [])]
+        return cls(**data)
+
+
+def chunk_key(segment_keys: List[str]) -> str:
+    """
+    Build the cache key of a chunk from its segments' cache keys.
+
+    Args:
+        segment_keys: Cache keys of the chunk's segments, in order
+
+    Returns:
+        Hex digest identifying the chunk's content
+    """
+    return hashlib.sha256("\n".join(segment_keys).encode()).hexdigest()
+
+
+def plan_chunks(sources: List[SegmentSource], target_size: int) -> List[ChunkEntry]:
+    """
+    Split a timeline into content-defined chunks.
+
+    A chunk ends after a segment whose content key falls on a boundary
+    (roughly one in target_size segments) or once it reaches twice
+    target_size segments.
+
+    Args:
+        sources: Segments in timeline order
+        target_size: Average number of segments per chunk
+
+    Returns:
+        Chunks in order, without timing information
+    """
+    target_size = max(1, target_size)
+    chunks = []
+    members: List[SegmentSource] = []
+
+    for source in sources:
+        members.append(source)
+        boundary = int(source.cache_key[:8], 16) % target_size == 0
+        if boundary or len(members) >= 2 * target_size:
+            chunks.append(_chunk(members))
+            members = []
+
+    if members:
+        chunks.append(_chunk(members))
+    return chunks
+
+
+def _chunk(members: List[SegmentSource]) -> ChunkEntry:
+    keys = [source.cache_key for source in members]
+    return ChunkEntry(
+        key=chunk_key(keys),
+        segment_ids=[source.segment_id for source in members],
+        segment_keys=keys
+    )
@@ -0,0 +1,267 @@
+"""
+Stream probing and normalization so segments can be joined with a stream copy.
+
+``ffmpeg -f concat -c copy`` only produces a valid file when every input
+shares codec, resolution, frame rate, timebase, pixel format and audio
+layout. Segments are probed once (signatures are cached by content key),
+the most common concat-friendly signature becomes the target, and only the
+segments that differ from it are transcoded.
+"""
+import hashlib
+import json
+import logging
+import os
+import subprocess
+import tempfile
+from collections import Counter
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Video codecs that can be stream-copied into an MP4 concat
+CONCAT_VIDEO_CODECS = {"h264", "hevc", "mpeg4", "vp9", "av1"}
+
+# Single-frame image formats some adapters return instead of video
+IMAGE_CODECS = {"png", "mjpeg", "webp", "bmp", "tiff"}
+
+# Encoder used to produce each target codec
+ENCODERS = {
+    "h264": "libx264",
+    "hevc": "libx265",
+    "mpeg4": "mpeg4",
+    "vp9": "libvpx-vp9",
+    "av1": "libaom-av1",
+    "aac": "aac",
+    "mp3": "libmp3lame",
+    "opus": "libopus",
+}
+
+
+@dataclass(frozen=True)
+class StreamSignature:
+    """The stream properties that must match for a stream-copy concat."""
+    codec: str
+    width: int
+    height: int
+    pix_fmt: str
+    frame_rate: str
+    time_base: str
+    audio_codec: Optional[str] = None
+    sample_rate: Optional[int] = None
+    channels: Optional[int] = None
+    still_image: bool = False
+
+    @property
+    def key(self) -> str:
+        """Stable digest of the signature."""
+        return hashlib.sha256(json.dumps(asdict(self), sort_keys=True).encode()).hexdigest()
+
+    @property
+    def concat_ready(self) -> bool:
+        """Whether segments with this signature can be concatenated as-is."""
+        return self.codec in CONCAT_VIDEO_CODECS and not self.still_image
+
+
+# Used when no segment already has a concat-friendly signature
+DEFAULT_TARGET = StreamSignature(
+    codec="h264",
+    width=1280,
+    height=720,
+    pix_fmt="yuv420p",
+    frame_rate="24/1",
+    time_base="1/12288",
+    audio_codec="aac",
+    sample_rate=48000,
+    channels=2
+)
+
+
+def probe(path: str) -> StreamSignature:
+    """
+    Read the stream signature of a media file with ffprobe.
+
+    Args:
+        path: Media file path
+
+    Returns:
+        StreamSignature of the first video and audio streams
+
+    Raises:
+        RuntimeError: If ffprobe fails or the file has no video stream
+    """
+    result = subprocess.run(
+        [
+            "ffprobe",
+            "-v", "error",
+            "-show_streams",
+            "-show_format",
+            "-of", "json",
+            path
+        ],
+        capture_output=True,
+        text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"ffprobe failed for {path}: {result.stderr.strip()}")
+
+    data = json.loads(result.stdout)
+    streams = data.get("streams", [])
+    video = next((s for s in streams if s.get("codec_type") == "video"), None)
+    audio = next((s for s in streams if s.get("codec_type") == "audio"), None)
+    if video is None:
+        raise RuntimeError(f"No video stream in {path}")
+
+    codec = video.get("codec_name", "unknown")
+    frames = video.get("nb_frames")
+    still_image = codec in IMAGE_CODECS and (frames in (None, "1") or "image2" in data.get("format", {}).get("format_name", ""))
+
+    return StreamSignature(
+        codec=codec,
+        width=int(video.get("width", 0)),
+        height=int(video.get("height", 0)),
+        pix_fmt=video.get("pix_fmt", "unknown"),
+        frame_rate=video.get("r_frame_rate", "0/0"),
+        time_base=video.get("time_base", "0/0"),
+        audio_codec=audio.get("codec_name") if audio else None,
+        sample_rate=int(audio["sample_rate"]) if audio and audio.get("sample_rate") else None,
+        channels=int(audio["channels"]) if audio and audio.get("channels") else None,
+        still_image=still_image
+    )
+
+
+def choose_target(signatures: List[StreamSignature]) -> StreamSignature:
+    """
+    Pick the signature every segment is normalized to.
+
+    The most common concat-friendly signature wins, so the largest group of
+    segments needs no transcoding; ties go to the earliest segment.
+
+    Args:
+        signatures: Signatures of the timeline's segments, in order
+
+    Returns:
+        Target signature
+    """
+    candidates = [signature for signature in signatures if signature.concat_ready]
+    if not candidates:
+        return DEFAULT_TARGET
+
+    counts = Counter(candidates)
+    best = max(counts.values())
+    return next(signature for signature in candidates if counts[signature] == best)
+
+
+def normalized_key(content_key: str, target: StreamSignature) -> str:
+    """
+    Build the cache key of a segment transcoded to a target signature.
+
+    Args:
+        content_key: Content key of the original segment
+        target: Target signature
+
+    Returns:
+        Hex digest identifying the normalized variant
+    """
+    return hashlib.sha256(f"{content_key}\0{target.key}".encode()).hexdigest()
+
+
+def normalize(
+    source_path: str,
+    output_path: str,
+    source: StreamSignature,
+    target: StreamSignature,
+    image_duration: float = 5.0,
+    threads: int = 0
+):
+    """
+    Transcode a segment to a target signature.
+
+    Video is scaled to fit and padded to the target size; a missing audio
+    track is filled with silence and an extra one is dropped, so the result
+    concatenates with the target group by stream copy.
+
+    Args:
+        source_path: Input media file
+        output_path: Output MP4 path
+        source: Signature of the input
+        target: Signature to produce
+        image_duration: Seconds to show single-frame images for
+        threads: ffmpeg threads per transcode (0 lets ffmpeg decide)
+
+    Raises:
+        RuntimeError: If ffmpeg fails
+    """
+    cmd = ["ffmpeg", "-v", "error", "-y"]
+    if source.still_image:
+        cmd += ["-loop", "1", "-t", str(image_duration)]
+    cmd += ["-i", source_path]
+
+    add_silence = target.audio_codec is not None and source.audio_codec is None
+    if add_silence:
+        layout = {1: "mono", 2: "stereo"}.get(target.channels, f"{target.channels}c")
+        cmd += ["-f", "lavfi", "-i", f"anullsrc=r={target.sample_rate}:cl={layout}"]
+
+    width, height = target.width, target.height
+    cmd += [
+        "-map", "0:v:0",
+        "-vf", (
+            f"scale={width}:{height}:force_original_aspect_ratio=decrease,"
+            f"pad={width}:{height}:(ow-iw)/2:(oh-ih)/2,setsar=1,"
+            f"fps={target.frame_rate},format={target.pix_fmt}"
+        ),
+        "-c:v", ENCODERS.get(target.codec, "libx264"),
+        "-preset", "veryfast",
+        "-crf", "18",
+        "-video_track_timescale", target.time_base.split("/")[-1],
+    ]
+
+    if target.audio_codec is None:
+        cmd += ["-an"]
+    else:
+        cmd += [
+            "-map", "1:a:0" if add_silence else "0:a:0",
+            "-c:a", ENCODERS.get(target.audio_codec, "aac"),
+            "-ar", str(target.sample_rate),
+            "-ac", str(target.channels),
+        ]
+        if add_silence:
+            cmd += ["-shortest"]
+
+    if threads:
+        cmd += ["-threads", str(threads)]
+    cmd += ["-movflags", "+faststart", "-f", "mp4", output_path]
+
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"Normalizing {source_path} failed: {result.stderr.strip()}")
+
+
+class SignatureStore:
+    """Stream signatures cached on disk by segment content key."""
+
+    def __init__(self, directory: str):
+        """
+        Initialize the store.
+
+        Args:
+            directory: Directory to keep signatures in
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def get(self, content_key: str) -> Optional[StreamSignature]:
+        """Get a cached signature, or None."""
+        try:
+            with open(self.directory / f"{content_key}.json") as f:
+                return StreamSignature(**json.load(f))
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def put(self, content_key: str, signature: StreamSignature):
+        """Cache a signature."""
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(asdict(signature), f)
+        os.replace(tmp_path, self.directory / f"{content_key}.json")
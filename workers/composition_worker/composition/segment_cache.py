@@ -0,0 +1,263 @@
+"""
+Worker-local disk cache for segment videos.
+"""
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class SegmentCache:
+    """
+    Size-bounded, content-keyed LRU cache of segment videos on local disk.
+
+    Entries are keyed by content identity (storage key plus ETag), so a
+    segment that was re-rendered in place is never served stale. Fills are
+    written to a temporary file and renamed into place, so readers never see
+    partial files, and concurrent requests for the same key in this process
+    share one download.
+
+    Jobs never read cache entries directly: ``link_into`` hardlinks an entry
+    into the job's scratch directory, so evicting the entry while a job is
+    still composing only drops the cache's name for the file.
+    """
+
+    # Fill files untouched for this long were left by a crashed worker
+    STALE_FILL_SECONDS = 3600
+
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: Optional[int] = None):
+        """
+        Initialize the cache, indexing any entries already on disk.
+
+        Args:
+            cache_dir: Cache root directory (default from COMPOSITION_CACHE_DIR)
+            max_bytes: Maximum total size of cached entries (default from COMPOSITION_CACHE_MAX_GB)
+        """
+        self.root = Path(
+            cache_dir
+            or os.getenv("COMPOSITION_CACHE_DIR")
+            or os.path.join(tempfile.gettempdir(), "video-foundry", "composition-cache")
+        )
+        self.max_bytes = max_bytes if max_bytes is not None else int(
+            float(os.getenv("COMPOSITION_CACHE_MAX_GB", "10")) * 1024 ** 3
+        )
+
+        self.entries_dir = self.root / "segments"
+        self.scratch_dir = self.root / "jobs"
+        self.entries_dir.mkdir(parents=True, exist_ok=True)
+        self.scratch_dir.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        # Key -> [fill lock, number of threads holding or waiting for it]
+        self._key_locks: Dict[str, List] = {}
+        # Entry name -> size in bytes, least recently used first
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        self._size = 0
+
+        self.hits = 0
+        self.misses = 0
+
+        self._load_index()
+
+    @staticmethod
+    def content_key(storage_key: str, etag: str) -> str:
+        """
+        Build the cache key for one version of a stored object.
+
+        Args:
+            storage_key: Object key in storage
+            etag: Object ETag (changes whenever the object is rewritten)
+
+        Returns:
+            Hex digest identifying the object's content
+        """
+        return hashlib.sha256(f"{storage_key}\0{etag}".encode()).hexdigest()
+
+    def fetch_into(self, key: str, fetch: Callable[[str], None], dest_path: str) -> bool:
+        """
+        Place a segment at dest_path, from the cache or by fetching it.
+
+        Args:
+            key: Content key (see content_key)
+            fetch: Called with a temporary path to download the content to on a miss
+            dest_path: Path in a job scratch directory (see create_scratch_dir)
+
+        Returns:
+            True if the segment was served from the cache
+        """
+        for _ in range(3):
+            path, hit = self._get(key, fetch)
+            try:
+                self.link_into(path, dest_path)
+                return hit
+            except FileNotFoundError:
+                # Evicted by another job between the fill and the link
+                continue
+        raise RuntimeError(f"Segment cache is too small to hold entry {key}")
+
+    def _get(self, key: str, fetch: Callable[[str], None]) -> Tuple[str, bool]:
+        """Get the path of a cache entry, fetching it on a miss."""
+        name = f"{key}.mp4"
+        path = self.entries_dir / name
+
+        with self._key_lock(key):
+            if self._touch(name, path):
+                return str(path), True
+
+            fd, tmp_path = tempfile.mkstemp(dir=self.entries_dir, prefix=".fill-", suffix=".mp4")
+            os.close(fd)
+            try:
+                fetch(tmp_path)
+                os.replace(tmp_path, path)
+            except BaseException:
+                Path(tmp_path).unlink(missing_ok=True)
+                raise
+
+            size = path.stat().st_size
+            with self._lock:
+                self.misses += 1
+                self._size += size - self._entries.pop(name, 0)
+                self._entries[name] = size
+                self._evict()
+
+        return str(path), False
+
+    def create_scratch_dir(self, prefix: str = "") -> str:
+        """
+        Create a job scratch directory on the cache's filesystem.
+
+        Args:
+            prefix: Directory name prefix (e.g. the render job ID)
+
+        Returns:
+            Path of the new directory; remove it with remove_scratch_dir
+        """
+        return tempfile.mkdtemp(dir=self.scratch_dir, prefix=f"{prefix}-" if prefix else None)
+
+    @staticmethod
+    def remove_scratch_dir(scratch_dir: str):
+        """Delete a job scratch directory and everything in it."""
+        shutil.rmtree(scratch_dir, ignore_errors=True)
+
+    @staticmethod
+    def link_into(entry_path: str, dest_path: str) -> str:
+        """
+        Give a job its own name for a cache entry.
+
+        Hardlinks when possible and falls back to copying (e.g. when the
+        scratch directory is on another filesystem).
+
+        Args:
+            entry_path: Path of the cache entry
+            dest_path: Path in the job's scratch directory
+
+        Returns:
+            dest_path
+        """
+        # A retried job step may find its previous link in place
+        Path(dest_path).unlink(missing_ok=True)
+        try:
+            os.link(entry_path, dest_path)
+        except OSError:
+            shutil.copyfile(entry_path, dest_path)
+        return dest_path
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get cache size and hit/miss counters.
+
+        Returns:
+            Dictionary with entries, size_bytes, max_bytes, hits and misses
+        """
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "size_bytes": self._size,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses
+            }
+
+    @contextmanager
+    def _key_lock(self, key: str) -> Iterator[None]:
+        """
+        Hold the lock serializing fills of one key.
+
+        Locks are reference-counted and dropped once no thread holds or
+        waits for them, so there is never more than one lock per key.
+        """
+        with self._lock:
+            ref = self._key_locks.setdefault(key, [threading.Lock(), 0])
+            ref[1] += 1
+        try:
+            with ref[0]:
+                yield
+        finally:
+            with self._lock:
+                ref[1] -= 1
+                if ref[1] == 0:
+                    del self._key_locks[key]
+
+    def _touch(self, name: str, path: Path) -> bool:
+        """Mark an entry as recently used; False if it is not cached."""
+        try:
+            # mtime orders entries across restarts and between workers sharing the directory
+            os.utime(path)
+            size = path.stat().st_size
+        except FileNotFoundError:
+            with self._lock:
+                self._size -= self._entries.pop(name, 0)
+            return False
+
+        with self._lock:
+            self.hits += 1
+            if name not in self._entries:
+                self._size += size
+            self._entries[name] = size
+            self._entries.move_to_end(name)
+        return True
+
+    def _evict(self):
+        """Drop least recently used entries until under max_bytes (lock held)."""
+        while self._size > self.max_bytes and len(self._entries) > 1:
+            name, size = self._entries.popitem(last=False)
+            self._size -= size
+            (self.entries_dir / name).unlink(missing_ok=True)
+            logger.debug(f"Evicted {name} from segment cache ({size} bytes)")
+
+    def _load_index(self):
+        """Index entries left by earlier runs, oldest first, and drop stale fills."""
+        found = []
+        stale_before = time.time() - self.STALE_FILL_SECONDS
+        for path in self.entries_dir.iterdir():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            if path.name.startswith(".fill-"):
+                # Fresh fills may belong to another worker sharing the directory
+                if stat.st_mtime < stale_before:
+                    path.unlink(missing_ok=True)
+                continue
+            found.append((stat.st_mtime, path.name, stat.st_size))
+
+        for _, name, size in sorted(found):
+            self._entries[name] = size
+            self._size += size
+
+        with self._lock:
+            self._evict()
+
+        logger.info(
+            f"Segment cache at {self.root}: {len(self._entries)} entries, "
+            f"{self._size / 1024 ** 2:.0f} MiB of {self.max_bytes / 1024 ** 2:.0f} MiB"
+        )
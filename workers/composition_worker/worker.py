@@ -8,10 +8,11 @@ import os
 import sys
 import subprocess
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from uuid import UUID
 from pathlib import Path
 import time
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+from tenacity import retry, Retrying, stop_after_attempt, wait_exponential, retry_if_exception_type
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
@@ -20,6 +21,18 @@ from backend.config import get_db_context
 from backend.models import RenderJob, Segment
 from backend.models.render_job import RenderJobStatus
 from backend.services import RabbitMQClient, RedisClient, S3Client, LocalStorageClient
+from backend.services.redis_client import RenderJobEvent
+from composition import (
+    SegmentCache,
+    SegmentSource,
+    ChunkEntry,
+    CompositionManifest,
+    SignatureStore,
+    plan_chunks,
+    probe,
+    choose_target,
+    normalize,
+)
 import pika.exceptions
 
 logging.basicConfig(
@@ -52,7 +65,47 @@ class CompositionWorker:
 
         self.queue_name = os.getenv("COMPOSITION_QUEUE_NAME", "video_composition")
 
-        logger.info("Composition Worker initialized")
+        # Segment downloads are network-bound, so a render job's segments are
+        # fetched concurrently by a bounded pool shared across tasks
+        self.download_concurrency = max(1, int(os.getenv("COMPOSITION_DOWNLOAD_CONCURRENCY", "8")))
+        self.download_pool = ThreadPoolExecutor(
+            max_workers=self.download_concurrency,
+            thread_name_prefix="segment-download"
+        )
+
+        # Downloaded segments are kept across jobs, so re-renders only fetch
+        # the segments that changed
+        self.segment_cache = SegmentCache()
+
+        # Average segments per muxed chunk; chunks are reused across renders
+        # until one of their segments changes
+        self.chunk_target = max(1, int(os.getenv("COMPOSITION_CHUNK_TARGET", "8")))
+
+        # Chunks are muxed in parallel and retried independently
+        self.chunk_concurrency = max(1, int(os.getenv("COMPOSITION_CHUNK_CONCURRENCY", "4")))
+        self.chunk_attempts = max(1, int(os.getenv("COMPOSITION_CHUNK_ATTEMPTS", "3")))
+        self.chunk_pool = ThreadPoolExecutor(
+            max_workers=self.chunk_concurrency,
+            thread_name_prefix="chunk-compose"
+        )
+
+        # Segments whose streams don't match the timeline's target signature are
+        # transcoded in parallel ffmpeg processes, splitting the CPUs between them
+        cpus = os.cpu_count() or 1
+        self.normalize_concurrency = max(1, int(os.getenv("COMPOSITION_NORMALIZE_CONCURRENCY") or cpus))
+        self.normalize_threads = max(1, cpus // self.normalize_concurrency)
+        self.normalize_pool = ThreadPoolExecutor(
+            max_workers=self.normalize_concurrency,
+            thread_name_prefix="segment-normalize"
+        )
+        self.image_duration = float(os.getenv("COMPOSITION_IMAGE_DURATION", "5"))
+        self.signatures = SignatureStore(str(self.segment_cache.root / "signatures"))
+
+        # Stream the final concat into storage as fragmented MP4 instead of
+        # writing it to a temp file and uploading afterwards
+        self.streaming = os.getenv("COMPOSITION_STREAMING", "true").lower() in ("true", "1", "yes")
+
+        logger.info(f"Composition Worker initialized (download concurrency: {self.download_concurrency})")
 
     def process_composition_task(self, message: dict):
         """
@@ -67,6 +120,7 @@ class CompositionWorker:
 
         logger.info(f"Processing composition for render job {render_job_id}")
 
+        scratch_dir = self.segment_cache.create_scratch_dir(str(render_job_id))
         try:
             # Update status
             with get_db_context() as db:
@@ -82,19 +136,50 @@ class CompositionWorker:
                 status=RenderJobStatus.COMPOSITING.value
             )
 
-            # Download all segment videos from S3
-            segment_files = self._download_segments(segment_ids)
+            # Identify the content of every segment without downloading it
+            sources = self._resolve_segments(segment_ids)
 
-            if not segment_files:
+            if not sources:
                 raise Exception("No segment files to compose")
 
-            # Compose video using FFMPEG
-            logger.info(f"Composing {len(segment_files)} segments")
-            final_video_path = self._compose_video(segment_files)
+            # Decide which segments must be transcoded for a stream-copy concat
+            self._assign_targets(sources, scratch_dir)
+
+            chunks = plan_chunks(sources, self.chunk_target)
+            manifest_path = self._manifest_path(project_id)
+            previous = CompositionManifest.load(manifest_path)
+
+            if previous and previous.final_url and previous.chunk_keys == [chunk.key for chunk in chunks]:
+                # Nothing changed since the last composition; reuse its output
+                logger.info(f"Timeline unchanged since render job {previous.render_job_id}; reusing its final video")
+                for chunk, previous_chunk in zip(chunks, previous.chunks):
+                    chunk.start = previous_chunk.start
+                    chunk.duration = previous_chunk.duration
+                    chunk.size = previous_chunk.size
+                storage_url = previous.final_url
+            else:
+                # Mux changed chunks and reuse cached ones
+                chunk_files = self._build_chunks(chunks, sources, scratch_dir, previous)
+
+                # Compose video using FFMPEG and upload it to storage (S3 or local)
+                logger.info(f"Composing {len(sources)} segments from {len(chunk_files)} chunks")
+                storage_key = self.storage.generate_composition_key(project_id, render_job_id)
+
+                if self.streaming:
+                    storage_url = self._compose_streaming(chunk_files, storage_key)
+                else:
+                    final_video_path = self._compose_video(chunk_files)
+                    storage_url = self.storage.upload_file(final_video_path, storage_key, content_type="video/mp4")
+
+                    # Cleanup
+                    self._cleanup_files([final_video_path])
 
-            # Upload final video to storage (S3 or local)
-            storage_key = self.storage.generate_composition_key(project_id, render_job_id)
-            storage_url = self.storage.upload_file(final_video_path, storage_key, content_type="video/mp4")
+            CompositionManifest(
+                project_id=str(project_id),
+                render_job_id=str(render_job_id),
+                chunks=chunks,
+                final_url=storage_url
+            ).save(manifest_path)
 
             # Update database
             with get_db_context() as db:
@@ -111,11 +196,13 @@ class CompositionWorker:
                 segments_completed=len(segment_ids),
                 status=RenderJobStatus.COMPLETED.value
             )
+            self.redis.append_render_job_event(
+                render_job_id,
+                RenderJobEvent.DONE,
+                s3_final_url=storage_url
+            )
 
-            logger.info(f"Render job {render_job_id} completed. Final video: {s3_url}")
-
-            # Cleanup
-            self._cleanup_files(segment_files + [final_video_path])
+            logger.info(f"Render job {render_job_id} completed. Final video: {storage_url}")
 
         except Exception as e:
             logger.error(f"Error composing render job {render_job_id}: {e}", exc_info=True)
@@ -134,64 +221,363 @@ class CompositionWorker:
                 segments_completed=len(segment_ids),
                 status=RenderJobStatus.FAILED.value
             )
+            self.redis.append_render_job_event(
+                render_job_id,
+                RenderJobEvent.FAILED,
+                error_message=str(e)
+            )
 
-    def _download_segments(self, segment_ids: list[UUID]) -> list[str]:
+        finally:
+            # Removes this job's links to cached segments
+            self.segment_cache.remove_scratch_dir(scratch_dir)
+
+    def _manifest_path(self, project_id: UUID) -> str:
+        """Path of a project's composition manifest."""
+        return str(self.segment_cache.root / "manifests" / f"{project_id}.json")
+
+    def _resolve_segments(self, segment_ids: list[UUID]) -> list[SegmentSource]:
         """
-        Download segment videos from S3.
+        Locate segment videos and compute their content keys.
+
+        Segment rows are loaded with one query. S3 objects are identified by
+        key and ETag (HEAD requests on the download pool), local files by
+        path, size and modification time. Segments that are missing are
+        skipped, as before.
 
         Args:
             segment_ids: List of segment UUIDs in order
 
         Returns:
-            List of local file paths
+            Segment sources in order
         """
-        segment_files = []
-
         with get_db_context() as db:
-            for segment_id in segment_ids:
-                segment = db.query(Segment).filter(Segment.id == segment_id).first()
-
-                if not segment or not segment.s3_asset_url:
-                    logger.warning(f"Segment {segment_id} not found or missing asset URL")
+            rows = db.query(Segment.id, Segment.s3_asset_url).filter(Segment.id.in_(segment_ids)).all()
+        asset_urls = {row.id: row.s3_asset_url for row in rows}
+
+        planned = []
+        for segment_id in segment_ids:
+            asset_url = asset_urls.get(segment_id)
+            if not asset_url:
+                logger.warning(f"Segment {segment_id} not found or missing asset URL")
+                continue
+
+            # Handle local file URLs
+            if asset_url.startswith("file://"):
+                # Local storage - use the file in place
+                local_path = asset_url.replace("file://", "")
+                try:
+                    stat = os.stat(local_path)
+                except FileNotFoundError:
+                    logger.error(f"Local file not found: {local_path}")
                     continue
+                planned.append(SegmentSource(
+                    segment_id=str(segment_id),
+                    content_key=SegmentCache.content_key(local_path, f"{stat.st_size}-{stat.st_mtime_ns}"),
+                    local_path=local_path
+                ))
+                continue
+
+            # Handle S3 URLs
+            # URL format: https://bucket.s3.region.amazonaws.com/key
+            if hasattr(self.storage, 'bucket_name'):
+                storage_key = asset_url.split(f"{self.storage.bucket_name}.s3.")[-1].split("/", 1)[-1] if "/" in asset_url else None
+            else:
+                logger.error(f"Cannot parse storage key from URL: {asset_url}")
+                continue
+
+            if not storage_key:
+                logger.error(f"Could not extract storage key from URL: {asset_url}")
+                continue
+
+            planned.append((segment_id, storage_key, self.download_pool.submit(self.storage.get_etag, storage_key)))
+
+        sources = []
+        for entry in planned:
+            if isinstance(entry, SegmentSource):
+                sources.append(entry)
+                continue
+            segment_id, storage_key, future = entry
+            try:
+                etag = future.result()
+            except Exception as e:
+                logger.error(f"Failed to look up segment {segment_id}: {e}")
+                continue
+            sources.append(SegmentSource(
+                segment_id=str(segment_id),
+                content_key=SegmentCache.content_key(storage_key, etag),
+                storage_key=storage_key
+            ))
+
+        return sources
+
+    def _build_chunks(
+        self,
+        chunks: list[ChunkEntry],
+        sources: list[SegmentSource],
+        scratch_dir: str,
+        previous: CompositionManifest | None
+    ) -> list[str]:
+        """
+        Produce every chunk file, muxing only chunks that are not cached.
 
-                asset_url = segment.s3_asset_url
-
-                # Handle local file URLs
-                if asset_url.startswith("file://"):
-                    # Local storage - extract path and use directly or copy to temp
-                    local_path = asset_url.replace("file://", "")
-                    if Path(local_path).exists():
-                        segment_files.append(local_path)
-                        logger.info(f"Using local segment file: {local_path}")
-                    else:
-                        logger.error(f"Local file not found: {local_path}")
-                    continue
+        Chunks are muxed in parallel on the chunk pool and each is retried on
+        its own, so one bad chunk doesn't restart the whole composition.
+        Fills in each chunk's start, duration and size.
 
-                # Handle S3 URLs
-                # URL format: https://bucket.s3.region.amazonaws.com/key
-                if hasattr(self.storage, 'bucket_name'):
-                    storage_key = asset_url.split(f"{self.storage.bucket_name}.s3.")[-1].split("/", 1)[-1] if "/" in asset_url else None
-                else:
-                    logger.error(f"Cannot parse storage key from URL: {asset_url}")
-                    continue
+        Args:
+            chunks: Planned chunks in order
+            sources: Segment sources in order
+            scratch_dir: Job scratch directory from the segment cache
+            previous: Manifest of the project's previous composition, if any
 
-                if not storage_key:
-                    logger.error(f"Could not extract storage key from URL: {asset_url}")
-                    continue
+        Returns:
+            Chunk file paths in order
+        """
+        by_key = {source.cache_key: source for source in sources}
+        previous_keys = set(previous.chunk_keys) if previous else set()
+
+        started = time.perf_counter()
+        futures = [
+            self.chunk_pool.submit(
+                self._prepare_chunk,
+                chunk,
+                index,
+                [by_key[key] for key in chunk.segment_keys],
+                scratch_dir
+            )
+            for index, chunk in enumerate(chunks)
+        ]
+
+        chunk_files = []
+        reused = 0
+        position = 0.0
+        for chunk, future in zip(chunks, futures):
+            dest_path, hit = future.result()
+            reused += hit
+
+            chunk.start = position
+            position += chunk.duration
+            chunk_files.append(dest_path)
+
+        logger.info(
+            f"Prepared {len(chunks)} chunks in {time.perf_counter() - started:.2f}s "
+            f"(concurrency {self.chunk_concurrency}, {reused} reused from cache, "
+            f"{len(previous_keys.intersection(chunk.key for chunk in chunks))} shared with the previous composition)"
+        )
+        return chunk_files
+
+    def _prepare_chunk(
+        self,
+        chunk: ChunkEntry,
+        index: int,
+        members: list[SegmentSource],
+        scratch_dir: str
+    ) -> tuple[str, bool]:
+        """
+        Place one chunk in the job's scratch directory, muxing it on a cache miss.
 
-                # Download to temp file
-                tmp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".mp4")
-                tmp_file.close()
+        Fills in the chunk's duration and size.
 
-                try:
-                    self.storage.download_file(storage_key, tmp_file.name)
-                    segment_files.append(tmp_file.name)
-                    logger.info(f"Downloaded segment {segment_id} to {tmp_file.name}")
-                except Exception as e:
-                    logger.error(f"Failed to download segment {segment_id}: {e}")
+        Args:
+            chunk: Planned chunk
+            index: Chunk index in the timeline
+            members: Segment sources of the chunk, in order
+            scratch_dir: Job scratch directory from the segment cache
+
+        Returns:
+            Tuple of the chunk file path and whether it was a cache hit
+        """
+        dest_path = os.path.join(scratch_dir, f"chunk-{index:05d}.mp4")
+
+        for attempt in Retrying(
+            stop=stop_after_attempt(self.chunk_attempts),
+            wait=wait_exponential(multiplier=1, min=1, max=10),
+            before_sleep=lambda state: logger.warning(
+                f"Chunk {index} failed (attempt {state.attempt_number}/{self.chunk_attempts}): "
+                f"{state.outcome.exception()}"
+            ),
+            reraise=True
+        ):
+            with attempt:
+                hit = self.segment_cache.fetch_into(
+                    f"chunk-{chunk.key}",
+                    lambda tmp_path: self._mux_chunk(members, scratch_dir, index, tmp_path),
+                    dest_path
+                )
+
+        chunk.duration = self._probe_duration(dest_path)
+        chunk.size = os.path.getsize(dest_path)
+        return dest_path, hit
+
+    def _mux_chunk(self, members: list[SegmentSource], scratch_dir: str, index: int, output_path: str):
+        """
+        Fetch a chunk's segments and concatenate them into one file.
+
+        Args:
+            members: Segment sources of the chunk, in order
+            scratch_dir: Job scratch directory from the segment cache
+            index: Chunk index (names the segment files)
+            output_path: Path to write the chunk to
+        """
+        files = [None] * len(members)
+        futures = {}
+        for position, source in enumerate(members):
+            if source.local_path and source.normalize_to is None:
+                files[position] = source.local_path
+            else:
+                dest_path = os.path.join(scratch_dir, f"{index:05d}-{position:03d}-{source.segment_id}.mp4")
+                futures[position] = (dest_path, self.download_pool.submit(self._prepare_segment, source, dest_path))
+
+        timings = []
+        hits = 0
+        for position, (dest_path, future) in futures.items():
+            elapsed, hit = future.result()
+            timings.append(elapsed)
+            hits += hit
+            files[position] = dest_path
+
+        if timings:
+            logger.info(
+                f"Fetched {len(timings)} segments for chunk {index} "
+                f"({hits} from cache, mean {sum(timings) / len(timings):.2f}s, max {max(timings):.2f}s per segment)"
+            )
+
+        self._concat(files, output_path)
+
+    def _assign_targets(self, sources: list[SegmentSource], scratch_dir: str):
+        """
+        Probe segment streams and mark the ones that need normalizing.
+
+        Signatures are cached by content key, so only new segments are
+        probed (and downloaded for it, which also fills the segment cache).
+
+        Args:
+            sources: Segment sources in order; signature and normalize_to are set
+            scratch_dir: Job scratch directory from the segment cache
+        """
+        def probe_source(source: SegmentSource):
+            signature = self.signatures.get(source.content_key)
+            if signature is None:
+                path = source.local_path
+                if path is None:
+                    path = os.path.join(scratch_dir, f"probe-{source.segment_id}.mp4")
+                    self._download_segment(source, path)
+                signature = probe(path)
+                self.signatures.put(source.content_key, signature)
+            return signature
+
+        futures = [self.download_pool.submit(probe_source, source) for source in sources]
+        for source, future in zip(sources, futures):
+            source.signature = future.result()
+
+        target = choose_target([source.signature for source in sources])
+        mismatched = 0
+        for source in sources:
+            if source.signature != target:
+                source.normalize_to = target
+                mismatched += 1
+
+        groups = len({source.signature for source in sources})
+        logger.info(
+            f"Found {groups} stream signature(s); target {target.codec} {target.width}x{target.height} "
+            f"{target.pix_fmt} @ {target.frame_rate}, normalizing {mismatched} of {len(sources)} segments"
+        )
+
+    def _prepare_segment(self, source: SegmentSource, dest_path: str) -> tuple[float, bool]:
+        """
+        Place a segment, normalized if needed, in the job's scratch directory.
+
+        Normalized variants are cached like downloads, keyed by the source
+        content and the target signature.
+
+        Args:
+            source: Segment source
+            dest_path: Path to place the video at
 
-        return segment_files
+        Returns:
+            Tuple of the time taken in seconds and whether it was a cache hit
+        """
+        if source.normalize_to is None:
+            return self._download_segment(source, dest_path)
+
+        started = time.perf_counter()
+
+        def transcode(tmp_path: str):
+            source_path = source.local_path
+            if source_path is None:
+                source_path = f"{dest_path}.source.mp4"
+                self._download_segment(source, source_path)
+            self.normalize_pool.submit(
+                normalize,
+                source_path,
+                tmp_path,
+                source.signature,
+                source.normalize_to,
+                self.image_duration,
+                self.normalize_threads
+            ).result()
+
+        hit = self.segment_cache.fetch_into(source.cache_key, transcode, dest_path)
+        elapsed = time.perf_counter() - started
+
+        logger.info(
+            f"{'Cached' if hit else 'Normalized'} segment {source.segment_id} "
+            f"({source.signature.codec} {source.signature.width}x{source.signature.height}) "
+            f"in {elapsed * 1000:.0f}ms"
+        )
+        return elapsed, hit
+
+    def _download_segment(self, source: SegmentSource, dest_path: str) -> tuple[float, bool]:
+        """
+        Fetch one segment video into the job's scratch directory.
+
+        Args:
+            source: Segment source with a storage key
+            dest_path: Path to place the video at
+
+        Returns:
+            Tuple of the fetch time in seconds and whether it was a cache hit
+        """
+        started = time.perf_counter()
+        hit = self.segment_cache.fetch_into(
+            source.content_key,
+            lambda tmp_path: self.storage.download_file(source.storage_key, tmp_path),
+            dest_path
+        )
+        elapsed = time.perf_counter() - started
+
+        logger.info(
+            f"{'Cached' if hit else 'Downloaded'} segment {source.segment_id} "
+            f"to {dest_path} in {elapsed * 1000:.0f}ms"
+        )
+        return elapsed, hit
+
+    def _probe_duration(self, file_path: str) -> float:
+        """
+        Get the duration of a video file with ffprobe.
+
+        Args:
+            file_path: Video file path
+
+        Returns:
+            Duration in seconds (0.0 if it cannot be determined)
+        """
+        result = subprocess.run(
+            [
+                "ffprobe",
+                "-v", "error",
+                "-show_entries", "format=duration",
+                "-of", "default=noprint_wrappers=1:nokey=1",
+                file_path
+            ],
+            capture_output=True,
+            text=True
+        )
+        try:
+            return float(result.stdout.strip())
+        except ValueError:
+            logger.warning(f"Could not probe duration of {file_path}: {result.stderr.strip()}")
+            return 0.0
 
     def _compose_video(self, segment_files: list[str]) -> str:
         """
@@ -203,17 +589,95 @@ class CompositionWorker:
         Returns:
             Path to the final composed video
         """
-        # Create a concat file for FFMPEG
+        # Output file
+        output_file = tempfile.NamedTemporaryFile(delete=False, suffix=".mp4")
+        output_file.close()
+
+        self._concat(segment_files, output_file.name)
+        return output_file.name
+
+    def _compose_streaming(self, segment_files: list[str], storage_key: str) -> str:
+        """
+        Concatenate videos into storage without a local output file.
+
+        ffmpeg writes fragmented MP4 (which needs no seekable output) to a
+        pipe, and storage uploads from the pipe while ffmpeg is still
+        running: S3 as a multipart upload, local storage as a direct write.
+
+        Args:
+            segment_files: List of video file paths in order
+            storage_key: Storage key of the final video
+
+        Returns:
+            Storage URL of the final video
+        """
+        concat_path = self._write_concat_list(segment_files)
+        cmd = [
+            "ffmpeg",
+            "-v", "error",
+            "-f", "concat",
+            "-safe", "0",
+            "-i", concat_path,
+            "-c", "copy",
+            "-movflags", "+frag_keyframe+empty_moov+default_base_moof",
+            "-f", "mp4",
+            "pipe:1"
+        ]
+
+        logger.info(f"Running FFMPEG: {' '.join(cmd)}")
+        started = time.perf_counter()
+
+        with tempfile.TemporaryFile() as stderr_file:
+            process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr_file)
+            try:
+                storage_url = self.storage.upload_stream(process.stdout, storage_key, content_type="video/mp4")
+            except BaseException:
+                process.kill()
+                raise
+            finally:
+                process.stdout.close()
+                returncode = process.wait()
+                Path(concat_path).unlink(missing_ok=True)
+
+            if returncode != 0:
+                stderr_file.seek(0)
+                stderr = stderr_file.read().decode(errors="replace")
+                logger.error(f"FFMPEG error: {stderr}")
+                # Don't leave a truncated video behind
+                self.storage.delete_file(storage_key)
+                raise Exception(f"FFMPEG failed: {stderr}")
+
+        logger.info(f"Streamed final video to {storage_url} in {time.perf_counter() - started:.2f}s")
+        return storage_url
+
+    def _write_concat_list(self, segment_files: list[str]) -> str:
+        """
+        Write an FFMPEG concat demuxer list.
+
+        Args:
+            segment_files: List of video file paths in order
+
+        Returns:
+            Path of the list file; the caller deletes it
+        """
         concat_file = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix=".txt")
 
         for file_path in segment_files:
             concat_file.write(f"file '{file_path}'\n")
 
         concat_file.close()
+        return concat_file.name
 
-        # Output file
-        output_file = tempfile.NamedTemporaryFile(delete=False, suffix=".mp4")
-        output_file.close()
+    def _concat(self, segment_files: list[str], output_path: str):
+        """
+        Concatenate videos with a stream copy using FFMPEG.
+
+        Args:
+            segment_files: List of video file paths in order
+            output_path: Path to write the result to
+        """
+        # Create a concat file for FFMPEG
+        concat_path = self._write_concat_list(segment_files)
 
         try:
             # Run FFMPEG to concatenate videos
@@ -221,10 +685,11 @@ class CompositionWorker:
                 "ffmpeg",
                 "-f", "concat",
                 "-safe", "0",
-                "-i", concat_file.name,
+                "-i", concat_path,
                 "-c", "copy",
+                "-f", "mp4",
                 "-y",  # Overwrite output file
-                output_file.name
+                output_path
             ]
 
             logger.info(f"Running FFMPEG: {' '.join(cmd)}")
@@ -235,9 +700,7 @@ class CompositionWorker:
                 check=True
             )
 
-            logger.info(f"FFMPEG completed successfully. Output: {output_file.name}")
-
-            return output_file.name
+            logger.info(f"FFMPEG completed successfully. Output: {output_path}")
 
         except subprocess.CalledProcessError as e:
             logger.error(f"FFMPEG error: {e.stderr}")
@@ -245,7 +708,7 @@ class CompositionWorker:
 
         finally:
             # Clean up concat file
-            Path(concat_file.name).unlink(missing_ok=True)
+            Path(concat_path).unlink(missing_ok=True)
 
     def _cleanup_files(self, file_paths: list[str]):
         """